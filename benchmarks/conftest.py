@@ -0,0 +1,41 @@
+import pytest
+from utils.action_benchmark import ActionBenchmark
+from config.config import config
+
+# Baselines as stored before this run; the summary compares against them even when the run saves new ones
+stored_baselines = {}
+
+def pytest_sessionstart(session):
+    global stored_baselines
+    stored_baselines = ActionBenchmark.load_baselines()
+
+@pytest.fixture(scope="session")
+def benchmark_baselines():
+    """Stored p95/p99 per benchmark; empty when this run saves new baselines (POS_BENCHMARK_SAVE)"""
+    return {} if config.BENCHMARK_SAVE else stored_baselines
+
+def pytest_sessionfinish(session):
+    if not ActionBenchmark.results:
+        return
+    ActionBenchmark.write()
+    if config.BENCHMARK_SAVE:
+        ActionBenchmark.save_baselines()
+
+def pytest_terminal_summary(terminalreporter):
+    if not ActionBenchmark.results:
+        return
+    terminalreporter.section("action latency")
+    for name, result in ActionBenchmark.results.items():
+        summary = result["summary"]
+        if not summary["count"]:
+            terminalreporter.write_line(f"{name:<24} no DOM update measured ({result['missed']} missed)")
+            continue
+        baseline = stored_baselines.get(name)
+        terminalreporter.write_line(
+            f"{name:<24} mean {summary['mean_ms']:>7.1f}ms  p95 {summary['p95_ms']:>7.1f}ms  "
+            f"p99 {summary['p99_ms']:>7.1f}ms  n={summary['count']}"
+            + (f"  missed={result['missed']}" if result["missed"] else "")
+            + (f"  (baseline p95 {baseline['p95_ms']:.1f}ms)" if baseline else "")
+        )
+    if config.BENCHMARK_SAVE:
+        terminalreporter.write_line(f"Baselines saved to {config.BENCHMARK_BASELINES}")
@@ -0,0 +1,80 @@
+import itertools
+import pytest
+from selenium.webdriver.common.keys import Keys
+from pages.dashboard_page import DashboardPage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from utils.action_benchmark import ActionBenchmark
+from utils.data_reader import DataReader
+from utils.state_seeder import StateSeeder
+
+
+class TestActionLatency:
+    """
+    Input-to-DOM-update latency of the dashboard and checkout actions.
+
+    Each benchmark alternates between two states that render differently,
+    so every measured action changes the DOM.
+    """
+
+    PRODUCT = "Wireless Headphones"
+    # Appended to the search term so the grid goes from one match to none and back
+    NO_MATCH_KEY = "#"
+
+    @pytest.fixture(autouse=True)
+    def dashboard(self, logged_in, benchmark_baselines):
+        self.driver = logged_in
+        self.dashboard_page = DashboardPage(self.driver)
+        self.cart_page = CartPage(self.driver)
+        self.checkout_page = CheckoutPage(self.driver)
+        self.baselines = benchmark_baselines
+        assert self.dashboard_page.is_dashboard_loaded(), "Dashboard should be loaded before benchmarking"
+
+    def _benchmark(self, name, sample):
+        summary = ActionBenchmark.run(name, sample)
+        assert summary["count"], f"{name}: no action produced a DOM update"
+        regression = ActionBenchmark.compare(name, self.baselines)
+        assert regression is None, regression
+
+    def _fill_cart(self):
+        if not StateSeeder.seed_cart(self.driver, [(self.PRODUCT, 1)]):
+            self.dashboard_page.search_product(self.PRODUCT)
+            assert self.dashboard_page.add_first_product_to_cart(), f"Should be able to add {self.PRODUCT} to the cart"
+
+    def test_search_keystroke_latency(self):
+        self.dashboard_page.search_product(self.PRODUCT)
+        keys = itertools.cycle([self.NO_MATCH_KEY, Keys.BACKSPACE])
+        self._benchmark("search_keystroke", lambda: ActionBenchmark.measure(
+            self.driver, lambda: self.dashboard_page.type_in_search(next(keys)), ["keydown"]
+        ))
+
+    def test_category_filter_latency(self):
+        categories = itertools.cycle(["Electronics", "All Categories"])
+        self._benchmark("category_filter", lambda: ActionBenchmark.measure(
+            self.driver, lambda: self.dashboard_page.select_category(next(categories)), ["input", "change"]
+        ))
+
+    def test_cart_quantity_click_latency(self):
+        self._fill_cart()
+        clicks = itertools.cycle([self.dashboard_page.increase_cart_item_quantity, self.dashboard_page.reduce_cart_item_quantity])
+        self._benchmark("cart_quantity_click", lambda: ActionBenchmark.measure(
+            self.driver, lambda: next(clicks)(0), ["click"]
+        ))
+
+    def test_transaction_submit_latency(self):
+        test_data = DataReader.get_checkout_test_case("complete_checkout_card")
+
+        def sample():
+            # Not measured: a cart and a filled checkout form for every round
+            self._fill_cart()
+            assert self.cart_page.proceed_to_checkout(), "Should be able to open the checkout modal"
+            assert self.checkout_page.fill_checkout_form(
+                test_data["customer_name"], test_data["customer_email"], test_data["notes"]
+            ), "Should be able to fill the checkout form"
+            ms = ActionBenchmark.measure(
+                self.driver, self.checkout_page.click_complete_transaction, ["click", "submit"], alert=True
+            )
+            self.checkout_page.wait_for_modal_closed(self.checkout_page.CHECKOUT_MODAL)
+            return ms
+
+        self._benchmark("transaction_submit", sample)
@@ -5,19 +5,164 @@ from dataclasses import dataclass
 @dataclass
 class Config:
     BASE_URL: str = "https://simple-pos-pwdk.netlify.app/"
-    BROWSER: str = "chrome"
-    HEADLESS: bool = False
-    IMPLICIT_WAIT: int = 10
+    # Run against the bundled local stand-in (utils/local_pos) instead of BASE_URL
+    LOCAL_APP: bool = os.getenv("POS_LOCAL_APP", "false").lower() == "true"
+    LOCAL_APP_HOST: str = "127.0.0.1"
+    LOCAL_APP_PORT: int = int(os.getenv("POS_LOCAL_APP_PORT", "0"))  # 0 = any free port
+    # chrome, chromium or firefox (see DriverManager.register_browser for more)
+    BROWSER: str = os.getenv("POS_BROWSER", "chrome").lower()
+    # Headless unless POS_HEADLESS=false (Chrome/Chromium use the new headless mode)
+    HEADLESS: bool = os.getenv("POS_HEADLESS", "true").lower() == "true"
+    # Disable GPU, extensions and background throttling (Chromium flags, Firefox prefs)
+    BROWSER_TUNED: bool = os.getenv("POS_BROWSER_TUNED", "true").lower() == "true"
+    # POS_EXPLICIT_WAITS_ONLY=true turns implicit waits off so they never stack on top of explicit waits
+    EXPLICIT_WAITS_ONLY: bool = os.getenv("POS_EXPLICIT_WAITS_ONLY", "false").lower() == "true"
+    IMPLICIT_WAIT: int = 0 if EXPLICIT_WAITS_ONLY else 10
     EXPLICIT_WAIT: int = 20
+    # Short timeout for probe_* checks where "not there" is an expected answer
+    PROBE_TIMEOUT: float = float(os.getenv("POS_PROBE_TIMEOUT", "2"))
+    POLL_INTERVAL: float = float(os.getenv("POS_POLL_INTERVAL", "0.1"))
+    # Upper bound for UI updates that may legitimately not happen (e.g. a search with unchanged results)
+    SETTLE_TIMEOUT: int = 3
+
+    # Browser startup: an explicit chromedriver binary skips resolution entirely; otherwise the path
+    # resolved by webdriver-manager is cached in DRIVER_PATH_CACHE and reused offline
+    CHROMEDRIVER_PATH: str = os.getenv("POS_CHROMEDRIVER_PATH", "")
+    CHROMIUMDRIVER_PATH: str = os.getenv("POS_CHROMIUMDRIVER_PATH", "")
+    GECKODRIVER_PATH: str = os.getenv("POS_GECKODRIVER_PATH", "")
+    # Browser binaries when not in the default location (chromium is looked up on PATH)
+    CHROMIUM_BINARY: str = os.getenv("POS_CHROMIUM_BINARY", "")
+    FIREFOX_BINARY: str = os.getenv("POS_FIREFOX_BINARY", "")
+    # Prebuilt user-data-dir (see run_tests.py --build-profile) copied for every Chrome/Chromium session
+    PROFILE_TEMPLATE: str = os.getenv("POS_PROFILE_TEMPLATE", "")
+
+    # Serve the app through a local caching proxy (utils/asset_proxy.py)
+    ASSET_PROXY: bool = os.getenv("POS_ASSET_PROXY", "false").lower() == "true"
+    ASSET_CACHE_PATTERNS: tuple = ("*.js", "*.css", "*.woff", "*.woff2", "*.ttf", "*.svg", "*.png", "*.jpg", "*.ico")
+    # Block analytics, web fonts and images (in the browser via CDP, and in the proxy)
+    BLOCK_REQUESTS: bool = os.getenv("POS_BLOCK_REQUESTS", "false").lower() == "true"
+    BLOCKED_URL_PATTERNS: tuple = tuple(filter(None, os.getenv(
+        "POS_BLOCKED_URLS",
+        "*google-analytics.com*,*googletagmanager.com*,*doubleclick.net*,*hotjar.com*,*segment.io*,"
+        "*fonts.googleapis.com*,*fonts.gstatic.com*,*.woff,*.woff2,*.ttf,*.png,*.jpg,*.jpeg,*.gif,*.webp",
+    ).split(",")))
+
+    # Under pytest-xdist, hand out the tests that took longest in recent runs first
+    SCHEDULE_BY_HISTORY: bool = os.getenv("POS_SCHEDULE_BY_HISTORY", "true").lower() == "true"
+
+    # Per-test durations shared by every CI host to split a sharded run the same way. run_tests.py --merge
+    # writes reports/test_durations.json; copy (or cache) it here, or point POS_SHARD_DURATIONS at it
+    SHARD_DURATIONS_PATH: str = os.getenv(
+        "POS_SHARD_DURATIONS", os.path.join(os.path.dirname(__file__), "..", "test_durations.json")
+    )
+
+    # Browser session pool (one pool per pytest worker process)
+    POOL_SIZE: int = int(os.getenv("POS_POOL_SIZE", "0"))  # 0 = CPU count
+    POOL_MAX_USES: int = int(os.getenv("POS_POOL_MAX_USES", "25"))
+    POOL_LEASE_TIMEOUT: int = 120
+
+    # Load mode (run_tests.py --load): virtual users replaying the checkout flow
+    LOAD_USERS: int = int(os.getenv("POS_LOAD_USERS", "5"))
+    LOAD_RAMP_UP: float = float(os.getenv("POS_LOAD_RAMP_UP", "10"))  # seconds to start every user
+    LOAD_DURATION: float = float(os.getenv("POS_LOAD_DURATION", "60"))  # seconds at full load after the ramp-up
+    LOAD_THINK_TIME: float = float(os.getenv("POS_LOAD_THINK_TIME", "1"))  # mean pause between steps
+    LOAD_PRODUCT: str = os.getenv("POS_LOAD_PRODUCT", "Wireless Headphones")
+
+    # Engine comparison (run_tests.py --compare-engines): sessions started and command rounds per engine
+    COMPARE_ENGINES: tuple = tuple(filter(None, os.getenv("POS_COMPARE_ENGINES", "chrome,chromium,firefox").split(",")))
+    COMPARE_SESSIONS: int = int(os.getenv("POS_COMPARE_SESSIONS", "3"))
+    COMPARE_ROUNDS: int = int(os.getenv("POS_COMPARE_ROUNDS", "20"))
+
+    # Rerun failures caused by these (selenium) exceptions, on a fresh browser session. Off for plain
+    # pytest runs; run_tests.py runs the main lane with POS_RERUNS=2 unless it is set
+    RERUNS: int = int(os.getenv("POS_RERUNS", "0"))
+    TRANSIENT_EXCEPTIONS: tuple = tuple(filter(None, (name.strip() for name in os.getenv(
+        "POS_TRANSIENT_EXCEPTIONS",
+        "StaleElementReferenceException,ElementClickInterceptedException,TimeoutException",
+    ).split(","))))
+    RERUN_FRESH_SESSION: bool = os.getenv("POS_RERUN_FRESH_SESSION", "true").lower() == "true"
+    # Flakiness over the last FLAKY_WINDOW runs; tests at QUARANTINE_THRESHOLD or above (with at least
+    # FLAKY_MIN_RUNS runs) go to QUARANTINE_PATH with run_tests.py --update-quarantine
+    FLAKY_WINDOW: int = int(os.getenv("POS_FLAKY_WINDOW", "20"))
+    FLAKY_MIN_RUNS: int = int(os.getenv("POS_FLAKY_MIN_RUNS", "5"))
+    QUARANTINE_THRESHOLD: float = float(os.getenv("POS_QUARANTINE_THRESHOLD", "0.2"))
+    QUARANTINE_PATH: str = os.getenv(
+        "POS_QUARANTINE", os.path.join(os.path.dirname(__file__), "..", "quarantine.json")
+    )
+
+    # Record the page objects, locators and data files each test touches, for --impact-base selection
+    IMPACT_MAP: bool = os.getenv("POS_IMPACT_MAP", "true").lower() == "true"
+    IMPACT_MAP_PATH: str = os.getenv(
+        "POS_IMPACT_MAP_PATH", os.path.join(os.path.dirname(__file__), "..", "reports", "impact_map.json")
+    )
+    # Changed files matching these patterns never select tests
+    IMPACT_IGNORE: tuple = tuple(filter(None, os.getenv(
+        "POS_IMPACT_IGNORE", "*.md,*.html,*.jsonl,reports/*,benchmarks/*,quarantine.json,test_durations.json"
+    ).split(",")))
 
     # Test credentials
     ADMIN_EMAIL: str = "admin@pos.com"
     ADMIN_PASSWORD: str = "admin"
 
+    # Reuse an authenticated cookie/localStorage snapshot instead of a form login per test
+    SESSION_CACHE: bool = os.getenv("POS_SESSION_CACHE", "true").lower() == "true"
+    SESSION_CACHE_MAX_REJECTIONS: int = 2
+
+    # Reset between tests: "soft" re-renders the start screen in one script call when the app supports it
+    # (falls back to "hard", a full reload of BASE_URL); override per class with @pytest.mark.reset_strategy
+    RESET_STRATEGY: str = os.getenv("POS_RESET_STRATEGY", "soft")
+
+    # Seed carts/transactions straight into client storage instead of building them through the UI.
+    # Needs an app exposing window.__pos (the local stand-in); otherwise tests fall back to the UI.
+    SEED_STATE: bool = os.getenv("POS_SEED_STATE", "true").lower() == "true"
+
+    # Locator registry: compile eligible XPaths to CSS selectors, optionally reuse resolved elements
+    # within a test, and record per-locator resolution cost
+    LOCATOR_CSS: bool = os.getenv("POS_LOCATOR_CSS", "true").lower() == "true"
+    ELEMENT_CACHE: bool = os.getenv("POS_ELEMENT_CACHE", "false").lower() == "true"
+    LOCATOR_STATS: bool = os.getenv("POS_LOCATOR_STATS", "false").lower() == "true"
+
+    # Navigation Timing, LCP, long tasks and JS heap per test (tests with a perf_budget marker always measure)
+    PERF_METRICS: bool = os.getenv("POS_PERF_METRICS", "false").lower() == "true"
+
+    # Action latency benchmarks (benchmarks/): rounds per benchmark, baselines and the allowed p95 slowdown
+    BENCHMARK_ITERATIONS: int = int(os.getenv("POS_BENCHMARK_ITERATIONS", "20"))
+    BENCHMARK_WARMUP: int = int(os.getenv("POS_BENCHMARK_WARMUP", "3"))
+    BENCHMARK_BASELINES: str = os.getenv(
+        "POS_BENCHMARK_BASELINES", os.path.join(os.path.dirname(__file__), "..", "benchmarks", "baselines.json")
+    )
+    BENCHMARK_THRESHOLD: float = float(os.getenv("POS_BENCHMARK_THRESHOLD", "0.25"))
+    # Store this run's results as the new baselines instead of comparing against them
+    BENCHMARK_SAVE: bool = os.getenv("POS_BENCHMARK_SAVE", "false").lower() == "true"
+
+    # Per-step timing of BasePage calls, written to reports/timing_profile.json/.csv
+    STEP_TIMING: bool = os.getenv("POS_STEP_TIMING", "false").lower() == "true"
+    SLOWEST_LOCATORS: int = 10
+
+    # Split test time into waits/sleeps/browser commands (the run history for trend checks is always kept)
+    TIME_BREAKDOWN: bool = os.getenv("POS_TIME_BREAKDOWN", "false").lower() == "true"
+    HISTORY_RUNS: int = 5
+    REGRESSION_THRESHOLD: float = 0.5  # flag tests more than 50% slower than their recent median...
+    REGRESSION_MIN_SECONDS: float = 1.0  # ...and at least this many seconds slower
+
+    # Stream results to a JSONL store and build a paginated viewer from it (reports/viewer/index.html)
+    REPORT_STORE: bool = os.getenv("POS_REPORT_STORE", "true").lower() == "true"
+    REPORT_PAGE_SIZE: int = int(os.getenv("POS_REPORT_PAGE_SIZE", "100"))
+
+    # Failure artifacts (screenshot, DOM snapshot, console log) are written by background threads
+    ARTIFACT_WORKERS: int = int(os.getenv("POS_ARTIFACT_WORKERS", "2"))
+    ARTIFACT_QUEUE_SIZE: int = int(os.getenv("POS_ARTIFACT_QUEUE_SIZE", "16"))
+
     # Paths
     TEST_DATA_PATH: str = os.path.join(os.path.dirname(__file__), "..", "data")
     REPORTS_PATH: str = os.path.join(os.path.dirname(__file__), "..", "reports")
     SCREENSHOTS_PATH: str = os.path.join(REPORTS_PATH, "screenshots")
+    HISTORY_PATH: str = os.path.join(REPORTS_PATH, "history.sqlite")
+    CACHE_PATH: str = os.path.join(os.path.dirname(__file__), "..", ".cache")
+    DRIVER_PATH_CACHE: str = os.path.join(CACHE_PATH, "chromedriver_path")
+    ASSET_CACHE_PATH: str = os.path.join(CACHE_PATH, "assets")
+    RESULTS_STORE_PATH: str = os.path.join(REPORTS_PATH, "results.jsonl")
+    REPORT_VIEWER_PATH: str = os.path.join(REPORTS_PATH, "viewer")
 
 
 # Create instance
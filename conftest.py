@@ -1,23 +1,130 @@
 import pytest
 import os
+import json
+from _pytest.runner import runtestprotocol
 from utils.driver_manager import DriverManager
+from utils.session_cache import SessionCache
+from utils.data_provider import DataProvider
+from utils.local_pos_server import LocalPOSServer
+from utils.asset_proxy import AssetProxy
+from utils.app_reset import AppReset
+from utils.locator_registry import LocatorRegistry
+from utils.perf_metrics import PerfMetrics
+from utils.artifact_writer import ArtifactWriter
+from utils.report_store import ReportStore
+from utils.step_timer import StepTimer
+from utils.time_breakdown import TimeBreakdown
+from utils.timing_report import TimingReport
+from utils.run_history import RunHistory
+from utils.scheduling import TestScheduler
+from utils.flaky_tests import FlakyTests
+from utils.impact_map import ImpactMap, ImpactRecorder
+from pages.login_page import LoginPage
 from config.config import config
 
+# Per-test timings for the HTML report and run history (controller process only)
+timing_report = None
+# Caching proxy in front of the app when POS_ASSET_PROXY is set (one per worker process)
+asset_proxy = None
+# Writes failure screenshots, DOM snapshots and console logs off the test thread (one per process);
+# started with the first failure capture, so processes that never capture one start no threads
+artifact_writer = None
+# Streams every result to reports/results.jsonl (controller process only); opened with the
+# first result, so runs that report nothing (e.g. --collect-only) keep the previous store
+report_store_enabled = False
+report_store = None
+report_viewer_path = None
+# What each finished test touched, merged into the impact map at the end (controller process only)
+impact_entries = None
+# Changes behind --impact-base selection (None without it, and in a pytest-xdist controller)
+impact_changes = None
+# {nodeid: seconds} of this shard's tests for run_tests.py --merge (controller process of a sharded run only)
+shard_durations = None
+
+@pytest.fixture(scope="session", autouse=True)
+def local_app():
+    """Serve the local POS stand-in and point BASE_URL at it when POS_LOCAL_APP is set"""
+    if not config.LOCAL_APP:
+        yield None
+        return
+    server = LocalPOSServer().start()
+    remote_url = config.BASE_URL
+    config.BASE_URL = server.url
+    yield server
+    config.BASE_URL = remote_url
+    server.stop()
+
+@pytest.fixture(scope="session", autouse=True)
+def asset_cache(local_app):
+    """Serve the app through the local caching proxy and point BASE_URL at it when POS_ASSET_PROXY is set"""
+    global asset_proxy
+    if not config.ASSET_PROXY:
+        yield None
+        return
+    asset_proxy = AssetProxy(upstream=config.BASE_URL).start()
+    upstream_url = config.BASE_URL
+    config.BASE_URL = asset_proxy.url
+    yield asset_proxy
+    config.BASE_URL = upstream_url
+    asset_proxy.stop()
+
 @pytest.fixture(scope="session")
-def driver():
-    driver = DriverManager.get_driver()
-    yield driver
+def driver_pool():
+    pool = DriverManager.get_pool()
+    yield pool
     DriverManager.quit_driver()
 
 @pytest.fixture(scope="function")
-def setup_teardown(driver):
-    # Setup: Navigate to base URL
-    driver.get(config.BASE_URL)
+def driver(request, driver_pool):
+    # Each test leases a warm session; under pytest-xdist every worker
+    # process has its own pool, so parallel workers never share a browser
+    driver = driver_pool.lease()
+    startup = DriverManager.take_startup_time(driver)
+    if startup is not None:
+        request.node.user_properties.append(("browser_startup", round(startup, 3)))
+    yield driver
+    # A transient failure gets its rerun on a fresh browser session
+    driver_pool.release(driver, recycle=config.RERUN_FRESH_SESSION and getattr(request.node, "transient_failure", False))
+
+@pytest.fixture(scope="function", autouse=True)
+def perf_metrics(request):
+    """
+    Front-end metrics of the test (POS_PERF_METRICS or @pytest.mark.perf_budget).
+
+    Only browser tests are measured, and only then is the driver leased
+    here. The metrics are collected and checked against the budget when
+    the call phase is reported (see _check_perf_budget).
+    """
+    if not PerfMetrics.enabled_for(request.node) or "driver" not in request.fixturenames:
+        return None
+    recorder = PerfMetrics(request.getfixturevalue("driver"))
+    recorder.mark()
+    request.node.perf_recorder = recorder
+    return recorder
+
+@pytest.fixture(scope="function")
+def setup_teardown(request, driver):
+    # Setup: back to the start screen with clean state; a soft reset does it
+    # in one script call, a hard reset (or the fallback) navigates to BASE_URL
+    strategy = AppReset.strategy_for(request.node)
+    AppReset.reset(driver, strategy)
     yield driver
-    # Teardown: Clear cookies and local storage
-    driver.delete_all_cookies()
-    driver.execute_script("window.localStorage.clear();")
-    driver.execute_script("window.sessionStorage.clear();")
+    # Teardown: a soft reset leaves clearing state to the next test's setup
+    if strategy == "hard":
+        AppReset.clear(driver)
+
+@pytest.fixture(scope="function")
+def logged_in(request, setup_teardown, test_credentials):
+    """Driver logged in as admin, restored from the session cache unless the test opts out"""
+    driver = setup_teardown
+    email = test_credentials["valid_email"]
+    password = test_credentials["valid_password"]
+    if config.SESSION_CACHE and not request.node.get_closest_marker("no_session_cache"):
+        # SessionCache.login already falls back to the form; False means the dashboard never loaded
+        assert SessionCache.login(driver, email, password), f"Could not log in as {email}: the dashboard did not load"
+    else:
+        LoginPage(driver).login(email, password)
+    return driver
 
 @pytest.fixture
 def test_credentials():
@@ -28,6 +135,27 @@ def test_credentials():
         "invalid_password": "wrongpassword"
     }
 
+def pytest_generate_tests(metafunc):
+    # @pytest.mark.data_stream("file.csv", types={...}, limit=N) parametrizes data_row lazily:
+    # each test holds a RowRef (file offset) and the row is only read when the test runs
+    marker = metafunc.definition.get_closest_marker("data_stream")
+    if marker is None or "data_row" not in metafunc.fixturenames:
+        return
+    filename = marker.args[0]
+    refs = DataProvider.row_refs(
+        filename,
+        limit=marker.kwargs.get("limit"),
+        id_field=marker.kwargs.get("id_field", "test_case"),
+        key=marker.kwargs.get("key"),
+    )
+    metafunc.parametrize("data_row", (pytest.param(ref, id=ref.id) for ref in refs), indirect=True)
+
+@pytest.fixture
+def data_row(request):
+    """Row of a @pytest.mark.data_stream file, coerced with the marker's types"""
+    marker = request.node.get_closest_marker("data_stream")
+    return DataProvider.resolve(request.param, marker.kwargs.get("types"))
+
 def pytest_configure(config):
     # Create reports directory if it doesn't exist
     reports_dir = os.path.join(os.path.dirname(__file__), "reports")
@@ -39,6 +167,244 @@ def pytest_configure(config):
     if not os.path.exists(screenshots_dir):
         os.makedirs(screenshots_dir)
 
+    try:
+        # Checked up front rather than on the first failure, inside pytest_runtest_makereport
+        FlakyTests.transient_types()
+    except ValueError as error:
+        raise pytest.UsageError(str(error))
+
+    _configure_timing(config)
+    _configure_report_store(config)
+    _configure_impact(config)
+    _configure_shard_durations(config)
+
+def pytest_addoption(parser):
+    group = parser.getgroup("sharding", "split the suite across CI hosts")
+    group.addoption("--shard-index", type=int, default=0,
+                    help="0-based index of the shard to run (default: 0)")
+    group.addoption("--shard-count", type=int, default=1,
+                    help="Number of shards the suite is split into (default: 1)")
+    group = parser.getgroup("quarantine", "run chronically flaky tests separately")
+    group.addoption("--lane", choices=FlakyTests.LANES, default="all",
+                    help="all: every test; main: skip quarantined tests; quarantine: only quarantined tests")
+    group = parser.getgroup("impact", "run only the tests affected by a change")
+    group.addoption("--impact-base", metavar="REF", default=None,
+                    help="Select the tests affected by changes since git REF (plus smoke tests), "
+                         "using the impact map recorded by earlier runs")
+
+def pytest_collection_modifyitems(config, items):
+    _select_impacted(config, items)
+    _select_lane(config, items)
+    _select_shard(config, items)
+    _schedule_by_history(config, items)
+
+def _select_impacted(pytest_config, items):
+    global impact_changes
+    base = pytest_config.getoption("impact_base")
+    if base is None:
+        return
+    try:
+        selected, deselected, impact_changes = ImpactMap.select(items, base)
+    except ValueError as error:
+        raise pytest.UsageError(str(error))
+    if deselected:
+        pytest_config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+def _select_lane(pytest_config, items):
+    lane = pytest_config.getoption("lane")
+    if lane == "all":
+        return
+    selected, deselected = FlakyTests.select_lane(items, lane, FlakyTests.load_quarantine())
+    if deselected:
+        pytest_config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+def _select_shard(pytest_config, items):
+    count = pytest_config.getoption("shard_count")
+    if count <= 1:
+        return
+    index = pytest_config.getoption("shard_index")
+    if not 0 <= index < count:
+        raise pytest.UsageError(f"--shard-index must be between 0 and {count - 1}, got {index}")
+    shards = TestScheduler.partition(items, count, TestScheduler.load_durations(config.SHARD_DURATIONS_PATH))
+    selected = set(id(item) for item in shards[index])
+    deselected = [item for item in items if id(item) not in selected]
+    if deselected:
+        pytest_config.hook.pytest_deselected(items=deselected)
+    items[:] = shards[index]
+
+def _schedule_by_history(pytest_config, items):
+    # Only pytest-xdist workers collect in a parallel run; they all read the
+    # same history, so every worker ends up with the same order
+    if not config.SCHEDULE_BY_HISTORY or not hasattr(pytest_config, "workerinput"):
+        return
+    history = RunHistory()
+    try:
+        durations = TestScheduler.expected_durations(history)
+    finally:
+        history.close()
+    TestScheduler.order_longest_first(items, durations)
+
+def _configure_timing(pytest_config):
+    global timing_report
+    if config.TIME_BREAKDOWN:
+        TimeBreakdown.install()
+    # pytest-xdist workers only measure; the controller aggregates and stores history
+    if not hasattr(pytest_config, "workerinput"):
+        history = RunHistory()
+        try:
+            timing_report = TimingReport(history.recent_totals(), breakdown=config.TIME_BREAKDOWN)
+        finally:
+            history.close()
+
+def _configure_report_store(pytest_config):
+    global report_store_enabled
+    report_store_enabled = config.REPORT_STORE and not hasattr(pytest_config, "workerinput")
+
+def _configure_impact(pytest_config):
+    global impact_entries
+    if ImpactRecorder.enabled and not hasattr(pytest_config, "workerinput"):
+        impact_entries = {}
+
+def _configure_shard_durations(pytest_config):
+    global shard_durations
+    if pytest_config.getoption("shard_count") > 1 and not hasattr(pytest_config, "workerinput"):
+        shard_durations = {}
+
+def pytest_unconfigure(config):
+    TimeBreakdown.uninstall()
+
+def pytest_runtest_setup(item):
+    # Attribute BasePage step timings (fixtures included) to the test about to run
+    StepTimer.start_test(item.nodeid)
+    TimeBreakdown.reset()
+    if ImpactRecorder.enabled:
+        ImpactRecorder.start_test()
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_logreport(report):
+    global report_store
+    # Runs before junitxml, so impact entries stay out of the JUnit properties (pytest-xdist
+    # workers keep them for the controller); the last entry wins, as reruns share user_properties
+    impacts = [value for name, value in report.user_properties if name == "impact"]
+    if impacts and impact_entries is not None:
+        report.user_properties = [prop for prop in report.user_properties if prop[0] != "impact"]
+        impact_entries[TestScheduler.plain_nodeid(report.nodeid)] = impacts[-1]
+    if timing_report is not None:
+        timing_report.add_report(report)
+    # Setup + call + teardown of the attempt that decided the outcome; retried attempts are left out
+    if shard_durations is not None and report.outcome != "rerun":
+        nodeid = TestScheduler.plain_nodeid(report.nodeid)
+        shard_durations[nodeid] = round(shard_durations.get(nodeid, 0.0) + report.duration, 4)
+    if report_store is None and report_store_enabled:
+        report_store = ReportStore()
+    if report_store is not None:
+        report_store.record(report)
+
+def pytest_sessionfinish(session):
+    global report_viewer_path
+    if artifact_writer is not None:
+        artifact_writer.close()
+    if report_store is not None:
+        report_store.close()
+        if not session.config.option.collectonly:
+            report_viewer_path, _ = ReportStore.build_viewer(started_at=report_store.started_at)
+    if impact_entries:
+        ImpactMap.update(impact_entries)
+
+    if timing_report is not None and timing_report.tests:
+        history = RunHistory()
+        try:
+            timing_report.finish(history)
+        finally:
+            history.close()
+    if shard_durations:
+        _write_shard_durations(session.config.getoption("shard_index"))
+
+    if not StepTimer.enabled:
+        return
+    # Under pytest-xdist every worker writes its own profile
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    suffix = f"_{worker}" if worker else ""
+    StepTimer.write_profile(config.REPORTS_PATH, suffix)
+
+def _write_shard_durations(index):
+    # Merged by run_tests.py --merge into the durations file for the next sharded run
+    shards_dir = os.path.join(config.REPORTS_PATH, "shards")
+    os.makedirs(shards_dir, exist_ok=True)
+    with open(os.path.join(shards_dir, f"durations-{index}.json"), "w", encoding="utf-8") as file:
+        json.dump(shard_durations, file, indent=2)
+
+def pytest_terminal_summary(terminalreporter):
+    if report_viewer_path is not None:
+        terminalreporter.write_sep("-", f"Results viewer: file://{os.path.abspath(report_viewer_path)}")
+
+    if impact_changes is not None:
+        terminalreporter.section("impact selection")
+        terminalreporter.write_line(
+            f"Full run: {impact_changes['full_run']}" if impact_changes["full_run"]
+            else f"{len(impact_changes['files'])} changed file(s): " + (", ".join(impact_changes["files"]) or "none")
+        )
+
+    if timing_report is not None and timing_report.regressions:
+        terminalreporter.section("runtime regressions")
+        for regression in timing_report.regressions:
+            terminalreporter.write_line(
+                f"{regression['nodeid']}: {regression['total_s']:.2f}s "
+                f"(median of last {regression['runs']} run(s): {regression['baseline_s']:.2f}s)"
+            )
+
+    if timing_report is not None and timing_report.startups:
+        startups = timing_report.startups
+        terminalreporter.section("browser startup")
+        terminalreporter.write_line(
+            f"{len(startups)} session(s) started: mean {sum(startups) / len(startups):.2f}s, max {max(startups):.2f}s"
+        )
+
+    if timing_report is not None and timing_report.perf:
+        terminalreporter.section("browser performance")
+        ranked = sorted(timing_report.perf.items(), key=lambda entry: entry[1].get("lcp_ms") or 0, reverse=True)
+        for nodeid, metrics in ranked[:config.SLOWEST_LOCATORS]:
+            terminalreporter.write_line(
+                f"LCP {_perf_value(metrics, 'lcp_ms', 'ms')}  load {_perf_value(metrics, 'load_ms', 'ms')}  "
+                f"{metrics.get('long_tasks') or 0} long task(s)  heap {_perf_value(metrics, 'heap_mb', 'MB')}  {nodeid}"
+            )
+
+    if asset_proxy is not None:
+        stats = asset_proxy.stats()
+        terminalreporter.section("asset cache")
+        terminalreporter.write_line(
+            f"{stats['hits']} hit(s), {stats['misses']} miss(es), {stats['blocked']} blocked request(s)"
+        )
+
+    if config.LOCATOR_STATS:
+        rows = LocatorRegistry.stats()
+        if rows:
+            terminalreporter.section("locator resolution")
+            for row in rows:
+                terminalreporter.write_line(
+                    f"{row['total_ms']:>10.1f} ms total  {row['calls']:>4} calls  "
+                    f"{row['cache_hits']:>4} cached  {row['mean_ms']:>8.1f} ms mean  {row['source']}"
+                    + (f"  (as {row['locator']})" if row["source"] != row["locator"] else "")
+                )
+
+    if not StepTimer.enabled:
+        return
+    slowest = StepTimer.slowest_locators()
+    if not slowest:
+        return
+    terminalreporter.section("slowest locators")
+    for entry in slowest:
+        terminalreporter.write_line(
+            f"{entry['total_ms']:>10.1f} ms total  {entry['calls']:>4} calls  "
+            f"{entry['max_ms']:>8.1f} ms max  {entry['locator']}"
+        )
+
+def _perf_value(metrics, name, unit):
+    value = metrics.get(name)
+    return "-" if value is None else f"{value:.0f}{unit}"
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     # Execute all other hooks to obtain the report object
@@ -48,14 +414,122 @@ def pytest_runtest_makereport(item, call):
     # Set a report attribute for each phase of a call, which can be "setup", "call", "teardown"
     setattr(item, "rep_" + rep.when, rep)
 
-@pytest.fixture(scope="function", autouse=True)
-def screenshot_on_failure(request, driver):
-    yield
-    # Check if test failed
-    if request.node.rep_call.failed:
-        # Take screenshot
-        screenshot_dir = os.path.join(os.path.dirname(__file__), "reports", "screenshots")
-        screenshot_name = f"{request.node.name}_{request.node.rep_call.when}.png"
-        screenshot_path = os.path.join(screenshot_dir, screenshot_name)
-        driver.save_screenshot(screenshot_path)
-        print(f"Screenshot saved: {screenshot_path}")
\ No newline at end of file
+    # Ship this phase's wait/sleep/command split with the report (survives pytest-xdist)
+    if config.TIME_BREAKDOWN:
+        rep.user_properties.append(("time_breakdown", TimeBreakdown.take()))
+
+    # Ship what the test touched with its teardown report; a failed or skipped test may have stopped early
+    if rep.when == "teardown" and ImpactRecorder.enabled:
+        touched = ImpactRecorder.take()
+        if touched is not None:
+            touched["complete"] = all(getattr(getattr(item, f"rep_{when}", None), "passed", False) for when in ("setup", "call"))
+            rep.user_properties.append(("impact", touched))
+
+    if rep.when == "call":
+        _check_perf_budget(item, rep)
+
+    if rep.failed and rep.when in ("setup", "call"):
+        _capture_failure(item, rep)
+        if FlakyTests.is_transient(call.excinfo):
+            item.transient_failure = True
+
+def _check_perf_budget(item, rep):
+    # Collected right after the call, while the test's page is still open; a budget
+    # violation fails the call itself rather than showing up as a teardown error
+    recorder = getattr(item, "perf_recorder", None)
+    if recorder is None:
+        return
+    item.perf_recorder = None
+    metrics = recorder.collect()
+    if metrics is not None:
+        # Shipped with the reports (survives pytest-xdist). The call report got its own copy of
+        # item.user_properties, so the item's list is what the teardown report (read by the
+        # timing report and the JUnit properties) is built from
+        rep.user_properties.append(("perf_metrics", metrics))
+        item.user_properties.append(("perf_metrics", metrics))
+    marker = item.get_closest_marker("perf_budget")
+    if marker is None or not rep.passed:
+        return
+    try:
+        violations = PerfMetrics.check_budget(metrics, marker.kwargs)
+    except ValueError as error:  # unknown metric in the marker
+        violations = [str(error)]
+    if violations:
+        rep.outcome = "failed"
+        rep.longrepr = "Performance budget exceeded: " + "; ".join(violations)
+
+def _capture_failure(item, rep):
+    # Only the capture itself runs here; files are written by artifact_writer's threads
+    global artifact_writer
+    driver = item.funcargs.get("driver")
+    if driver is None:
+        return
+    if artifact_writer is None:
+        artifact_writer = ArtifactWriter(config.SCREENSHOTS_PATH)
+    paths = artifact_writer.submit(f"{item.name}_{rep.when}", ArtifactWriter.capture(driver))
+    if "screenshot" in paths:
+        print(f"Screenshot saved: {paths['screenshot']}")
+    # For the results store: paths relative to REPORTS_PATH, shipped with the report (survives pytest-xdist)
+    rep.user_properties.append(("artifacts", {
+        kind: os.path.relpath(path, config.REPORTS_PATH).replace(os.sep, "/") for kind, path in paths.items()
+    }))
+    html_path = item.config.getoption("htmlpath", None)
+    if html_path and paths:
+        report_dir = os.path.dirname(os.path.abspath(html_path))
+        rep.extras = getattr(rep, "extras", []) + ArtifactWriter.report_extras(paths, report_dir)
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    # Rerun failures caused by known-transient exceptions (POS_TRANSIENT_EXCEPTIONS) up to POS_RERUNS times;
+    # a retried attempt is reported as "rerun" and only the last attempt decides the outcome
+    if config.RERUNS <= 0:
+        return None
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    for attempt in range(config.RERUNS + 1):
+        item.transient_failure = False
+        item.reruns_left = config.RERUNS - attempt
+        reports = runtestprotocol(item, nextitem=nextitem, log=False)
+        if not item.transient_failure or attempt == config.RERUNS:
+            break
+        for report in reports:
+            if report.failed:
+                report.outcome = "rerun"
+                item.ihook.pytest_runtest_logreport(report=report)
+    for report in reports:
+        item.ihook.pytest_runtest_logreport(report=report)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    # Before a rerun only the test itself is torn down: the module/session entries of the setup
+    # stack (with their finalizers) are set aside so the next attempt reuses them, even when
+    # nextitem is None and pytest would otherwise tear down the whole session
+    if not (getattr(item, "transient_failure", False) and getattr(item, "reruns_left", 0) > 0):
+        yield
+        return
+    stack = item.session._setupstate.stack
+    kept = {node: stack.pop(node) for node in list(stack) if node is not item}
+    try:
+        yield
+    finally:
+        stack.update(kept)
+
+def pytest_report_teststatus(report):
+    if report.outcome == "rerun":
+        return "rerun", "R", ("RERUN", {"yellow": True})
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_header(cells):
+    if timing_report is not None:
+        cells[3:3] = timing_report.header_cells()
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_row(report, cells):
+    if timing_report is not None:
+        cells[3:3] = timing_report.row_cells(report.nodeid)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix):
+    if timing_report is not None and timing_report.tests:
+        prefix.append(timing_report.summary_html())
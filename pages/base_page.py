@@ -1,39 +1,71 @@
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from contextlib import contextmanager
 from config.config import config
+from utils.step_timer import timed_step
+from utils.locator_registry import LocatorRegistry
 
 class BasePage:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Compile class-level locators once; eligible XPaths become CSS selectors
+        for name, value in list(vars(cls).items()):
+            if LocatorRegistry.is_locator(value):
+                setattr(cls, name, LocatorRegistry.compile(value))
+
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, config.EXPLICIT_WAIT)
+        self.wait = WebDriverWait(driver, config.EXPLICIT_WAIT, poll_frequency=config.POLL_INTERVAL)
     
-    def find_element(self, locator):
-        try:
-            return self.wait.until(EC.presence_of_element_located(locator))
-        except TimeoutException:
-            raise NoSuchElementException(f"Element {locator} not found")
+    @timed_step
+    def find_element(self, locator, use_cache=True):
+        element = LocatorRegistry.cached_element(self.driver, locator) if use_cache else None
+        if element is not None:
+            with LocatorRegistry.measure(locator, cached=True):
+                return element
+        with LocatorRegistry.measure(locator):
+            try:
+                element = self.wait.until(EC.presence_of_element_located(locator))
+            except TimeoutException:
+                raise NoSuchElementException(f"Element {locator} not found")
+        LocatorRegistry.remember(self.driver, locator, element)
+        return element
     
+    @timed_step
     def find_elements(self, locator):
-        try:
-            return self.wait.until(EC.presence_of_all_elements_located(locator))
-        except TimeoutException:
-            return []
+        with LocatorRegistry.measure(locator):
+            try:
+                return self.wait.until(EC.presence_of_all_elements_located(locator))
+            except TimeoutException:
+                return []
     
+    @timed_step
     def click_element(self, locator):
         element = self.wait.until(EC.element_to_be_clickable(locator))
         element.click()
     
+    @timed_step
     def send_keys_to_element(self, locator, text):
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
+        def type_text(element):
+            element.clear()
+            element.send_keys(text)
+        self._with_element(locator, type_text)
     
+    @timed_step
     def get_element_text(self, locator):
-        element = self.find_element(locator)
-        return element.text
+        return self._with_element(locator, lambda element: element.text)
+
+    def _with_element(self, locator, action):
+        """Run action on the element, re-resolving it once if a cached element went stale"""
+        try:
+            return action(self.find_element(locator))
+        except StaleElementReferenceException:
+            LocatorRegistry.forget(self.driver, locator)
+            return action(self.find_element(locator))
     
+    @timed_step
     def is_element_visible(self, locator):
         try:
             self.wait.until(EC.visibility_of_element_located(locator))
@@ -41,19 +73,162 @@ class BasePage:
         except TimeoutException:
             return False
     
+    @timed_step
     def is_element_present(self, locator):
         try:
-            self.find_element(locator)
+            # A cached element says nothing about whether it is still in the DOM
+            self.find_element(locator, use_cache=False)
             return True
         except NoSuchElementException:
             return False
     
+    @timed_step
     def wait_for_element_to_disappear(self, locator):
         try:
             self.wait.until(EC.invisibility_of_element_located(locator))
         except TimeoutException:
             pass
     
+    # Probes: short-timeout checks for negative paths, where "not there" is an expected answer
+    @timed_step
+    def probe_visible(self, locator, timeout=None):
+        """Like is_element_visible, but gives up after PROBE_TIMEOUT instead of EXPLICIT_WAIT"""
+        return self.wait_for_condition(
+            EC.visibility_of_element_located(locator), timeout or config.PROBE_TIMEOUT
+        )
+
+    @timed_step
+    def probe_present(self, locator, timeout=None):
+        """Like is_element_present, but gives up after PROBE_TIMEOUT instead of EXPLICIT_WAIT"""
+        return self.wait_for_condition(
+            lambda driver: len(driver.find_elements(*locator)) > 0, timeout or config.PROBE_TIMEOUT
+        )
+
+    @timed_step
+    def probe_elements(self, locator, timeout=None):
+        """Like find_elements, but returns [] after PROBE_TIMEOUT instead of EXPLICIT_WAIT"""
+        elements = []
+
+        def found(driver):
+            elements[:] = driver.find_elements(*locator)
+            return bool(elements)
+
+        self.wait_for_condition(found, timeout or config.PROBE_TIMEOUT)
+        return elements
+
+    # Bulk reads: one execute_script round-trip instead of one WebDriver call per element or field
+    _SNAPSHOT_PRELUDE = """
+        var locators = arguments[0];
+        function all(name, root) {
+            var by = locators[name][0], value = locators[name][1];
+            root = root || document;
+            if (by === "xpath") {
+                var result = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                var nodes = [];
+                for (var i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+                return nodes;
+            }
+            var selector = {"id": "#" + value, "class name": "." + value, "name": "[name='" + value + "']"}[by] || value;
+            return Array.prototype.slice.call(root.querySelectorAll(selector));
+        }
+        function one(name, root) { return all(name, root)[0] || null; }
+        function text(element) { return element ? (element.innerText || element.textContent || "").trim() : null; }
+        function lines(element) {
+            return (text(element) || "").split("\\n").map(function (line) { return line.trim(); }).filter(Boolean);
+        }
+    """
+
+    @timed_step
+    def snapshot(self, script, **locators):
+        """
+        Run script (a JS function body) in a single execute_script call.
+
+        The script can use all(name), one(name), text(element) and
+        lines(element), where name is one of the keyword locators; whatever
+        it returns comes back as plain lists/dicts.
+        """
+        return self.driver.execute_script(
+            self._SNAPSHOT_PRELUDE + script,
+            {name: list(locator) for name, locator in locators.items()},
+        )
+
+    # State-aware waits: poll the UI at POLL_INTERVAL until it settles
+    @timed_step
+    def wait_for_condition(self, condition, timeout=None):
+        """Wait until condition(driver) is truthy, return False on timeout"""
+        wait = WebDriverWait(
+            self.driver,
+            timeout or config.EXPLICIT_WAIT,
+            poll_frequency=config.POLL_INTERVAL,
+            ignored_exceptions=(StaleElementReferenceException,),
+        )
+        with self._implicit_wait_disabled():
+            try:
+                wait.until(condition)
+                return True
+            except TimeoutException:
+                return False
+
+    @timed_step
+    def get_element_count(self, locator):
+        """Count matching elements right now, without waiting"""
+        with self._implicit_wait_disabled():
+            return len(self.driver.find_elements(*locator))
+
+    @timed_step
+    def get_element_text_now(self, locator):
+        """Get element text right now, or None if it is not in the DOM"""
+        with self._implicit_wait_disabled():
+            return self._read_text(locator)
+
+    @timed_step
+    def wait_for_element_count_change(self, locator, previous_count, timeout=None):
+        """Wait until the number of matching elements differs from previous_count"""
+        return self.wait_for_condition(
+            lambda driver: len(driver.find_elements(*locator)) != previous_count, timeout
+        )
+
+    @timed_step
+    def wait_for_text_to_be(self, locator, text, timeout=None):
+        """Wait until the element text is exactly text"""
+        return self.wait_for_condition(lambda driver: self._read_text(locator) == text, timeout)
+
+    @timed_step
+    def wait_for_text_change(self, locator, previous_text, timeout=None):
+        """Wait until the element text (None when absent) differs from previous_text"""
+        return self.wait_for_condition(lambda driver: self._read_text(locator) != previous_text, timeout)
+
+    @timed_step
+    def wait_for_modal_open(self, locator, timeout=None):
+        """Wait until the modal identified by locator is visible"""
+        return self.wait_for_condition(EC.visibility_of_element_located(locator), timeout)
+
+    @timed_step
+    def wait_for_modal_closed(self, locator, timeout=None):
+        """Wait until the modal identified by locator is hidden or removed"""
+        return self.wait_for_condition(EC.invisibility_of_element_located(locator), timeout)
+
+    @timed_step
+    def wait_for_route_change(self, previous_url, timeout=None):
+        """Wait until the current URL differs from previous_url"""
+        return self.wait_for_condition(EC.url_changes(previous_url), timeout)
+
+    def _read_text(self, locator):
+        elements = self.driver.find_elements(*locator)
+        return elements[0].text if elements else None
+
+    @contextmanager
+    def _implicit_wait_disabled(self):
+        # Polling with an implicit wait active would block each poll on a missing element
+        if not config.IMPLICIT_WAIT:
+            yield
+            return
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(config.IMPLICIT_WAIT)
+
     def get_current_url(self):
         return self.driver.current_url
     
@@ -61,6 +236,7 @@ class BasePage:
         return self.driver.title
     
     # Alert handling methods
+    @timed_step
     def wait_for_alert(self, timeout=10):
         """Wait for browser alert to appear"""
         try:
@@ -15,13 +15,14 @@ class CartPage(BasePage):
     
     # Checkout functionality
     CHECKOUT_BUTTON = (By.XPATH, '//*[@id="root"]/div/main/div/div[2]/div/div[3]/button')
+    CHECKOUT_MODAL = (By.XPATH, '//*[@id="root"]/div/main/div/div[3]/div/form')
     
     def __init__(self, driver):
         super().__init__(driver)
     
     def proceed_to_checkout(self):
-        """Click the checkout button to open checkout modal"""
+        """Click the checkout button and return whether the checkout modal opened"""
         if self.is_element_visible(self.CHECKOUT_BUTTON):
             self.click_element(self.CHECKOUT_BUTTON)
-            return True
+            return self.wait_for_modal_open(self.CHECKOUT_MODAL)
         return False
\ No newline at end of file
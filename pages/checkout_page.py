@@ -29,6 +29,7 @@ class CheckoutPage(BasePage):
         '//*[@id="root"]/div/main/div/div[3]/div/form/div[5]/button[1]',
     )
     COMPLETE_TRANSACTION_BUTTON = (By.CSS_SELECTOR, 'button[type="submit"]')
+    CHECKOUT_MODAL = (By.XPATH, '//*[@id="root"]/div/main/div/div[3]/div/form')
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -76,7 +77,7 @@ class CheckoutPage(BasePage):
         """Click the Cancel button to close checkout modal"""
         if self.is_element_visible(self.CANCEL_BUTTON):
             self.click_element(self.CANCEL_BUTTON)
-            return True
+            return self.wait_for_modal_closed(self.CHECKOUT_MODAL)
         return False
 
     def fill_checkout_form(self, customer_name, customer_email, notes):
@@ -123,6 +124,9 @@ class CheckoutPage(BasePage):
         if not alert_accepted:
             return False, "Failed to accept success alert"
 
+        # Let the modal close before handing control back
+        self.wait_for_modal_closed(self.CHECKOUT_MODAL)
+
         # Verify success message
         if alert_text and "Transaction completed successfully" in alert_text:
             return True, alert_text
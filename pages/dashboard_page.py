@@ -1,5 +1,8 @@
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
+from utils.locator_registry import LocatorRegistry
+from config.config import config
 
 
 class DashboardPage(BasePage):
@@ -18,12 +21,21 @@ class DashboardPage(BasePage):
     # Product Actions (for first product - can be dynamic)
     ADD_TO_CART_BUTTON_FIRST = (By.XPATH, '//*[@id="root"]/div/main/div/div[1]/div[2]/div/div[1]/div/button')
     
+    # Product Actions by position (templates, see LocatorRegistry.template)
+    ADD_TO_CART_BUTTON_BY_INDEX = (By.XPATH, '//*[@id="root"]/div/main/div/div[1]/div[2]/div/div[{}]/div/button')
+
     # Cart Management (base patterns - will be made dynamic)
     CART_ITEM_BASE_PATH = '//*[@id="root"]/div/main/div/div[2]/div/div[2]/div[{}]/div[1]/div[2]'
+    CART_ITEM_REDUCE_BUTTON = (By.XPATH, CART_ITEM_BASE_PATH + '/div/button[1]')
+    CART_ITEM_ADD_BUTTON = (By.XPATH, CART_ITEM_BASE_PATH + '/div/button[2]')
+    CART_ITEM_REMOVE_BUTTON = (By.XPATH, CART_ITEM_BASE_PATH + '/button')
+    CART_ITEM_QUANTITY = (By.XPATH, CART_ITEM_BASE_PATH + '/div/span')
+    CART_ITEMS_CONTAINER = (By.XPATH, '//*[@id="root"]/div/main/div/div[2]/div/div[2]')
     
     # Navigation
     LOGOUT_BUTTON = (By.XPATH, '//*[@id="root"]/div/div/div[3]/button')
     REPORTS_MENU = (By.XPATH, '//*[@id="root"]/div/div/nav/ul/li[4]/button')
+    REPORTS_VIEW = (By.XPATH, "//h1[normalize-space()='Sales Reports']")
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -34,12 +46,77 @@ class DashboardPage(BasePage):
         )
 
     def search_product(self, product_name):
+        """Type into the search box and return once the product grid has updated"""
         if self.is_element_visible(self.PRODUCT_SEARCH):
+            previous_catalog = self.get_element_text_now(self.PRODUCT_CATALOG)
             self.send_keys_to_element(self.PRODUCT_SEARCH, product_name)
+            self.wait_for_text_change(self.PRODUCT_CATALOG, previous_catalog, timeout=config.SETTLE_TIMEOUT)
+
+    def type_in_search(self, keys):
+        """Send keys to the search box as typed, without clearing it or waiting for the grid"""
+        self.find_element(self.PRODUCT_SEARCH).send_keys(keys)
 
     def get_product_items(self):
         return self.find_elements(self.PRODUCT_ITEMS)
 
+    def get_products_snapshot(self, timeout=None):
+        """
+        Read the whole product grid in one round-trip.
+
+        Returns a list of dicts with index, name, category, price,
+        button_text and button_enabled; waits up to PROBE_TIMEOUT for the
+        grid to render and returns [] if it stays empty.
+        """
+        products = []
+
+        def loaded(driver):
+            products[:] = self.snapshot(self._PRODUCTS_SCRIPT, items=self.PRODUCT_ITEMS)
+            return bool(products)
+
+        self.wait_for_condition(loaded, timeout or config.PROBE_TIMEOUT)
+        return products
+
+    def get_cart_snapshot(self):
+        """Read every cart line (index, name, price, quantity) in one round-trip"""
+        return self.snapshot(self._CART_SCRIPT, container=self.CART_ITEMS_CONTAINER)
+
+    _PRODUCTS_SCRIPT = """
+        return all("items").map(function (card, index) {
+            var heading = card.querySelector("h1, h2, h3, h4");
+            var button = card.querySelector("button");
+            var buttonText = text(button);
+            var rows = lines(card).filter(function (line) { return line !== buttonText; });
+            var name = heading ? text(heading) : rows[0] || null;
+            var price = rows.filter(function (line) { return /\\$\\s*[\\d,.]+/.test(line); })[0] || null;
+            var category = rows.filter(function (line) { return line !== name && line !== price; })[0] || null;
+            return {
+                index: index,
+                name: name,
+                category: category,
+                price: price,
+                button_text: buttonText,
+                button_enabled: !!button && !button.disabled
+            };
+        });
+    """
+
+    _CART_SCRIPT = """
+        var container = one("container");
+        if (!container) return [];
+        return Array.prototype.filter.call(container.children, function (item) {
+            return item.querySelector("button");
+        }).map(function (item, index) {
+            var quantity = item.querySelector("span");
+            var rows = lines(item);
+            return {
+                index: index,
+                name: rows[0] || null,
+                price: rows.filter(function (line) { return /\\$\\s*[\\d,.]+/.test(line); })[0] || null,
+                quantity: quantity && /^\\d+$/.test(text(quantity)) ? parseInt(text(quantity), 10) : null
+            };
+        });
+    """
+
     def select_product_by_index(self, index):
         products = self.get_product_items()
         if index < len(products):
@@ -53,29 +130,35 @@ class DashboardPage(BasePage):
             from selenium.webdriver.support.ui import Select
             category_dropdown = self.find_element(self.CATEGORY_SELECT)
             select = Select(category_dropdown)
+            previous_catalog = self.get_element_text_now(self.PRODUCT_CATALOG)
             select.select_by_visible_text(category_value)
+            self.wait_for_text_change(self.PRODUCT_CATALOG, previous_catalog, timeout=config.SETTLE_TIMEOUT)
     
     def add_first_product_to_cart(self):
         """Add the first product to cart using the provided XPath"""
-        if self.is_element_visible(self.ADD_TO_CART_BUTTON_FIRST):
-            self.click_element(self.ADD_TO_CART_BUTTON_FIRST)
-            return True
-        return False
+        return self._add_to_cart(self.ADD_TO_CART_BUTTON_FIRST)
     
     def add_product_to_cart_by_index(self, product_index):
         """Add a specific product to cart by index (0-based)"""
-        # Dynamic XPath for different products
-        product_xpath = f'//*[@id="root"]/div/main/div/div[1]/div[2]/div/div[{product_index + 1}]/div/button'
-        product_locator = (By.XPATH, product_xpath)
-        
-        if self.is_element_visible(product_locator):
-            self.click_element(product_locator)
+        return self._add_to_cart(LocatorRegistry.template(self.ADD_TO_CART_BUTTON_BY_INDEX, product_index + 1))
+
+    def _add_to_cart(self, button_locator):
+        """Click an add-to-cart button and return once the cart has updated"""
+        if self.is_element_visible(button_locator):
+            previous_cart = self.get_element_text_now(self.CART_ITEMS_CONTAINER)
+            self.click_element(button_locator)
+            self.wait_for_text_change(self.CART_ITEMS_CONTAINER, previous_cart)
             return True
         return False
 
     def click_reports_menu(self):
+        """Open Sales Reports and return once the route or view has changed"""
         if self.is_element_visible(self.REPORTS_MENU):
+            previous_url = self.get_current_url()
             self.click_element(self.REPORTS_MENU)
+            self.wait_for_condition(
+                EC.any_of(EC.url_changes(previous_url), EC.visibility_of_element_located(self.REPORTS_VIEW))
+            )
             return True
         return False
 
@@ -86,55 +169,57 @@ class DashboardPage(BasePage):
     # Cart Management Methods
     def get_cart_item_reduce_button(self, item_index):
         """Get the reduce (-) button for a specific cart item (0-based index)"""
-        cart_item_path = self.CART_ITEM_BASE_PATH.format(item_index + 1)
-        reduce_button_xpath = f'{cart_item_path}/div/button[1]'
-        return (By.XPATH, reduce_button_xpath)
+        return LocatorRegistry.template(self.CART_ITEM_REDUCE_BUTTON, item_index + 1)
     
     def get_cart_item_add_button(self, item_index):
         """Get the add (+) button for a specific cart item (0-based index)"""
-        cart_item_path = self.CART_ITEM_BASE_PATH.format(item_index + 1)
-        add_button_xpath = f'{cart_item_path}/div/button[2]'
-        return (By.XPATH, add_button_xpath)
+        return LocatorRegistry.template(self.CART_ITEM_ADD_BUTTON, item_index + 1)
     
     def get_cart_item_remove_button(self, item_index):
         """Get the remove button for a specific cart item (0-based index)"""
-        cart_item_path = self.CART_ITEM_BASE_PATH.format(item_index + 1)
-        remove_button_xpath = f'{cart_item_path}/button'
-        return (By.XPATH, remove_button_xpath)
+        return LocatorRegistry.template(self.CART_ITEM_REMOVE_BUTTON, item_index + 1)
     
     def get_cart_item_quantity(self, item_index):
         """Get the quantity span for a specific cart item (0-based index)"""
-        cart_item_path = self.CART_ITEM_BASE_PATH.format(item_index + 1)
-        quantity_xpath = f'{cart_item_path}/div/span'
-        return (By.XPATH, quantity_xpath)
+        return LocatorRegistry.template(self.CART_ITEM_QUANTITY, item_index + 1)
     
     def reduce_cart_item_quantity(self, item_index):
         """Reduce quantity of a specific cart item by 1"""
-        reduce_button = self.get_cart_item_reduce_button(item_index)
-        if self.is_element_visible(reduce_button):
-            self.click_element(reduce_button)
-            return True
-        return False
+        return self._change_cart_item_quantity(item_index, self.get_cart_item_reduce_button(item_index), -1)
     
     def increase_cart_item_quantity(self, item_index):
         """Increase quantity of a specific cart item by 1"""
-        add_button = self.get_cart_item_add_button(item_index)
-        if self.is_element_visible(add_button):
-            self.click_element(add_button)
-            return True
-        return False
+        return self._change_cart_item_quantity(item_index, self.get_cart_item_add_button(item_index), 1)
+
+    def _change_cart_item_quantity(self, item_index, button_locator, delta):
+        """Click a +/- button and return once the quantity text shows the new value"""
+        if not self.is_element_visible(button_locator):
+            return False
+        quantity_locator = self.get_cart_item_quantity(item_index)
+        previous_cart = self.get_element_text_now(self.CART_ITEMS_CONTAINER)
+        previous_quantity = self.get_element_text_now(quantity_locator)
+        self.click_element(button_locator)
+        if previous_quantity and previous_quantity.strip().isdigit():
+            expected = int(previous_quantity) + delta
+            if expected > 0:
+                self.wait_for_text_to_be(quantity_locator, str(expected))
+                return True
+        self.wait_for_text_change(self.CART_ITEMS_CONTAINER, previous_cart)
+        return True
     
     def remove_cart_item(self, item_index):
         """Remove a specific cart item completely"""
         remove_button = self.get_cart_item_remove_button(item_index)
         if self.is_element_visible(remove_button):
+            previous_cart = self.get_element_text_now(self.CART_ITEMS_CONTAINER)
             self.click_element(remove_button)
+            self.wait_for_text_change(self.CART_ITEMS_CONTAINER, previous_cart)
             return True
         return False
     
     def get_cart_item_quantity_text(self, item_index):
         """Get the quantity text for a specific cart item"""
         quantity_locator = self.get_cart_item_quantity(item_index)
-        if self.is_element_visible(quantity_locator):
+        if self.probe_visible(quantity_locator):
             return self.get_element_text(quantity_locator)
         return None
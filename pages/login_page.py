@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from config.config import config
 
 class LoginPage(BasePage):
     # Locators
@@ -12,7 +13,7 @@ class LoginPage(BasePage):
         super().__init__(driver)
     
     def open_login_page(self):
-        self.driver.get("https://simple-pos-pwdk.netlify.app/")
+        self.driver.get(config.BASE_URL)
     
     def enter_email(self, email):
         self.send_keys_to_element(self.EMAIL_INPUT, email)
@@ -32,10 +33,11 @@ class LoginPage(BasePage):
         # Check if redirected to dashboard/main page
         return "dashboard" in self.get_current_url().lower() or \
                "pos" in self.get_current_url().lower() or \
-               self.get_current_url() != "https://simple-pos-pwdk.netlify.app/"
+               self.get_current_url() != config.BASE_URL
     
     def get_error_message(self):
-        if self.is_element_present(self.ERROR_MESSAGE):
+        # The error banner can take a moment after submit; allow it SETTLE_TIMEOUT to appear
+        if self.probe_visible(self.ERROR_MESSAGE, timeout=config.SETTLE_TIMEOUT):
             return self.get_element_text(self.ERROR_MESSAGE)
         return None
     
@@ -57,31 +57,44 @@ class ReportsPage(BasePage):
     
     def get_all_metrics(self):
         """Get all metrics as a dictionary"""
-        return {
-            "total_sales": self.get_total_sales(),
-            "transactions": self.get_transactions_count(),
-            "average_order": self.get_average_order(),
-            "top_products_count": self.get_top_products_count()
-        }
+        snapshot = self.get_report_snapshot()
+        return {key: snapshot[key] for key in ("total_sales", "transactions", "average_order", "top_products_count")}
+
+    def get_report_snapshot(self):
+        """
+        Read the heading, all metric cards and the Top Products names in one round-trip.
+
+        Waits for the metric cards to render first; missing values are None.
+        """
+        self.is_element_visible(self.TOTAL_SALES_VALUE)
+        return self.snapshot(
+            """
+            return {
+                heading: text(one("heading")),
+                total_sales: text(one("total_sales")),
+                transactions: text(one("transactions")),
+                average_order: text(one("average_order")),
+                top_products_count: text(one("top_products_count")),
+                top_products: all("top_products").map(text)
+            };
+            """,
+            heading=self.REPORTS_HEADING,
+            total_sales=self.TOTAL_SALES_VALUE,
+            transactions=self.TRANSACTIONS_VALUE,
+            average_order=self.AVERAGE_ORDER_VALUE,
+            top_products_count=self.TOP_PRODUCTS_COUNT,
+            top_products=self.TOP_PRODUCTS_LIST,
+        )
     
     def verify_product_in_top_products(self, product_name):
         """Verify if a specific product appears in the Top Products list"""
-        try:
-            # Find all product names in the top products section
-            product_elements = self.find_elements(self.TOP_PRODUCTS_LIST)
-            
-            for element in product_elements:
-                if product_name.lower() in element.text.lower():
-                    return True
-            return False
-        except Exception:
-            return False
+        return any(product_name.lower() in name.lower() for name in self.get_top_products_list())
     
     def get_top_products_list(self):
         """Get list of all products in Top Products section"""
         try:
-            product_elements = self.find_elements(self.TOP_PRODUCTS_LIST)
-            return [element.text for element in product_elements]
+            self.probe_present(self.TOP_PRODUCTS_LIST)
+            return self.snapshot("return all('names').map(text);", names=self.TOP_PRODUCTS_LIST)
         except Exception:
             return []
     
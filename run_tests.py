@@ -5,15 +5,29 @@ Test runner script for POS Automation Test Suite
 
 import os
 import sys
+import argparse
 import subprocess
 from datetime import datetime
 
-def run_all_tests():
-    """Run all test cases"""
+from config.config import config
+
+def run_all_tests(workers=None, shard_index=0, shard_count=1, impact_base=None):
+    """
+    Run all test cases (or one shard of them), spread over ``workers`` parallel processes.
+
+    With impact_base only the tests affected by changes since that git ref
+    run, plus the smoke tests.
+    """
     print("=" * 60)
     print("POS AUTOMATION TEST SUITE - ALL TESTS")
     print("=" * 60)
     print(f"Test execution started at: {datetime.now()}")
+    workers = workers or config.POOL_SIZE or os.cpu_count() or 1
+    print(f"Parallel workers: {workers}")
+    if shard_count > 1:
+        print(f"Shard: {shard_index} of {shard_count} (0-based)")
+    if impact_base:
+        print_impact(impact_base)
     print()
     
     # Create reports directory if it doesn't exist
@@ -21,20 +35,42 @@ def run_all_tests():
     if not os.path.exists(reports_dir):
         os.makedirs(reports_dir)
     
+    html_report = "reports/test_report.html"
+    junit_report = "reports/junit.xml"
+    if shard_count > 1:
+        # Per-shard result files, combined afterwards with --merge reports/shards
+        html_report = f"reports/shards/report-{shard_index}.html"
+        junit_report = f"reports/shards/junit-{shard_index}.xml"
+
     # Define pytest command for all tests
     cmd = [
         "python", "-m", "pytest", 
         "tests/",
-        "--html=reports/test_report.html",
-        "--self-contained-html",
+        f"--html={html_report}",
+        f"--junitxml={junit_report}",
         "--tb=short",
         "-v",
-        "--capture=no"
+        "--capture=no",
+        "--lane", "main",
     ]
+    if shard_count > 1:
+        cmd += ["--shard-index", str(shard_index), "--shard-count", str(shard_count)]
+    if impact_base:
+        cmd += ["--impact-base", impact_base]
+    if workers > 1:
+        # pytest-xdist: one process per worker, each with its own browser pool.
+        # loadgroup keeps each xdist_group on one worker; tests are handed out
+        # longest first from the run history (see conftest.py), and the
+        # controller merges every worker's results into one HTML/JUnit report
+        cmd += ["-n", str(workers), "--dist", "loadgroup"]
     
+    # Rerun transient Selenium failures (stale elements, intercepted clicks, wait timeouts)
+    # twice on a fresh browser, unless POS_RERUNS says otherwise
+    env = dict(os.environ, POS_RERUNS=os.environ.get("POS_RERUNS", "2"))
+
     try:
         # Run tests
-        result = subprocess.run(cmd, cwd=os.path.dirname(__file__))
+        result = subprocess.run(cmd, cwd=os.path.dirname(__file__), env=env)
         
         print()
         print("=" * 60)
@@ -47,7 +83,13 @@ def run_all_tests():
         else:
             print("❌ Some tests FAILED!")
             
-        print(f"📊 Detailed report: {os.path.abspath('reports/test_report.html')}")
+        print(f"📊 Detailed report: {os.path.abspath(html_report)}")
+        if config.REPORT_STORE and shard_count <= 1:
+            print(f"🗂  Results viewer: {os.path.abspath(os.path.join(config.REPORT_VIEWER_PATH, 'index.html'))}")
+        print(f"📄 JUnit XML: {os.path.abspath(junit_report)}")
+
+        if shard_index == 0:
+            run_quarantine_lane(workers, impact_base)
         
         return result.returncode
         
@@ -55,6 +97,211 @@ def run_all_tests():
         print(f"❌ Error running tests: {e}")
         return 1
 
+def print_impact(base):
+    """Show what changed since base and how the tests will be selected"""
+    from utils.impact_map import ImpactMap
+    try:
+        changes = ImpactMap.analyze(base)
+    except ValueError as error:
+        print(f"❌ {error}")
+        return
+    print(f"Changed since {base}: {len(changes['files'])} file(s)")
+    for path in changes["files"]:
+        print(f"  {path}")
+    if changes["full_run"]:
+        print(f"Impact selection: running every test ({changes['full_run']})")
+    else:
+        print("Impact selection: affected tests plus smoke tests")
+
+def run_quarantine_lane(workers=1, impact_base=None):
+    """
+    Run the quarantined tests in their own lane and report them separately.
+
+    Quarantined tests still run (so their history shows when they are
+    stable again) but their failures never affect the exit code.
+    """
+    cmd = [
+        "python", "-m", "pytest",
+        "tests/",
+        "--html=reports/quarantine_report.html",
+        "--junitxml=reports/quarantine_junit.xml",
+        "--tb=short",
+        "-v",
+        "--lane", "quarantine",
+    ]
+    if impact_base:
+        cmd += ["--impact-base", impact_base]
+    if workers > 1:
+        cmd += ["-n", str(workers), "--dist", "loadgroup"]
+    # Keep the main lane's results store and viewer
+    env = dict(os.environ, POS_REPORT_STORE="false")
+    result = subprocess.run(cmd, cwd=os.path.dirname(__file__), env=env)
+    if result.returncode == 5:  # no tests collected: nothing is quarantined
+        return
+    print()
+    print(f"🚧 Quarantine lane {'passed' if result.returncode == 0 else 'had failures'} (does not affect the exit code)")
+    print(f"📊 Quarantine report: {os.path.abspath('reports/quarantine_report.html')}")
+
+def update_quarantine():
+    """Quarantine the chronically flaky tests from the run history"""
+    from utils.flaky_tests import FlakyTests
+    from utils.run_history import RunHistory
+    history = RunHistory()
+    try:
+        scores = history.flakiness()
+    finally:
+        history.close()
+    quarantined = FlakyTests.chronic(scores)
+    FlakyTests.write_quarantine(quarantined)
+    print(f"Flakiness over the last {config.FLAKY_WINDOW} runs "
+          f"(quarantine at score >= {config.QUARANTINE_THRESHOLD} over >= {config.FLAKY_MIN_RUNS} runs):")
+    for nodeid, score in sorted(scores.items(), key=lambda item: -item[1]["score"]):
+        if score["flaky_runs"]:
+            marker = "Q" if nodeid in quarantined else " "
+            print(f"  {marker} {score['score']:.2f}  {score['flaky_runs']}/{score['runs']} flaky, "
+                  f"{score['reruns']} reruns  {nodeid}")
+    print(f"🚧 {len(quarantined)} test(s) quarantined: {os.path.abspath(config.QUARANTINE_PATH)}")
+    return 0
+
+def run_benchmarks(save=False):
+    """Run the action latency benchmarks (serially) and compare them with the stored baselines"""
+    print("=" * 60)
+    print("POS AUTOMATION TEST SUITE - ACTION LATENCY BENCHMARKS")
+    print("=" * 60)
+    cmd = [
+        "python", "-m", "pytest",
+        "benchmarks/",
+        "--html=reports/benchmark_report.html",
+        "--tb=short",
+        "-v",
+    ]
+    env = dict(os.environ, POS_BENCHMARK_SAVE="true") if save else None
+    result = subprocess.run(cmd, cwd=os.path.dirname(__file__), env=env)
+    print(f"📊 Benchmark results: {os.path.abspath('reports/benchmarks.json')}")
+    if save:
+        print(f"📌 Baselines: {os.path.abspath(config.BENCHMARK_BASELINES)}")
+    return result.returncode
+
+def merge_shards(directory):
+    """Combine the result files of every shard into one report"""
+    from utils.report_merge import ReportMerger
+    result = ReportMerger.merge(directory, "reports")
+    totals = result["totals"]
+    print(f"Merged {totals['tests']} tests: {totals['passed']} passed, {totals['failed']} failed, "
+          f"{totals['error']} errors, {totals['skipped']} skipped")
+    print(f"📊 Report: {os.path.abspath(result['html'])}")
+    print(f"📄 JUnit XML: {os.path.abspath(result['junit'])}")
+    print(f"⏱  Durations for the next sharded run: {os.path.abspath(result['durations'])} "
+          f"(copy to {os.path.abspath(config.SHARD_DURATIONS_PATH)} or point POS_SHARD_DURATIONS at it)")
+    return 1 if totals["failed"] or totals["error"] else 0
+
+def compare_engines(engines=None, sessions=None, rounds=None, remote=False):
+    """Measure browser startup and per-command latency for each engine"""
+    from utils.engine_comparison import EngineComparison
+    from utils.local_pos_server import LocalPOSServer
+    print("=" * 60)
+    print("POS AUTOMATION TEST SUITE - BROWSER ENGINE COMPARISON")
+    print("=" * 60)
+    server = None
+    if not remote:
+        server = LocalPOSServer().start()
+        config.BASE_URL = server.url
+    try:
+        results = EngineComparison(engines, sessions, rounds).run()
+    finally:
+        if server:
+            server.stop()
+    print(EngineComparison.format_results(results))
+    print()
+    print(f"📊 Engine comparison: {os.path.abspath(EngineComparison.write_report(results))}")
+    return 0 if results["cheapest"] else 1
+
+def run_load(users=None, ramp_up=None, duration=None, think_time=None, remote=False):
+    """Replay the checkout flow as concurrent virtual users and report step latencies"""
+    from utils.load_runner import LoadRunner
+    from utils.local_pos_server import LocalPOSServer
+    print("=" * 60)
+    print("POS AUTOMATION TEST SUITE - LOAD")
+    print("=" * 60)
+    # Many concurrent browsers: never open windows for them
+    config.HEADLESS = True
+    server = None
+    if not remote:
+        server = LocalPOSServer().start()
+        config.BASE_URL = server.url
+    try:
+        runner = LoadRunner(users=users, ramp_up=ramp_up, duration=duration, think_time=think_time)
+        print(f"Starting {runner.users} browser(s) against {config.BASE_URL} "
+              f"(ramp-up {runner.ramp_up}s, duration {runner.duration}s, think time {runner.think_time}s)")
+        results = runner.run()
+    finally:
+        if server:
+            server.stop()
+    print()
+    print(LoadRunner.format_results(results))
+    print()
+    print(f"📊 Load report: {os.path.abspath(LoadRunner.write_report(results))}")
+    return 0 if results["iterations"]["completed"] else 1
+
 if __name__ == "__main__":
-    exit_code = run_all_tests()
+    parser = argparse.ArgumentParser(description="Run the POS automation test suite")
+    parser.add_argument("-n", "--workers", type=int, default=None,
+                        help="Number of parallel workers (default: POS_POOL_SIZE or CPU count)")
+    parser.add_argument("--build-profile", metavar="PATH", default=None,
+                        help="Build a Chrome profile template with the app's assets cached, then exit "
+                             "(use it with POS_PROFILE_TEMPLATE=PATH)")
+    parser.add_argument("--shard-index", type=int, default=0,
+                        help="0-based index of the shard to run on this host")
+    parser.add_argument("--shard-count", type=int, default=1,
+                        help="Number of hosts the suite is split across")
+    parser.add_argument("--merge", metavar="DIR", default=None,
+                        help="Merge the per-shard results in DIR (e.g. reports/shards) into one report, then exit")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Run the action latency benchmarks in benchmarks/ instead of the tests")
+    parser.add_argument("--save-baselines", action="store_true",
+                        help="With --benchmark: store the results as the new baselines")
+    parser.add_argument("--impact-base", metavar="REF", default=None,
+                        help="Run only the tests affected by changes since git REF (e.g. origin/main), "
+                             "plus the smoke tests")
+    parser.add_argument("--update-quarantine", action="store_true",
+                        help="Rewrite the quarantine list from the run history's flakiness scores, then exit")
+    load = parser.add_argument_group("load mode")
+    load.add_argument("--load", action="store_true",
+                      help="Replay the checkout flow as concurrent virtual users instead of running the tests")
+    load.add_argument("--users", type=int, default=None, help="Virtual users (default: POS_LOAD_USERS)")
+    load.add_argument("--ramp-up", type=float, default=None,
+                      help="Seconds over which the users start (default: POS_LOAD_RAMP_UP)")
+    load.add_argument("--duration", type=float, default=None,
+                      help="Seconds at full load after the ramp-up (default: POS_LOAD_DURATION)")
+    load.add_argument("--think-time", type=float, default=None,
+                      help="Mean pause between steps in seconds (default: POS_LOAD_THINK_TIME)")
+    load.add_argument("--remote", action="store_true",
+                      help="Load BASE_URL instead of the local stand-in (also for --compare-engines)")
+    engines = parser.add_argument_group("engine comparison")
+    engines.add_argument("--compare-engines", metavar="ENGINES", nargs="?", const="", default=None,
+                         help="Compare browser startup and command latency, e.g. chrome,firefox "
+                              "(default: POS_COMPARE_ENGINES), instead of running the tests")
+    engines.add_argument("--sessions", type=int, default=None,
+                         help="Browsers started per engine (default: POS_COMPARE_SESSIONS)")
+    engines.add_argument("--rounds", type=int, default=None,
+                         help="Command rounds per browser (default: POS_COMPARE_ROUNDS)")
+    args = parser.parse_args()
+    if args.benchmark:
+        sys.exit(run_benchmarks(args.save_baselines))
+    if args.load:
+        sys.exit(run_load(args.users, args.ramp_up, args.duration, args.think_time, args.remote))
+    if args.compare_engines is not None:
+        engine_names = [name.strip() for name in args.compare_engines.split(",") if name.strip()]
+        sys.exit(compare_engines(engine_names or None, args.sessions, args.rounds, args.remote))
+    if args.update_quarantine:
+        sys.exit(update_quarantine())
+    if args.merge:
+        sys.exit(merge_shards(args.merge))
+    if args.build_profile:
+        from utils.driver_manager import DriverManager
+        DriverManager.build_profile_template(args.build_profile)
+        print(f"Profile template written to {os.path.abspath(args.build_profile)}")
+        print(f"chromedriver: {DriverManager.resolve_driver_path()} (cached in {config.DRIVER_PATH_CACHE})")
+        sys.exit(0)
+    exit_code = run_all_tests(args.workers, args.shard_index, args.shard_count, args.impact_base)
     sys.exit(exit_code)
\ No newline at end of file
@@ -1,35 +1,41 @@
 import pytest
-import time
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
 from utils.data_reader import DataReader
+from utils.state_seeder import StateSeeder
 
 
+# Checkout and reports both build a cart and complete a transaction; keeping them on one
+# pytest-xdist worker (--dist loadgroup) reuses its warm browser and cached login
+@pytest.mark.xdist_group("transactions")
 class TestCheckout:
 
     @pytest.fixture(autouse=True)
-    def login_and_cart_setup(self, setup_teardown, test_credentials):
+    def login_and_cart_setup(self, logged_in):
         """Automatically login and setup cart with Wireless Headphones before each test"""
-        self.driver = setup_teardown
+        self.driver = logged_in
         self.login_page = LoginPage(self.driver)
         self.dashboard_page = DashboardPage(self.driver)
         self.cart_page = CartPage(self.driver)
         self.checkout_page = CheckoutPage(self.driver)
 
-        # Login before each test
-        self.login_page.login(
-            test_credentials["valid_email"], test_credentials["valid_password"]
-        )
         assert self.login_page.is_login_successful(), "Login should be successful before testing checkout functionality"
 
         # Ensure we're on the dashboard/POS page
         assert self.dashboard_page.is_dashboard_loaded(), "Dashboard should be loaded to access checkout functionality"
 
         # Setup cart with Wireless Headphones (prerequisite for checkout)
+        if StateSeeder.seed_cart(self.driver, [("Wireless Headphones", 1)]):
+            cart = self.dashboard_page.get_cart_snapshot()
+            assert [item["name"] for item in cart] == [
+                "Wireless Headphones"
+            ], f"Seeded cart should contain only Wireless Headphones but contains: {cart}"
+            return
+
+        # App doesn't support seeding: build the cart through the UI
         self.dashboard_page.search_product("Wireless Headphones")
-        time.sleep(2)
 
         # Verify products are available
         products = self.dashboard_page.get_product_items()
@@ -40,7 +46,6 @@ class TestCheckout:
         assert (
             success
         ), "Should be able to add Wireless Headphones to cart for checkout test but add operation failed"
-        time.sleep(2)
 
     # @pytest.mark.high
     # def test_complete_checkout_with_card_payment(self):
@@ -120,6 +125,7 @@ class TestCheckout:
     #         ), f"Successfully completed checkout with {payment_method} payment for {customer_name}"
 
     @pytest.mark.high
+    @pytest.mark.smoke
     def test_complete_checkout_using_helper_method(self):
         """TC_015: Complete checkout using the helper method for streamlined testing"""
         # Get test data
@@ -131,7 +137,6 @@ class TestCheckout:
         # Click checkout to open modal
         checkout_opened = self.cart_page.proceed_to_checkout()
         assert checkout_opened, "Should be able to open checkout modal but checkout button click failed"
-        time.sleep(3)
 
         # Use the complete checkout helper method
         success, message = self.checkout_page.complete_checkout_transaction(
@@ -1,29 +1,28 @@
 import pytest
-import time
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
 from pages.reports_page import ReportsPage
 from utils.data_reader import DataReader
+from utils.state_seeder import StateSeeder
 
 
+# Checkout and reports both build a cart and complete a transaction; keeping them on one
+# pytest-xdist worker (--dist loadgroup) reuses its warm browser and cached login
+@pytest.mark.xdist_group("transactions")
 class TestReports:
 
     @pytest.fixture(autouse=True)
-    def login_setup(self, setup_teardown, test_credentials):
+    def login_setup(self, logged_in):
         """Automatically login before each test"""
-        self.driver = setup_teardown
+        self.driver = logged_in
         self.login_page = LoginPage(self.driver)
         self.dashboard_page = DashboardPage(self.driver)
         self.cart_page = CartPage(self.driver)
         self.checkout_page = CheckoutPage(self.driver)
         self.reports_page = ReportsPage(self.driver)
 
-        # Login before each test
-        self.login_page.login(
-            test_credentials["valid_email"], test_credentials["valid_password"]
-        )
         assert self.login_page.is_login_successful(), "Login should be successful before testing reports functionality"
 
         # Ensure we're on the dashboard/POS page
@@ -38,27 +37,30 @@ class TestReports:
         # Get checkout data
         checkout_data = DataReader.get_checkout_test_case("complete_checkout_card")
 
-        # Complete the full workflow: Add to cart → Checkout → Verify Reports
-        # Step 1: Setup and complete transaction
-        self.dashboard_page.search_product("Wireless Headphones")
-        time.sleep(2)
-        self.dashboard_page.add_first_product_to_cart()
-        time.sleep(2)
-
-        # Complete checkout
-        self.cart_page.proceed_to_checkout()
-        time.sleep(3)
-        transaction_success, message = self.checkout_page.complete_checkout_transaction(
-            checkout_data["customer_name"],
-            checkout_data["customer_email"],
-            checkout_data["notes"],
-        )
-        assert transaction_success, f"Transaction should complete successfully before verifying reports but failed: {message}"
-        time.sleep(3)
+        # Step 1: Setup the completed transaction, seeded directly when the app supports it
+        seeded = StateSeeder.seed_transactions(self.driver, [{
+            "items": [("Wireless Headphones", 1)],
+            "customer_name": checkout_data["customer_name"],
+            "customer_email": checkout_data["customer_email"],
+            "payment_method": checkout_data["payment_method"],
+            "notes": checkout_data["notes"],
+        }])
+        if not seeded:
+            # Complete the full workflow: Add to cart → Checkout → Verify Reports
+            self.dashboard_page.search_product("Wireless Headphones")
+            self.dashboard_page.add_first_product_to_cart()
+
+            # Complete checkout
+            self.cart_page.proceed_to_checkout()
+            transaction_success, message = self.checkout_page.complete_checkout_transaction(
+                checkout_data["customer_name"],
+                checkout_data["customer_email"],
+                checkout_data["notes"],
+            )
+            assert transaction_success, f"Transaction should complete successfully before verifying reports but failed: {message}"
 
         # Step 2: Navigate to reports and verify using helper method
         self.dashboard_page.click_reports_menu()
-        time.sleep(3)
 
         # Use the comprehensive verification helper method
         verification_results = self.reports_page.verify_reports_data(
@@ -98,14 +100,12 @@ class TestReports:
         ), "Successfully completed transaction and verified all reports data using helper method"
 
     @pytest.mark.medium
+    @pytest.mark.smoke
     def test_navigate_to_reports_page(self):
         """TC_017: Simple navigation to reports page verification"""
         # Navigate to Reports page
         self.dashboard_page.click_reports_menu()
 
-        # Wait for page to load
-        time.sleep(3)
-
         # Verify we're on the Reports page
         on_reports_page = self.reports_page.is_on_reports_page()
         assert on_reports_page, "Should be on Reports page after navigation but page verification failed"
@@ -0,0 +1,76 @@
+import json
+from utils.data_provider import DataProvider
+
+
+class TestDataProvider:
+    """Row offsets of line-based data files, without a browser"""
+
+    CSV = (
+        "test_case,product_name,quantity,notes\n"
+        "add_one,Wireless Headphones,1,plain\n"
+        "\n"
+        'add_two,"Desk Lamp, LED",2,"first line\nsecond line"\n'
+        "add_three,Coffee Mug,3,\n"
+    )
+
+    def write(self, tmp_path, name, content):
+        path = tmp_path / name
+        path.write_bytes(content.encode("utf-8"))
+        return str(path)
+
+    def test_csv_refs_resolve_to_the_streamed_rows(self, tmp_path):
+        """Every CSV offset reads back the row stream() yields, quoted commas and newlines included"""
+        path = self.write(tmp_path, "rows.csv", self.CSV)
+
+        refs = list(DataProvider.row_refs(path))
+        rows = list(DataProvider.stream(path))
+
+        assert [ref.id for ref in refs] == ["add_one", "add_two", "add_three"]
+        assert [DataProvider.resolve(ref) for ref in refs] == rows
+        assert rows[1]["product_name"] == "Desk Lamp, LED"
+        assert rows[1]["notes"] == "first line\nsecond line"
+
+    def test_csv_offsets_point_at_record_starts(self, tmp_path):
+        path = self.write(tmp_path, "rows.csv", self.CSV)
+        content = self.CSV.encode("utf-8")
+
+        offsets = [ref.offset for ref in DataProvider.row_refs(path)]
+
+        assert offsets == [
+            content.index(b"add_one"),
+            content.index(b"add_two"),
+            content.index(b"add_three"),
+        ]
+
+    def test_csv_refs_without_id_column_are_numbered(self, tmp_path):
+        path = self.write(tmp_path, "rows.csv", self.CSV)
+
+        refs = list(DataProvider.row_refs(path, id_field="missing"))
+
+        # The blank line keeps its index, so ids match the record position in the file
+        assert [ref.id for ref in refs] == ["row0", "row2", "row3"]
+
+    def test_jsonl_refs_skip_blank_lines(self, tmp_path):
+        rows = [{"test_case": "first", "price": "9.99"}, {"test_case": "", "price": "5"}]
+        content = json.dumps(rows[0]) + "\n\n" + json.dumps(rows[1]) + "\n"
+        path = self.write(tmp_path, "rows.jsonl", content)
+
+        refs = list(DataProvider.row_refs(path))
+
+        assert [ref.id for ref in refs] == ["first", "row2"]
+        assert [ref.offset for ref in refs] == [0, content.encode("utf-8").index(b"\n\n") + 2]
+        assert [DataProvider.resolve(ref, {"price": "float"}) for ref in refs] == [
+            {"test_case": "first", "price": 9.99},
+            {"test_case": "", "price": 5.0},
+        ]
+
+    def test_jsonl_offsets_count_bytes_not_characters(self, tmp_path):
+        rows = [{"test_case": "café", "name": "Crème brûlée"}, {"test_case": "plain", "name": "Tea"}]
+        path = self.write(tmp_path, "rows.jsonl", "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows))
+
+        assert [DataProvider.resolve(ref) for ref in DataProvider.row_refs(path)] == rows
+
+    def test_limit_stops_the_refs(self, tmp_path):
+        path = self.write(tmp_path, "rows.csv", self.CSV)
+
+        assert [ref.id for ref in DataProvider.row_refs(path, limit=2)] == ["add_one", "add_two"]
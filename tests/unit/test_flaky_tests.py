@@ -0,0 +1,104 @@
+import pytest
+from utils.flaky_tests import FlakyTests
+from utils.run_history import RunHistory
+from config.config import config
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = RunHistory(str(tmp_path / "history.sqlite"))
+    yield history
+    history.close()
+
+
+def record(history, *runs):
+    """Store one run per {nodeid: outcome or (outcome, reruns)} mapping"""
+    for index, results in enumerate(runs):
+        timestamp = f"2026-01-01T00:00:{index:02d}"
+        history.record_run(timestamp, timestamp, {
+            nodeid: dict(zip(("outcome", "reruns"), result if isinstance(result, tuple) else (result, 0)))
+            for nodeid, result in results.items()
+        })
+
+
+class TestFlakinessScore:
+    """RunHistory.flakiness: reruns and pass/fail flips over the recent runs"""
+
+    def test_empty_history_has_no_scores(self, history):
+        assert history.flakiness() == {}
+
+    def test_stable_and_broken_tests_are_not_flaky(self, history):
+        record(history, *[{"stable": "passed", "broken": "failed"}] * 4)
+
+        scores = history.flakiness()
+
+        assert scores["stable"] == {"runs": 4, "flaky_runs": 0, "failures": 0, "reruns": 0, "score": 0.0}
+        assert scores["broken"] == {"runs": 4, "flaky_runs": 0, "failures": 4, "reruns": 0, "score": 0.0}
+
+    def test_every_flip_after_the_first_run_counts(self, history):
+        record(history, {"t": "passed"}, {"t": "failed"}, {"t": "passed"}, {"t": "failed"})
+
+        assert history.flakiness()["t"]["flaky_runs"] == 3
+        assert history.flakiness()["t"]["score"] == 0.75
+
+    def test_pass_after_rerun_is_flaky_without_a_flip(self, history):
+        record(history, {"t": ("passed", 1)}, {"t": "passed"}, {"t": "passed"})
+
+        score = history.flakiness()["t"]
+
+        assert (score["flaky_runs"], score["reruns"], score["score"]) == (1, 1, 0.333)
+
+    def test_failure_after_reruns_is_not_a_flaky_pass(self, history):
+        record(history, {"t": ("failed", 2)}, {"t": ("failed", 2)})
+
+        score = history.flakiness()["t"]
+
+        assert (score["flaky_runs"], score["failures"], score["reruns"]) == (0, 2, 4)
+
+    def test_skipped_runs_are_ignored(self, history):
+        record(history, {"t": "passed"}, {"t": "skipped"}, {"t": "passed"})
+
+        assert history.flakiness()["t"]["runs"] == 2
+        assert history.flakiness()["t"]["score"] == 0.0
+
+    def test_only_the_recent_window_counts(self, history):
+        record(history, {"t": "failed"}, {"t": "passed"}, {"t": "passed"}, {"t": "passed"})
+
+        assert history.flakiness(runs=3)["t"]["score"] == 0.0
+        assert history.flakiness(runs=4)["t"]["score"] == 0.25
+
+
+class TestChronicFlakes:
+    """FlakyTests.chronic: which scores go to quarantine"""
+
+    SCORES = {
+        "at_threshold": {"runs": 5, "score": 0.2},
+        "below_threshold": {"runs": 10, "score": 0.19},
+        "too_few_runs": {"runs": 4, "score": 1.0},
+        "very_flaky": {"runs": 20, "score": 0.5},
+    }
+
+    def test_threshold_and_min_runs_are_inclusive(self):
+        assert FlakyTests.chronic(self.SCORES, threshold=0.2, min_runs=5) == ["at_threshold", "very_flaky"]
+
+    def test_zero_is_a_threshold_not_the_default(self):
+        assert FlakyTests.chronic(self.SCORES, threshold=0, min_runs=0) == sorted(self.SCORES)
+
+    def test_no_scores_no_quarantine(self):
+        assert FlakyTests.chronic({}, threshold=0.2, min_runs=5) == []
+
+
+class TestTransientTypes:
+    """FlakyTests.transient_types: POS_TRANSIENT_EXCEPTIONS names resolved to selenium exceptions"""
+
+    def test_names_resolve_to_selenium_exceptions(self, monkeypatch):
+        from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+        monkeypatch.setattr(config, "TRANSIENT_EXCEPTIONS", ("StaleElementReferenceException", "TimeoutException"))
+
+        assert FlakyTests.transient_types() == (StaleElementReferenceException, TimeoutException)
+
+    def test_unknown_names_are_a_clear_error(self, monkeypatch):
+        monkeypatch.setattr(config, "TRANSIENT_EXCEPTIONS", ("TimeoutException", "StaleElementException", "By"))
+
+        with pytest.raises(ValueError, match="not a selenium exception: StaleElementException, By"):
+            FlakyTests.transient_types()
@@ -0,0 +1,69 @@
+from selenium.common.exceptions import WebDriverException
+from utils.load_runner import LoadRunner
+
+
+class FakePool:
+    """Hands out placeholder drivers and remembers what came back"""
+
+    def __init__(self, spare=True):
+        self.spare = spare
+        self.leased = 0
+        self.released = []
+
+    def lease(self):
+        if self.leased and not self.spare:
+            raise RuntimeError("no browser")
+        self.leased += 1
+        return f"driver-{self.leased}"
+
+    def release(self, driver, recycle=False):
+        self.released.append((driver, recycle))
+
+    def close(self):
+        pass
+
+
+class FailingRunner(LoadRunner):
+    """Every iteration raises error, inside a step when step is given"""
+
+    def __init__(self, error, step=None, **kwargs):
+        super().__init__(users=1, ramp_up=0, duration=0.05, think_time=0, **kwargs)
+        self.error = error
+        self.step_name = step
+
+    def checkout_flow(self, driver, think):
+        if self.step_name:
+            with self.step(self.step_name):
+                raise self.error
+        raise self.error
+
+
+class TestVirtualUserErrors:
+    """Failed iterations are counted once and never leak the browser"""
+
+    def test_error_outside_a_step_is_counted_under_iteration(self):
+        pool = FakePool()
+
+        results = FailingRunner(KeyError("total"), pool=pool).run()
+
+        assert set(results["errors"]) == {"iteration"}
+        assert results["errors"]["iteration"]["KeyError"] == results["iterations"]["started"] > 0
+        assert results["iterations"]["users_stopped"] == 0
+        assert pool.released == [("driver-1", False)]
+
+    def test_error_inside_a_step_is_counted_once(self):
+        results = FailingRunner(ValueError("bad price"), step="add_to_cart", pool=FakePool()).run()
+
+        assert set(results["errors"]) == {"add_to_cart"}
+        assert results["steps"]["add_to_cart"]["errors"] == results["iterations"]["started"]
+
+    def test_dead_browser_without_replacement_stops_the_user(self, monkeypatch):
+        monkeypatch.setattr("utils.load_runner.DriverPool.is_healthy", staticmethod(lambda driver: False))
+        pool = FakePool(spare=False)
+
+        results = FailingRunner(WebDriverException("gone"), step="login", pool=pool).run()
+
+        assert results["iterations"]["started"] == 1
+        assert results["iterations"]["users_stopped"] == 1
+        assert results["errors"]["replace_browser"] == {"RuntimeError": 1}
+        assert pool.released == [("driver-1", True)]
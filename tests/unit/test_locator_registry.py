@@ -0,0 +1,32 @@
+import pytest
+from utils.locator_registry import xpath_to_css
+
+
+class TestXpathToCss:
+    """XPath locators the registry rewrites as CSS, and the ones it must leave alone"""
+
+    @pytest.mark.parametrize("xpath, css", [
+        ('//*[@id="root"]/div/main', "#root > div > main"),
+        ("//button[@type='submit']", 'button[type="submit"]'),
+        ('//*[@id="root"]/div/div[2]/div/button[1]', "#root > div > div:nth-of-type(2) > div > button:nth-of-type(1)"),
+        ("//*[3]", ":nth-child(3)"),
+        ("//form//input", "form input"),
+        ("//div/*[2]", "div > :nth-child(2)"),
+        ('//input[@data-test="search"][@type="text"]', 'input[data-test="search"][type="text"]'),
+        ('//div[@id="main content"]', 'div[id="main content"]'),
+    ])
+    def test_converts_plain_paths(self, xpath, css):
+        assert xpath_to_css(xpath) == css
+
+    @pytest.mark.parametrize("xpath", [
+        "//h1[normalize-space()='Sales Reports']",
+        "//button[text()='Add']",
+        "//div[contains(@class, 'card')]",
+        "//li[2][@class='active']",
+        "//div/following-sibling::span",
+        "//div/..",
+        "/html/body",
+        "(//button)[1]",
+    ])
+    def test_leaves_other_xpath_alone(self, xpath):
+        assert xpath_to_css(xpath) is None
@@ -0,0 +1,51 @@
+import os
+import xml.etree.ElementTree as ElementTree
+
+pytest_plugins = ["pytester"]
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+PERF_TEST = """
+import pytest
+from config.config import config
+
+# Keep the run out of the real history
+config.HISTORY_PATH = {history!r}
+
+
+class FakeDriver:
+    \"\"\"Answers the perf scripts: mark() gets a mark id, collect() (called with it) the metrics\"\"\"
+
+    def execute_script(self, script, *args):
+        return {{"lcp_ms": 1234, "load_ms": 800, "long_tasks": 1}} if args else 1
+
+
+@pytest.fixture
+def driver():
+    return FakeDriver()
+
+
+@pytest.mark.perf_budget(lcp_ms=2500)
+def test_within_budget(driver):
+    pass
+"""
+
+
+class TestPerfMetricsReporting:
+    """perf_budget metrics travel through the real hooks to the terminal summary and JUnit XML"""
+
+    def test_metrics_reach_timing_report_and_junit(self, pytester, monkeypatch, tmp_path):
+        monkeypatch.setenv("PYTHONPATH", ROOT)
+        monkeypatch.setenv("POS_REPORT_STORE", "false")
+        monkeypatch.setenv("POS_IMPACT_MAP", "false")
+        with open(os.path.join(ROOT, "conftest.py"), encoding="utf-8") as file:
+            pytester.makeconftest(file.read())
+        pytester.makepyfile(test_perf=PERF_TEST.format(history=str(tmp_path / "history.sqlite")))
+
+        result = pytester.runpytest_subprocess("-p", "no:cacheprovider", "--junitxml=junit.xml")
+
+        result.assert_outcomes(passed=1)
+        # Printed only when the timing report has perf entries
+        result.stdout.fnmatch_lines(["*browser performance*", "LCP 1234ms*test_perf.py::test_within_budget"])
+        properties = ElementTree.parse(str(pytester.path / "junit.xml")).getroot().iter("property")
+        assert "perf_metrics" in [prop.get("name") for prop in properties]
@@ -0,0 +1,91 @@
+import pytest
+from utils.scheduling import TestScheduler
+
+
+class FakeItem:
+    """Just enough of a pytest item for the scheduler: a nodeid and an optional xdist_group"""
+
+    def __init__(self, nodeid, group=None):
+        self.nodeid = nodeid
+        self.group = group
+
+    def get_closest_marker(self, name):
+        if name == "xdist_group" and self.group:
+            return pytest.mark.xdist_group(self.group).mark
+        return None
+
+    def __repr__(self):
+        return self.nodeid
+
+
+def loads(shards, durations):
+    return [sum(durations[TestScheduler.plain_nodeid(item.nodeid)] for item in shard) for shard in shards]
+
+
+class TestPartition:
+    """Duration-balanced, deterministic shards (longest processing time first)"""
+
+    def test_longest_first_balances_the_shards(self):
+        durations = {"a": 5.0, "b": 4.0, "c": 3.0, "d": 3.0, "e": 2.0, "f": 1.0}
+        items = [FakeItem(nodeid) for nodeid in durations]
+
+        shards = TestScheduler.partition(items, 2, durations)
+
+        assert loads(shards, durations) == [9.0, 9.0]
+        assert sorted(item.nodeid for shard in shards for item in shard) == sorted(durations)
+
+    def test_shards_keep_collection_order(self):
+        durations = {"a": 1.0, "b": 5.0, "c": 1.0, "d": 4.0}
+        items = [FakeItem(nodeid) for nodeid in durations]
+
+        for shard in TestScheduler.partition(items, 2, durations):
+            assert shard == sorted(shard, key=items.index)
+
+    def test_every_host_computes_the_same_split(self):
+        durations = {"a": 2.0, "b": 2.0, "c": 2.0, "d": 1.0, "e": 1.0}
+        items = [FakeItem(nodeid) for nodeid in durations]
+
+        forward = TestScheduler.partition(items, 3, durations)
+        backward = TestScheduler.partition(list(reversed(items)), 3, durations)
+
+        assert [sorted(map(repr, shard)) for shard in forward] == [sorted(map(repr, shard)) for shard in backward]
+
+    def test_xdist_group_stays_on_one_shard(self):
+        durations = {"t1": 3.0, "t2": 3.0, "t3": 3.0, "s1": 4.0, "s2": 4.0}
+        items = [FakeItem(nodeid, "transactions") for nodeid in ("t1", "t2", "t3")]
+        items += [FakeItem("s1"), FakeItem("s2")]
+
+        shards = TestScheduler.partition(items, 2, durations)
+
+        grouped = [shard for shard in shards if any(item.group for item in shard)]
+        assert len(grouped) == 1 and [item.nodeid for item in grouped[0]] == ["t1", "t2", "t3"]
+        # The group weighs 9s as one unit, so both single tests go to the other shard
+        assert sorted(loads(shards, durations)) == [8.0, 9.0]
+
+    def test_loadgroup_suffix_is_ignored_for_lookups(self):
+        durations = {"tests/a.py::test_long": 10.0, "tests/a.py::test_short": 1.0, "tests/b.py::test_mid": 9.0}
+        items = [
+            FakeItem("tests/a.py::test_long@slow", "slow"),
+            FakeItem("tests/a.py::test_short"),
+            FakeItem("tests/b.py::test_mid"),
+        ]
+
+        shards = TestScheduler.partition(items, 2, durations)
+
+        assert sorted(loads(shards, durations)) == [10.0, 10.0]
+
+    def test_unknown_tests_weigh_the_median(self):
+        durations = {"a": 1.0, "b": 2.0, "c": 9.0}
+        items = [FakeItem(nodeid) for nodeid in ("a", "b", "c", "new")]
+
+        shards = TestScheduler.partition(items, 2, durations)
+
+        # "new" counts as 2s: c (9s) alone on one shard, a + b + new (5s) on the other
+        assert sorted(sorted(item.nodeid for item in shard) for shard in shards) == [["a", "b", "new"], ["c"]]
+
+    def test_more_shards_than_tests(self):
+        items = [FakeItem("a"), FakeItem("b")]
+
+        shards = TestScheduler.partition(items, 4, {})
+
+        assert [len(shard) for shard in shards] == [1, 1, 0, 0]
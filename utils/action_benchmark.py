@@ -0,0 +1,144 @@
+import json
+import os
+from datetime import datetime
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.stats import LatencyStats
+from config.config import config
+
+
+class ActionBenchmark:
+    """
+    Input-to-DOM-update latency of UI actions, measured inside the page.
+
+    measure() arms a probe, runs the action through a page object and
+    reads back the latency: from the timeStamp of the first matching input
+    event (keydown, change, click...) to the first DOM mutation after it,
+    both on the page's performance.now() clock, so WebDriver round-trips
+    are not counted. With alert=True the probe stops when the app calls
+    window.alert instead (e.g. a completed transaction). run() repeats a
+    sample after some warmup rounds and keeps the summary per benchmark;
+    compare() checks p95 against the stored baselines.
+    """
+
+    ARM_SCRIPT = """
+        var events = arguments[0], alert = arguments[1];
+        var probe = window.__posBench = {start: null, end: null};
+        var onInput = function (event) { if (probe.start === null) probe.start = event.timeStamp; };
+        var finish = function () {
+            if (probe.start === null || probe.end !== null) return;
+            probe.end = performance.now();
+            observer.disconnect();
+            events.forEach(function (type) { document.removeEventListener(type, onInput, true); });
+        };
+        var observer = new MutationObserver(finish);
+        events.forEach(function (type) { document.addEventListener(type, onInput, true); });
+        if (alert) {
+            var original = window.alert;
+            window.alert = function () {
+                finish();
+                window.alert = original;
+                return original.apply(window, arguments);
+            };
+        } else {
+            // body, not the updated element: apps may replace that element while rendering
+            observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+        }
+    """
+
+    READ_SCRIPT = """
+        var probe = window.__posBench;
+        return probe && probe.end !== null ? probe.end - probe.start : null;
+    """
+
+    # name -> {"summary": ..., "samples_ms": [...], "missed": n}
+    results = {}
+
+    @classmethod
+    def measure(cls, driver, action, events, alert=False, timeout=None):
+        """Milliseconds from the action's input event to the DOM update, or None when nothing changed in time"""
+        driver.execute_script(cls.ARM_SCRIPT, list(events), alert)
+        action()
+        timeout = timeout or config.SETTLE_TIMEOUT
+        if alert:
+            try:
+                WebDriverWait(driver, timeout, poll_frequency=config.POLL_INTERVAL).until(EC.alert_is_present())
+            except TimeoutException:
+                return None
+            # The probe has already stopped; the alert only blocks reading it
+            driver.switch_to.alert.accept()
+        def finished(driver):
+            ms = driver.execute_script(cls.READ_SCRIPT)
+            # In a list, so a 0.0ms reading still ends the wait
+            return None if ms is None else [ms]
+
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=config.POLL_INTERVAL).until(finished)[0]
+        except TimeoutException:
+            return None
+
+    @classmethod
+    def run(cls, name, sample, iterations=None, warmup=None):
+        """
+        Call sample() warmup + iterations times; sample returns ms or None.
+
+        Warmup rounds are discarded. Returns the summary (count, mean,
+        p50/p90/p95/p99, max in ms) and keeps it in results[name].
+        """
+        iterations = iterations or config.BENCHMARK_ITERATIONS
+        warmup = config.BENCHMARK_WARMUP if warmup is None else warmup
+        for _ in range(warmup):
+            sample()
+        samples = [sample() for _ in range(iterations)]
+        measured = [ms for ms in samples if ms is not None]
+        summary = LatencyStats.summarize([ms / 1000 for ms in measured])
+        cls.results[name] = {
+            "summary": summary,
+            "samples_ms": [round(ms, 3) for ms in measured],
+            "missed": len(samples) - len(measured),
+        }
+        return summary
+
+    @staticmethod
+    def load_baselines(path=None):
+        try:
+            with open(path or config.BENCHMARK_BASELINES, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    @classmethod
+    def compare(cls, name, baselines, threshold=None):
+        """A message when name's p95 is more than threshold slower than its baseline, else None"""
+        threshold = config.BENCHMARK_THRESHOLD if threshold is None else threshold
+        baseline = baselines.get(name)
+        current = cls.results.get(name, {}).get("summary", {})
+        if not baseline or "p95_ms" not in current:
+            return None
+        if current["p95_ms"] > baseline["p95_ms"] * (1 + threshold):
+            return (
+                f"{name}: p95 {current['p95_ms']:.1f}ms vs baseline {baseline['p95_ms']:.1f}ms "
+                f"(more than {threshold:.0%} slower)"
+            )
+        return None
+
+    @classmethod
+    def write(cls, directory=None):
+        """Write benchmarks.json into directory (default REPORTS_PATH) and return its path"""
+        directory = directory or config.REPORTS_PATH
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, "benchmarks.json")
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"finished_at": datetime.now().isoformat(timespec="seconds"), "benchmarks": cls.results}, file, indent=2)
+        return path
+
+    @classmethod
+    def save_baselines(cls, path=None):
+        """Store this run's summaries as the new baselines (merged with benchmarks that did not run)"""
+        path = path or config.BENCHMARK_BASELINES
+        baselines = cls.load_baselines(path)
+        baselines.update({name: result["summary"] for name, result in cls.results.items() if result["summary"]["count"]})
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(dict(sorted(baselines.items())), file, indent=2)
+        return path
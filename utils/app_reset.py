@@ -0,0 +1,102 @@
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+from utils.locator_registry import LocatorRegistry
+from config.config import config
+
+
+class AppReset:
+    """
+    Bring a browser session back to the app's start screen with clean state.
+
+    "soft" clears storage and cookies and re-renders the start screen in a
+    single script call through the app's window.__posReset hook, without
+    reloading the bundle. It falls back to "hard" when the app has no hook
+    or looks broken: a different page is loaded, the document is not fully
+    loaded, the root element is empty, or an alert is open. "hard" is the
+    original full navigation to BASE_URL with cookies and storage cleared.
+    """
+
+    STRATEGIES = ("soft", "hard")
+
+    SOFT_RESET_SCRIPT = """
+        var origin = arguments[0];
+        if (window.location.origin !== origin || document.readyState !== "complete") return "unavailable";
+        var root = document.getElementById("root");
+        if (typeof window.__posReset !== "function" || !root || !root.children.length) return "unavailable";
+        document.cookie.split(";").forEach(function (cookie) {
+            var name = cookie.split("=")[0].trim();
+            if (name) document.cookie = name + "=; expires=Thu, 01 Jan 1970 00:00:00 GMT; path=/";
+        });
+        try {
+            window.__posReset(arguments[1]);
+        } catch (e) {
+            return "broken";
+        }
+        return "ok";
+    """
+
+    CLEAR_SCRIPT = """
+        var dirty = window.localStorage.length + window.sessionStorage.length;
+        window.localStorage.clear();
+        window.sessionStorage.clear();
+        return dirty;
+    """
+
+    @staticmethod
+    def strategy_for(node):
+        """The reset_strategy marker of a test (or its class/module), else POS_RESET_STRATEGY"""
+        marker = node.get_closest_marker("reset_strategy")
+        strategy = marker.args[0] if marker and marker.args else config.RESET_STRATEGY
+        if strategy not in AppReset.STRATEGIES:
+            raise ValueError(f"Unknown reset strategy {strategy!r}, expected one of {AppReset.STRATEGIES}")
+        return strategy
+
+    @classmethod
+    def reset(cls, driver, strategy=None, storage=None):
+        """Reset to the start screen; returns the strategy that was actually used"""
+        LocatorRegistry.forget(driver)
+        if (strategy or config.RESET_STRATEGY) == "soft" and cls.soft_reset(driver, storage):
+            return "soft"
+        cls.hard_reset(driver, storage)
+        return "hard"
+
+    @classmethod
+    def soft_reset(cls, driver, storage=None):
+        try:
+            return driver.execute_script(cls.SOFT_RESET_SCRIPT, cls._origin(), storage or {}) == "ok"
+        except WebDriverException:
+            # e.g. an unexpected alert is open; the hard reset starts from a new page load
+            cls._dismiss_alert(driver)
+            return False
+
+    @classmethod
+    def hard_reset(cls, driver, storage=None):
+        driver.get(config.BASE_URL)
+        driver.delete_all_cookies()
+        # A session released by a soft-reset test may still carry its state
+        if driver.execute_script(cls.CLEAR_SCRIPT) or storage:
+            if storage:
+                driver.execute_script(
+                    "var items = arguments[0];"
+                    "Object.keys(items).forEach(function (key) { window.localStorage.setItem(key, items[key]); });",
+                    storage,
+                )
+            driver.get(config.BASE_URL)
+
+    @classmethod
+    def clear(cls, driver):
+        """The original teardown: clear cookies and storage of the current page"""
+        driver.delete_all_cookies()
+        driver.execute_script(cls.CLEAR_SCRIPT)
+
+    @staticmethod
+    def _origin():
+        parts = urlsplit(config.BASE_URL)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    @staticmethod
+    def _dismiss_alert(driver):
+        try:
+            driver.switch_to.alert.dismiss()
+        except WebDriverException:
+            pass
@@ -0,0 +1,155 @@
+import hashlib
+import io
+import json
+import os
+import queue
+import re
+import threading
+from html import escape
+from selenium.common.exceptions import WebDriverException
+from config.config import config
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; without it the report shows the full screenshot scaled down
+    Image = None
+
+
+class ArtifactWriter:
+    """
+    Failure artifacts written by background threads.
+
+    capture() takes the screenshot PNG, page source and browser console
+    log from the driver; that part has to run on the test thread. submit()
+    names the files and hands the writing to ``workers`` threads through a
+    bounded queue (a full queue makes the test thread wait instead of
+    growing memory). Screenshots are named by content hash, so identical
+    screenshots are stored once. With Pillow installed a small JPEG
+    thumbnail is made for the HTML report. close() waits for the queue
+    to drain.
+    """
+
+    THUMBNAIL_SIZE = (320, 180)
+
+    def __init__(self, directory=None, workers=None, queue_size=None):
+        self.directory = directory or config.SCREENSHOTS_PATH
+        self._queue = queue.Queue(maxsize=queue_size or config.ARTIFACT_QUEUE_SIZE)
+        self._threads = [
+            threading.Thread(target=self._work, name=f"artifact-writer-{index}", daemon=True)
+            for index in range(workers or config.ARTIFACT_WORKERS)
+        ]
+        self._written = set()
+        self._lock = threading.Lock()
+        self._counts = {"screenshots": 0, "duplicates": 0, "errors": 0}
+        os.makedirs(self.directory, exist_ok=True)
+        for thread in self._threads:
+            thread.start()
+
+    @staticmethod
+    def capture(driver):
+        """Screenshot PNG, page source and console entries of the current page (None where unavailable)"""
+        captured = {"png": None, "source": None, "console": None}
+        try:
+            captured["png"] = driver.get_screenshot_as_png()
+            captured["source"] = driver.page_source
+        except WebDriverException:
+            pass  # e.g. an alert is open
+        try:
+            captured["console"] = driver.get_log("browser")
+        except (WebDriverException, AttributeError, ValueError):
+            pass  # browsers without the logging capability
+        return captured
+
+    def submit(self, name, captured):
+        """Queue captured artifacts for writing; returns {kind: path} of the files that will exist"""
+        base = re.sub(r"[^\w.-]+", "_", name)
+        paths = {}
+        jobs = []
+        if captured.get("png"):
+            digest = hashlib.sha256(captured["png"]).hexdigest()[:16]
+            paths["screenshot"] = os.path.join(self.directory, f"{digest}.png")
+            paths["thumbnail"] = os.path.join(self.directory, f"{digest}_thumb.jpg") if Image else paths["screenshot"]
+            jobs.append(("screenshot", paths["screenshot"], (captured["png"], paths["thumbnail"])))
+        if captured.get("source"):
+            paths["dom"] = os.path.join(self.directory, f"{base}.html")
+            jobs.append(("text", paths["dom"], captured["source"]))
+        if captured.get("console"):
+            paths["console"] = os.path.join(self.directory, f"{base}_console.json")
+            jobs.append(("json", paths["console"], captured["console"]))
+        for job in jobs:
+            self._queue.put(job)
+        return paths
+
+    def close(self):
+        """Wait until every queued artifact is written, then stop the threads"""
+        self._queue.join()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counts)
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._write(*job)
+            except Exception:
+                self._count("errors")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, kind, path, content):
+        if kind == "screenshot":
+            with self._lock:
+                duplicate = path in self._written or os.path.exists(path)
+                self._written.add(path)
+            if duplicate:
+                self._count("duplicates")
+                return
+            png, thumbnail_path = content
+            with open(path, "wb") as file:
+                file.write(png)
+            if thumbnail_path != path:
+                self._write_thumbnail(thumbnail_path, png)
+            self._count("screenshots")
+        elif kind == "json":
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(content, file, indent=2)
+        else:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(content)
+
+    def _write_thumbnail(self, path, png):
+        image = Image.open(io.BytesIO(png)).convert("RGB")
+        image.thumbnail(self.THUMBNAIL_SIZE)
+        image.save(path, "JPEG", quality=70, optimize=True)
+
+    def _count(self, key):
+        with self._lock:
+            self._counts[key] += 1
+
+    @staticmethod
+    def report_extras(paths, report_dir):
+        """pytest-html extras for the artifacts: a linked thumbnail, plus links to the DOM and console log"""
+        from pytest_html import extras
+
+        def relative(path):
+            return os.path.relpath(path, report_dir).replace(os.sep, "/")
+
+        result = []
+        if "screenshot" in paths:
+            result.append(extras.html(
+                f'<div class="image"><a href="{escape(relative(paths["screenshot"]))}">'
+                f'<img src="{escape(relative(paths["thumbnail"]))}" style="max-width:320px" alt="screenshot"></a></div>'
+            ))
+        if "dom" in paths:
+            result.append(extras.url(relative(paths["dom"]), name="DOM snapshot"))
+        if "console" in paths:
+            result.append(extras.url(relative(paths["console"]), name="Console log"))
+        return result
@@ -0,0 +1,229 @@
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urljoin, urlsplit
+from config.config import config
+
+try:
+    import fcntl
+except ImportError:  # Windows: the index lock only covers threads of this process
+    fcntl = None
+
+
+class AssetCache:
+    """
+    Content-addressed store for static responses.
+
+    Bodies are stored once under their sha256 (blobs/ab/abcd...), and an
+    index maps each URL to its digest and content type, so assets shared by
+    several URLs take space once and the cache survives between runs.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or config.ASSET_CACHE_PATH
+        self._index_path = os.path.join(self.directory, "index.json")
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self._index = self._read_index()
+
+    def get(self, url):
+        """Return (content_type, body) for a cached url, or None"""
+        entry = self._index.get(url)
+        if entry is None:
+            return None
+        try:
+            with open(self._blob_path(entry["sha256"]), "rb") as file:
+                return entry["content_type"], file.read()
+        except OSError:
+            return None
+
+    def put(self, url, content_type, body):
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._write_atomic(path, body)
+        with self._index_lock():
+            # Other processes (pytest-xdist workers) may have added entries since this one loaded the index
+            self._index = {**self._read_index(), **self._index, url: {"sha256": digest, "content_type": content_type}}
+            self._write_atomic(self._index_path, json.dumps(self._index).encode("utf-8"))
+
+    def _read_index(self):
+        try:
+            with open(self._index_path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    @contextmanager
+    def _index_lock(self):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self._index_path + ".lock", "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _write_atomic(path, data):
+        # Readers see either the old file or the complete new one, never a partial write
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+    def _blob_path(self, digest):
+        return os.path.join(self.directory, "blobs", digest[:2], digest)
+
+
+class _AssetProxyHandler(BaseHTTPRequestHandler):
+    """Forward requests to the upstream app, serving cacheable assets from AssetCache"""
+
+    # Hop-by-hop headers are never forwarded
+    HOP_HEADERS = {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "te", "trailer", "upgrade"}
+
+    def __init__(self, *args, proxy, **kwargs):
+        self.proxy = proxy
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        self._handle(send_body=True)
+
+    def do_HEAD(self):
+        self._handle(send_body=False)
+
+    def do_POST(self):
+        self._forward(send_body=True)
+
+    def _handle(self, send_body):
+        url = self.proxy.upstream_url(self.path)
+        if self.proxy.is_blocked(url):
+            self.proxy.count("blocked")
+            self.send_response(204)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if not self.proxy.is_cacheable(url):
+            self._forward(send_body)
+            return
+
+        cached = self.proxy.cache.get(url)
+        if cached is not None:
+            self.proxy.count("hits")
+            content_type, body = cached
+            self._reply(200, {"Content-Type": content_type}, body, send_body)
+            return
+
+        self.proxy.count("misses")
+        status, headers, body = self._fetch(url)
+        # A HEAD response has no body, so only GETs fill the cache
+        if status == 200 and self.command == "GET":
+            # headers is an http.client.HTTPMessage, so lookups ignore case
+            self.proxy.cache.put(url, headers.get("Content-Type", "application/octet-stream"), body)
+        self._reply(status, headers, body, send_body)
+
+    def _forward(self, send_body):
+        status, headers, body = self._fetch(self.proxy.upstream_url(self.path))
+        self._reply(status, headers, body, send_body)
+
+    def _fetch(self, url):
+        length = int(self.headers.get("Content-Length") or 0)
+        data = self.rfile.read(length) if length else None
+        headers = {
+            name: value for name, value in self.headers.items()
+            if name.lower() not in self.HOP_HEADERS | {"host", "accept-encoding", "content-length"}
+        }
+        # Ask for an uncompressed body so it can be stored and re-served as is
+        headers["Accept-Encoding"] = "identity"
+        request = urllib.request.Request(url, data=data, headers=headers, method=self.command)
+        try:
+            with urllib.request.urlopen(request, timeout=config.EXPLICIT_WAIT) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as error:
+            return error.code, error.headers, error.read()
+
+    def _reply(self, status, headers, body, send_body):
+        self.send_response(status)
+        for name, value in headers.items():
+            if name.lower() not in self.HOP_HEADERS | {"content-length", "content-encoding"}:
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AssetProxy:
+    """
+    Local caching front for the app under test.
+
+    Serves BASE_URL's origin on localhost: static assets (ASSET_CACHE_PATTERNS)
+    come from a content-addressed cache after the first fetch, requests
+    matching BLOCKED_URL_PATTERNS get an empty 204, and everything else is
+    forwarded. Third-party origins never reach the proxy; DriverManager
+    blocks those in the browser. Hit/miss/blocked counts are in stats().
+    """
+
+    def __init__(self, upstream=None, host=None, port=0, cache=None):
+        self.upstream = upstream or config.BASE_URL
+        self.host = host or config.LOCAL_APP_HOST
+        self.port = port
+        self.cache = cache or AssetCache()
+        self._counts = {"hits": 0, "misses": 0, "blocked": 0}
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/"
+
+    def upstream_url(self, path):
+        return urljoin(self.upstream, path)
+
+    @staticmethod
+    def is_blocked(url):
+        if not config.BLOCK_REQUESTS:
+            return False
+        return any(fnmatch.fnmatch(url, pattern) for pattern in config.BLOCKED_URL_PATTERNS)
+
+    @staticmethod
+    def is_cacheable(url):
+        path = urlsplit(url).path
+        return any(fnmatch.fnmatch(path, pattern) for pattern in config.ASSET_CACHE_PATTERNS)
+
+    def count(self, key):
+        with self._lock:
+            self._counts[key] += 1
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counts)
+
+    def start(self):
+        """Start serving on a background thread; port 0 picks a free port"""
+        handler = partial(_AssetProxyHandler, proxy=self)
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="asset-proxy", daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,220 @@
+import csv
+import io
+import json
+import os
+from typing import Callable, Dict, Iterator, NamedTuple, Optional
+from utils.impact_map import ImpactRecorder
+
+
+class RowRef(NamedTuple):
+    """
+    Lightweight handle to one data row, used as a pytest parameter.
+
+    Line-based formats (CSV, JSONL) only keep the byte offset of the record
+    and read it back when the test runs. JSON and Parquet rows cannot be
+    addressed by offset, so their refs carry the row itself.
+    """
+    path: str
+    offset: int
+    id: str
+    row: Optional[Dict] = None
+
+
+def _to_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "y")
+
+
+class DataProvider:
+    """Lazily stream data-driven rows from CSV, JSON, JSONL and Parquet files"""
+
+    COERCERS: Dict[str, Callable] = {"str": str, "int": int, "float": float, "bool": _to_bool}
+
+    # CSV headers by path, so resolving a RowRef does not re-read the header each time
+    _headers = {}
+
+    @staticmethod
+    def data_path(filename: str) -> str:
+        """Resolve a file name relative to the data directory (absolute paths pass through)"""
+        if os.path.isabs(filename):
+            return filename
+        return os.path.join(os.path.dirname(__file__), "..", "data", filename)
+
+    @staticmethod
+    def stream(filename: str, types: Optional[Dict] = None, limit: Optional[int] = None,
+               key: Optional[str] = None) -> Iterator[Dict]:
+        """Yield rows one at a time, coercing columns listed in types"""
+        path = DataProvider.data_path(filename)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Data file not found: {path}")
+        if ImpactRecorder.enabled:
+            ImpactRecorder.record_data(path)
+
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".csv":
+            rows = DataProvider._stream_csv(path)
+        elif extension == ".jsonl":
+            rows = DataProvider._stream_jsonl(path)
+        elif extension == ".json":
+            rows = DataProvider._stream_json(path, key)
+        elif extension == ".parquet":
+            rows = DataProvider._stream_parquet(path)
+        else:
+            raise ValueError(f"Unsupported data file format: {filename}")
+
+        for count, row in enumerate(rows):
+            if limit is not None and count >= limit:
+                break
+            yield DataProvider.coerce(row, types)
+
+    @staticmethod
+    def row_refs(filename: str, limit: Optional[int] = None, id_field: str = "test_case",
+                 key: Optional[str] = None) -> Iterator[RowRef]:
+        """Yield a RowRef per row, suitable for parametrizing tests without keeping rows in memory"""
+        path = DataProvider.data_path(filename)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Data file not found: {path}")
+
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".csv":
+            refs = DataProvider._csv_refs(path, id_field)
+        elif extension == ".jsonl":
+            refs = DataProvider._jsonl_refs(path, id_field)
+        else:
+            refs = (
+                RowRef(path, index, DataProvider._row_id(row, id_field, index), row)
+                for index, row in enumerate(DataProvider.stream(path, key=key))
+            )
+
+        for count, ref in enumerate(refs):
+            if limit is not None and count >= limit:
+                break
+            yield ref
+
+    @staticmethod
+    def resolve(ref: RowRef, types: Optional[Dict] = None) -> Dict:
+        """Load the row a RowRef points to"""
+        if ImpactRecorder.enabled:
+            ImpactRecorder.record_data(ref.path)
+        if ref.row is not None:
+            return DataProvider.coerce(dict(ref.row), types)
+
+        with open(ref.path, "rb") as file:
+            file.seek(ref.offset)
+            if ref.path.lower().endswith(".jsonl"):
+                row = json.loads(file.readline())
+            else:
+                _, record = next(DataProvider._csv_records(file))
+                values = next(csv.reader(io.StringIO(record.decode("utf-8"))))
+                row = dict(zip(DataProvider._csv_header(ref.path), values))
+        return DataProvider.coerce(row, types)
+
+    @staticmethod
+    def coerce(row: Dict, types: Optional[Dict] = None) -> Dict:
+        """Convert the columns named in types; empty strings become None"""
+        if not types:
+            return row
+        for column, column_type in types.items():
+            if column not in row:
+                continue
+            converter = DataProvider.COERCERS.get(column_type, column_type)
+            value = row[column]
+            row[column] = None if value in ("", None) else converter(value)
+        return row
+
+    # Format readers
+    @staticmethod
+    def _stream_csv(path):
+        with open(path, "r", encoding="utf-8", newline="") as file:
+            yield from csv.DictReader(file)
+
+    @staticmethod
+    def _stream_jsonl(path):
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    @staticmethod
+    def _stream_json(path, key=None):
+        # The stdlib json module has no incremental parser, so the document is loaded whole
+        with open(path, "r", encoding="utf-8") as file:
+            document = json.load(file)
+        if isinstance(document, dict):
+            if key is None:
+                lists = [value for value in document.values() if isinstance(value, list)]
+                if len(lists) != 1:
+                    raise ValueError(f"Pass key= to choose the list of rows in {path}")
+                document = lists[0]
+            else:
+                document = document[key]
+        yield from document
+
+    @staticmethod
+    def _stream_parquet(path):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet data files requires pyarrow (pip install pyarrow)") from None
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=1024):
+            yield from batch.to_pylist()
+
+    # Offset indexing for line-based formats
+    @staticmethod
+    def _csv_records(file):
+        """Yield (offset, bytes) per CSV record, keeping quoted newlines inside one record"""
+        offset = file.tell()
+        start = offset
+        record = b""
+        for line in iter(file.readline, b""):
+            if not record:
+                start = offset
+            record += line
+            offset += len(line)
+            if record.count(b'"') % 2 == 0:
+                yield start, record
+                record = b""
+        if record:
+            yield start, record
+
+    @staticmethod
+    def _csv_header(path):
+        header = DataProvider._headers.get(path)
+        if header is None:
+            with open(path, "r", encoding="utf-8", newline="") as file:
+                header = next(csv.reader(file))
+            DataProvider._headers[path] = header
+        return header
+
+    @staticmethod
+    def _csv_refs(path, id_field):
+        header = DataProvider._csv_header(path)
+        id_column = header.index(id_field) if id_field in header else None
+        with open(path, "rb") as file:
+            records = DataProvider._csv_records(file)
+            next(records, None)  # header
+            for index, (offset, record) in enumerate(records):
+                if not record.strip():
+                    continue
+                row_id = f"row{index}"
+                if id_column is not None:
+                    values = next(csv.reader(io.StringIO(record.decode("utf-8"))))
+                    if id_column < len(values) and values[id_column]:
+                        row_id = values[id_column]
+                yield RowRef(path, offset, row_id)
+
+    @staticmethod
+    def _jsonl_refs(path, id_field):
+        with open(path, "rb") as file:
+            offset = 0
+            for index, line in enumerate(iter(file.readline, b"")):
+                if line.strip():
+                    row_id = DataProvider._row_id(json.loads(line), id_field, index)
+                    yield RowRef(path, offset, row_id)
+                offset += len(line)
+
+    @staticmethod
+    def _row_id(row, id_field, index):
+        value = row.get(id_field) if isinstance(row, dict) else None
+        return str(value) if value not in (None, "") else f"row{index}"
@@ -1,24 +1,65 @@
 import csv
 import os
+import threading
 from typing import List, Dict
+from utils.impact_map import ImpactRecorder
 
 
 class DataReader:
+    # Parsed data files, keyed by path: (mtime_ns, rows, rows indexed by test_case)
+    _cache = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _data_path(filename: str) -> str:
+        return os.path.join(os.path.dirname(__file__), "..", "data", filename)
+
+    @staticmethod
+    def _load(filename: str):
+        """Parse a CSV file once per process, re-parsing only when its mtime changes"""
+        data_path = DataReader._data_path(filename)
+        if ImpactRecorder.enabled:
+            ImpactRecorder.record_data(data_path)
+
+        try:
+            mtime = os.stat(data_path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Data file not found: {data_path}") from None
+
+        entry = DataReader._cache.get(data_path)
+        if entry is not None and entry[0] == mtime:
+            return entry
+
+        with DataReader._lock:
+            entry = DataReader._cache.get(data_path)
+            if entry is None or entry[0] != mtime:
+                with open(data_path, 'r', encoding='utf-8') as file:
+                    rows = list(csv.DictReader(file))
+                index = {}
+                for row in rows:
+                    # First row wins, matching the previous linear scan
+                    index.setdefault(row.get('test_case'), row)
+                entry = (mtime, rows, index)
+                DataReader._cache[data_path] = entry
+        return entry
+
+    @staticmethod
+    def _get_test_case(filename: str, test_case_name: str, error_label: str) -> Dict:
+        row = DataReader._load(filename)[2].get(test_case_name)
+        if row is None:
+            raise ValueError(f"{error_label} not found: {test_case_name}")
+        return dict(row)
+
+    @staticmethod
+    def clear_cache():
+        """Drop all parsed data files"""
+        with DataReader._lock:
+            DataReader._cache.clear()
+
     @staticmethod
     def read_csv(filename: str) -> List[Dict]:
         """Read CSV file and return list of dictionaries"""
-        data_path = os.path.join(os.path.dirname(__file__), "..", "data", filename)
-        
-        if not os.path.exists(data_path):
-            raise FileNotFoundError(f"Data file not found: {data_path}")
-        
-        data = []
-        with open(data_path, 'r', encoding='utf-8') as file:
-            csv_reader = csv.DictReader(file)
-            for row in csv_reader:
-                data.append(row)
-        
-        return data
+        return [dict(row) for row in DataReader._load(filename)[1]]
     
     @staticmethod
     def get_product_search_data() -> List[Dict]:
@@ -28,11 +69,7 @@ class DataReader:
     @staticmethod
     def get_search_test_case(test_case_name: str) -> Dict:
         """Get specific test case data by name"""
-        data = DataReader.get_product_search_data()
-        for row in data:
-            if row['test_case'] == test_case_name:
-                return row
-        raise ValueError(f"Test case not found: {test_case_name}")
+        return DataReader._get_test_case("product_search_data.csv", test_case_name, "Test case")
     
     @staticmethod
     def get_cart_test_data() -> List[Dict]:
@@ -42,11 +79,7 @@ class DataReader:
     @staticmethod
     def get_cart_test_case(test_case_name: str) -> Dict:
         """Get specific cart test case data by name"""
-        data = DataReader.get_cart_test_data()
-        for row in data:
-            if row['test_case'] == test_case_name:
-                return row
-        raise ValueError(f"Cart test case not found: {test_case_name}")
+        return DataReader._get_test_case("cart_test_data.csv", test_case_name, "Cart test case")
     
     @staticmethod
     def get_checkout_test_data() -> List[Dict]:
@@ -56,11 +89,7 @@ class DataReader:
     @staticmethod
     def get_checkout_test_case(test_case_name: str) -> Dict:
         """Get specific checkout test case data by name"""
-        data = DataReader.get_checkout_test_data()
-        for row in data:
-            if row['test_case'] == test_case_name:
-                return row
-        raise ValueError(f"Checkout test case not found: {test_case_name}")
+        return DataReader._get_test_case("checkout_test_data.csv", test_case_name, "Checkout test case")
     
     @staticmethod
     def get_reports_test_data() -> List[Dict]:
@@ -70,11 +99,7 @@ class DataReader:
     @staticmethod
     def get_reports_test_case(test_case_name: str) -> Dict:
         """Get specific reports test case data by name"""
-        data = DataReader.get_reports_test_data()
-        for row in data:
-            if row['test_case'] == test_case_name:
-                return row
-        raise ValueError(f"Reports test case not found: {test_case_name}")
+        return DataReader._get_test_case("reports_test_data.csv", test_case_name, "Reports test case")
     
     @staticmethod
     def get_login_test_data() -> List[Dict]:
@@ -84,8 +109,4 @@ class DataReader:
     @staticmethod
     def get_login_test_case(test_case_name: str) -> Dict:
         """Get specific login test case data by name"""
-        data = DataReader.get_login_test_data()
-        for row in data:
-            if row['test_case'] == test_case_name:
-                return row
-        raise ValueError(f"Login test case not found: {test_case_name}")
\ No newline at end of file
+        return DataReader._get_test_case("login_test_data.csv", test_case_name, "Login test case")
\ No newline at end of file
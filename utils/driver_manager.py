@@ -1,12 +1,124 @@
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
 from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType
+from webdriver_manager.firefox import GeckoDriverManager
+from utils.locator_registry import LocatorRegistry
 from config.config import config
 
 
+class DriverPool:
+    """
+    Pool of warm browser sessions that callers lease and return.
+
+    Sessions are created lazily up to ``size``. A returned session is
+    health-checked and goes back to the pool, unless it has served
+    ``max_uses`` leases, in which case it is quit and replaced on demand.
+    """
+
+    def __init__(self, size=None, max_uses=None, factory=None):
+        self.size = size or config.POOL_SIZE or os.cpu_count() or 1
+        self.max_uses = max_uses or config.POOL_MAX_USES
+        self._factory = factory or DriverManager._create_driver
+        # LIFO so the most recently used (warmest) session is handed out first
+        self._idle = queue.LifoQueue()
+        self._uses = {}
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def lease(self, timeout=None):
+        """Get a healthy session, creating one if the pool is not full yet"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = None
+
+            if driver is None:
+                with self._lock:
+                    can_create = self._created < self.size
+                    if can_create:
+                        self._created += 1
+                if can_create:
+                    try:
+                        driver = self._factory()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                    self._uses[id(driver)] = 0
+                    return driver
+                driver = self._idle.get(timeout=timeout or config.POOL_LEASE_TIMEOUT)
+
+            if self.is_healthy(driver):
+                return driver
+            self._discard(driver)
+
+    def release(self, driver, recycle=False):
+        """Return a session to the pool, recycling it when worn out or broken"""
+        uses = self._uses.get(id(driver), 0) + 1
+        self._uses[id(driver)] = uses
+        if recycle or uses >= self.max_uses or not self.is_healthy(driver):
+            self._discard(driver)
+        else:
+            self._idle.put(driver)
+
+    def close(self):
+        """Quit every idle session"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+    @staticmethod
+    def is_healthy(driver):
+        """Check the session still answers commands"""
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self, driver):
+        self._uses.pop(id(driver), None)
+        with self._lock:
+            self._created -= 1
+        DriverManager.quit_session(driver)
+
+
 class DriverManager:
+    """
+    Browser sessions for the configured engine (POS_BROWSER).
+
+    Each engine is a factory registered with register_browser(); chrome
+    (new headless mode), chromium and firefox are built in. Chromium
+    flags and Firefox prefs that cut background work (GPU, extensions,
+    background throttling) are applied unless POS_BROWSER_TUNED=false.
+    """
+
     _driver = None
+    _pool = None
+    # browser name -> callable starting a new session
+    _factories = {}
+    # browser name -> resolved driver binary (chromedriver/geckodriver)
+    _driver_paths = {}
+    _driver_path_lock = threading.Lock()
+    # id(driver) -> seconds it took to start, until taken by the fixture that leased it
+    _startup_times = {}
+    # id(driver) -> temporary profile copied from PROFILE_TEMPLATE
+    _profile_dirs = {}
 
     @classmethod
     def get_driver(cls):
@@ -15,26 +127,246 @@ class DriverManager:
         return cls._driver
 
     @classmethod
-    def _create_driver(cls):
-        if config.BROWSER.lower() == "chrome":
-            chrome_options = Options()
-            chrome_options.add_argument("--incognito")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--window-size=1920,1080")
-            if config.HEADLESS:
-                chrome_options.add_argument("--headless")
+    def get_pool(cls):
+        """Get the process-wide session pool (one per pytest worker process)"""
+        if cls._pool is None:
+            cls._pool = DriverPool()
+        return cls._pool
 
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+    # Chromium command-line flags that cut work the tests never need
+    TUNED_CHROMIUM_FLAGS = (
+        "--disable-gpu",
+        "--disable-extensions",
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding",
+        "--disable-background-networking",
+        "--disable-component-update",
+        "--disable-sync",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--mute-audio",
+    )
+    # The same for Firefox, as about:config prefs
+    TUNED_FIREFOX_PREFS = {
+        "layers.acceleration.disabled": True,
+        "extensions.update.enabled": False,
+        "dom.min_background_timeout_value": 4,
+        "dom.timeout.enable_budget_timer_throttling": False,
+        "browser.shell.checkDefaultBrowser": False,
+        "datareporting.policy.dataSubmissionEnabled": False,
+        "app.update.auto": False,
+    }
+
+    @classmethod
+    def register_browser(cls, name, factory):
+        """Make factory() (returning a new WebDriver) available as POS_BROWSER=name"""
+        cls._factories[name.lower()] = factory
+
+    @classmethod
+    def browsers(cls):
+        return sorted(cls._factories)
+
+    @classmethod
+    def start_session(cls, browser=None):
+        """Start a new session of browser (default POS_BROWSER); returns (driver, seconds it took to start)"""
+        browser = (browser or config.BROWSER).lower()
+        factory = cls._factories.get(browser)
+        if factory is None:
+            raise ValueError(f"Browser {browser} is not supported (expected one of {', '.join(cls.browsers())})")
+        start = time.perf_counter()
+        driver = factory()
+        try:
             driver.implicitly_wait(config.IMPLICIT_WAIT)
             # driver.maximize_window()
-            return driver
+            # Request blocking needs CDP; for Firefox the asset proxy still blocks them
+            if config.BLOCK_REQUESTS and hasattr(driver, "execute_cdp_cmd"):
+                cls.block_requests(driver)
+        except Exception:
+            cls.quit_session(driver)
+            raise
+        return driver, time.perf_counter() - start
+
+    @classmethod
+    def _create_driver(cls, browser=None):
+        # Sessions for the pool and get_driver(); the driver fixture reports the startup time via take_startup_time
+        driver, seconds = cls.start_session(browser)
+        cls._startup_times[id(driver)] = seconds
+        return driver
+
+    @classmethod
+    def _create_chrome(cls):
+        return cls._create_chromium_based("chrome")
+
+    @classmethod
+    def _create_chromium(cls):
+        return cls._create_chromium_based("chromium", binary=config.CHROMIUM_BINARY or cls._find_chromium())
+
+    @classmethod
+    def _create_chromium_based(cls, browser, binary=None):
+        profile_dir = cls._copy_profile_template()
+        chrome_options = cls._chrome_options(profile_dir)
+        if binary:
+            chrome_options.binary_location = binary
+        service = Service(cls.resolve_driver_path(browser))
+        try:
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        except Exception:
+            if profile_dir:
+                shutil.rmtree(profile_dir, ignore_errors=True)
+            raise
+        if profile_dir:
+            cls._profile_dirs[id(driver)] = profile_dir
+        return driver
+
+    @staticmethod
+    def _find_chromium():
+        for name in ("chromium", "chromium-browser"):
+            path = shutil.which(name)
+            if path:
+                return path
+        return None
+
+    @classmethod
+    def _create_firefox(cls):
+        options = FirefoxOptions()
+        if config.HEADLESS:
+            options.add_argument("-headless")
+        options.add_argument("--width=1920")
+        options.add_argument("--height=1080")
+        if config.BROWSER_TUNED:
+            for name, value in cls.TUNED_FIREFOX_PREFS.items():
+                options.set_preference(name, value)
+        if config.FIREFOX_BINARY:
+            options.binary_location = config.FIREFOX_BINARY
+        return webdriver.Firefox(service=FirefoxService(cls.resolve_driver_path("firefox")), options=options)
+
+    @classmethod
+    def _chrome_options(cls, profile_dir=None):
+        chrome_options = Options()
+        if profile_dir:
+            # A real profile keeps the template's HTTP cache; incognito would ignore it
+            chrome_options.add_argument(f"--user-data-dir={profile_dir}")
         else:
-            raise ValueError(f"Browser {config.BROWSER} is not supported")
+            chrome_options.add_argument("--incognito")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--window-size=1920,1080")
+        if config.HEADLESS:
+            # The new headless mode runs the regular browser, so pages behave as in a headed one
+            chrome_options.add_argument("--headless=new")
+        if config.BROWSER_TUNED:
+            for flag in cls.TUNED_CHROMIUM_FLAGS:
+                chrome_options.add_argument(flag)
+        # Console messages for the failure artifacts (driver.get_log("browser"))
+        chrome_options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+        return chrome_options
+
+    @classmethod
+    def resolve_driver_path(cls, browser="chrome"):
+        """
+        Path of the browser's driver binary, resolved once per process.
+
+        POS_CHROMEDRIVER_PATH (POS_CHROMIUMDRIVER_PATH, POS_GECKODRIVER_PATH)
+        wins; then the path cached by a previous run; only when neither
+        exists is webdriver-manager asked (which may hit the network), and
+        its answer is cached for next time.
+        """
+        explicit, install = {
+            "chrome": (config.CHROMEDRIVER_PATH, lambda: ChromeDriverManager().install()),
+            "chromium": (config.CHROMIUMDRIVER_PATH, lambda: ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install()),
+            "firefox": (config.GECKODRIVER_PATH, lambda: GeckoDriverManager().install()),
+        }[browser]
+        cache_path = cls.driver_path_cache(browser)
+        with cls._driver_path_lock:
+            path = cls._driver_paths.get(browser) or explicit or cls._cached_driver_path(cache_path)
+            if path is None:
+                path = install()
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with open(cache_path, "w", encoding="utf-8") as file:
+                    file.write(path)
+            cls._driver_paths[browser] = path
+            return path
+
+    @staticmethod
+    def driver_path_cache(browser="chrome"):
+        if browser == "chrome":
+            return config.DRIVER_PATH_CACHE
+        return os.path.join(config.CACHE_PATH, f"{browser}_driver_path")
+
+    @staticmethod
+    def _cached_driver_path(cache_path):
+        try:
+            with open(cache_path, encoding="utf-8") as file:
+                path = file.read().strip()
+        except OSError:
+            return None
+        return path if path and os.access(path, os.X_OK) else None
+
+    @staticmethod
+    def _copy_profile_template():
+        if not config.PROFILE_TEMPLATE or not os.path.isdir(config.PROFILE_TEMPLATE):
+            return None
+        profile_dir = tempfile.mkdtemp(prefix="pos-profile-")
+        # Lock files belong to the browser that built the template
+        shutil.copytree(
+            config.PROFILE_TEMPLATE, profile_dir, dirs_exist_ok=True,
+            ignore=shutil.ignore_patterns("Singleton*", "lockfile", "*.lock"),
+        )
+        return profile_dir
+
+    @classmethod
+    def build_profile_template(cls, path, urls=None):
+        """
+        Build a profile template by visiting urls (default BASE_URL) once.
+
+        The app's static assets land in the profile's HTTP cache, so
+        sessions started from a copy of it skip downloading them again.
+        """
+        os.makedirs(path, exist_ok=True)
+        chrome_options = cls._chrome_options(os.path.abspath(path))
+        driver = webdriver.Chrome(service=Service(cls.resolve_driver_path()), options=chrome_options)
+        try:
+            for url in urls or [config.BASE_URL]:
+                driver.get(url)
+        finally:
+            driver.quit()
+        return path
+
+    @staticmethod
+    def block_requests(driver, patterns=None):
+        """Make the browser fail requests matching patterns (default BLOCKED_URL_PATTERNS) via CDP"""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns or config.BLOCKED_URL_PATTERNS)})
+
+    @classmethod
+    def take_startup_time(cls, driver):
+        """Seconds it took to start this session, or None if it was already reported (warm lease)"""
+        return cls._startup_times.pop(id(driver), None)
+
+    @classmethod
+    def quit_session(cls, driver):
+        """Quit a session and remove its temporary profile"""
+        cls._startup_times.pop(id(driver), None)
+        LocatorRegistry.forget(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        profile_dir = cls._profile_dirs.pop(id(driver), None)
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
 
     @classmethod
     def quit_driver(cls):
         if cls._driver:
-            cls._driver.quit()
+            cls.quit_session(cls._driver)
             cls._driver = None
+        if cls._pool:
+            cls._pool.close()
+            cls._pool = None
+
+
+DriverManager.register_browser("chrome", DriverManager._create_chrome)
+DriverManager.register_browser("chromium", DriverManager._create_chromium)
+DriverManager.register_browser("firefox", DriverManager._create_firefox)
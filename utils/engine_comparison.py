@@ -0,0 +1,139 @@
+import json
+import os
+import time
+from datetime import datetime
+from pages.login_page import LoginPage
+from utils.driver_manager import DriverManager
+from utils.stats import LatencyStats
+from config.config import config
+
+
+class EngineComparison:
+    """
+    Startup and per-command latency of each browser engine.
+
+    For every engine, ``sessions`` browsers are started and quit one
+    after the other (startup and quit times), and each runs ``rounds``
+    rounds of the same WebDriver commands against the login page:
+    navigation, element lookup, typing, reading an attribute, a script
+    call and a screenshot. Engines that fail to start, or whose session
+    fails during a round, are reported as unavailable. The engine with the lowest mean startup plus mean round
+    time (startup amortized over the rounds) is reported as the cheapest.
+    """
+
+    COMMANDS = ("get", "find_element", "send_keys", "get_attribute", "execute_script", "screenshot")
+
+    def __init__(self, engines=None, sessions=None, rounds=None):
+        self.engines = [engine.lower() for engine in engines or config.COMPARE_ENGINES]
+        self.sessions = sessions or config.COMPARE_SESSIONS
+        self.rounds = rounds or config.COMPARE_ROUNDS
+
+    def run(self):
+        """Measure every engine and return the results"""
+        results = {
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "base_url": config.BASE_URL,
+            "headless": config.HEADLESS,
+            "tuned": config.BROWSER_TUNED,
+            "sessions": self.sessions,
+            "rounds": self.rounds,
+            "engines": {engine: self._measure(engine) for engine in self.engines},
+        }
+        available = {
+            engine: result for engine, result in results["engines"].items() if result["available"]
+        }
+        results["cheapest"] = min(available, key=lambda engine: available[engine]["cost_ms"]) if available else None
+        return results
+
+    def _measure(self, engine):
+        startups, quits = [], []
+        samples = {command: [] for command in self.COMMANDS}
+        for _ in range(self.sessions):
+            try:
+                driver, startup = DriverManager.start_session(engine)
+            except Exception as error:
+                return self._unavailable(error)
+            startups.append(startup)
+            try:
+                for _ in range(self.rounds):
+                    self._round(driver, samples)
+            except Exception as error:
+                # One engine crashing mid-round must not abort the comparison of the others
+                return self._unavailable(error, "during a round")
+            finally:
+                start = time.perf_counter()
+                DriverManager.quit_session(driver)
+                quits.append(time.perf_counter() - start)
+
+        commands = {command: LatencyStats.summarize(seconds) for command, seconds in samples.items()}
+        round_ms = sum(summary["mean_ms"] for summary in commands.values())
+        startup = LatencyStats.summarize(startups)
+        return {
+            "available": True,
+            "startup": startup,
+            "quit": LatencyStats.summarize(quits),
+            "commands": commands,
+            "round_ms": round(round_ms, 3),
+            "cost_ms": round(startup["mean_ms"] / self.rounds + round_ms, 3),
+        }
+
+    @staticmethod
+    def _unavailable(error, when=None):
+        message = str(error).strip().splitlines()
+        description = f"{type(error).__name__}: {message[0]}" if message else type(error).__name__
+        return {"available": False, "error": f"{description} ({when})" if when else description}
+
+    @staticmethod
+    def _round(driver, samples):
+        def timed(command, action):
+            start = time.perf_counter()
+            result = action()
+            samples[command].append(time.perf_counter() - start)
+            return result
+
+        timed("get", lambda: driver.get(config.BASE_URL))
+        element = timed("find_element", lambda: driver.find_element(*LoginPage.EMAIL_INPUT))
+        timed("send_keys", lambda: element.send_keys(config.ADMIN_EMAIL))
+        timed("get_attribute", lambda: element.get_attribute("value"))
+        timed("execute_script", lambda: driver.execute_script("return document.readyState"))
+        timed("screenshot", driver.get_screenshot_as_png)
+
+    @staticmethod
+    def write_report(results, directory=None):
+        """Write engine_comparison.json into directory (default REPORTS_PATH) and return its path"""
+        directory = directory or config.REPORTS_PATH
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, "engine_comparison.json")
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        return path
+
+    @classmethod
+    def format_results(cls, results):
+        """Plain-text tables of the results for the console"""
+        lines = [
+            f"{results['sessions']} session(s) x {results['rounds']} round(s) per engine against {results['base_url']} "
+            f"({'headless' if results['headless'] else 'headed'}, {'tuned' if results['tuned'] else 'default'} flags)",
+            "",
+            f"{'engine':<12}{'startup':>10}{'p95':>10}{'quit':>10}{'round':>10}{'cost':>10}",
+        ]
+        for engine, result in results["engines"].items():
+            if not result["available"]:
+                lines.append(f"{engine:<12}unavailable ({result['error']})")
+                continue
+            lines.append(
+                f"{engine:<12}{result['startup']['mean_ms']:>8.0f}ms{result['startup']['p95_ms']:>8.0f}ms"
+                f"{result['quit']['mean_ms']:>8.0f}ms{result['round_ms']:>8.1f}ms{result['cost_ms']:>8.1f}ms"
+            )
+        available = [engine for engine, result in results["engines"].items() if result["available"]]
+        if available:
+            lines += ["", f"{'command (mean / p95)':<22}" + "".join(f"{engine:>18}" for engine in available)]
+            for command in cls.COMMANDS:
+                lines.append(f"{command:<22}" + "".join(
+                    f"{results['engines'][engine]['commands'][command]['mean_ms']:>10.1f} / "
+                    f"{results['engines'][engine]['commands'][command]['p95_ms']:>5.1f}"
+                    for engine in available
+                ))
+        if results["cheapest"]:
+            lines += ["", f"Cheapest engine: {results['cheapest']} (lowest cost = startup / rounds + one round)"]
+        return "\n".join(lines)
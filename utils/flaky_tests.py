@@ -0,0 +1,88 @@
+import json
+from selenium.common import exceptions as selenium_exceptions
+from utils.scheduling import TestScheduler
+from config.config import config
+
+
+class FlakyTests:
+    """
+    Transient-failure detection and the quarantine list.
+
+    A failure is transient when its exception is one of
+    TRANSIENT_EXCEPTIONS (selenium exception class names); only those are
+    rerun. Quarantined tests are listed in QUARANTINE_PATH (written by
+    run_tests.py --update-quarantine from RunHistory.flakiness()) or
+    marked @pytest.mark.quarantine, and run in their own lane whose
+    failures do not fail the build.
+    """
+
+    LANES = ("all", "main", "quarantine")
+
+    _resolved = {}
+
+    @classmethod
+    def transient_types(cls):
+        """
+        The TRANSIENT_EXCEPTIONS classes, resolved once per list of names.
+
+        Raises ValueError naming the entries that are not selenium
+        exceptions (pytest_configure turns it into a usage error).
+        """
+        names = config.TRANSIENT_EXCEPTIONS
+        if names not in cls._resolved:
+            found = {name: getattr(selenium_exceptions, name, None) for name in names}
+            unknown = [
+                name for name, found_type in found.items()
+                if not (isinstance(found_type, type) and issubclass(found_type, Exception))
+            ]
+            if unknown:
+                raise ValueError(
+                    f"POS_TRANSIENT_EXCEPTIONS: not a selenium exception: {', '.join(unknown)} "
+                    f"(see selenium.common.exceptions)"
+                )
+            cls._resolved[names] = tuple(found.values())
+        return cls._resolved[names]
+
+    @classmethod
+    def is_transient(cls, excinfo):
+        return excinfo is not None and excinfo.errisinstance(cls.transient_types())
+
+    @staticmethod
+    def load_quarantine(path=None):
+        """Quarantined nodeids, empty when there is no quarantine file"""
+        try:
+            with open(path or config.QUARANTINE_PATH, encoding="utf-8") as file:
+                return set(json.load(file))
+        except FileNotFoundError:
+            return set()
+
+    @staticmethod
+    def is_quarantined(item, quarantined):
+        return TestScheduler.plain_nodeid(item.nodeid) in quarantined or item.get_closest_marker("quarantine") is not None
+
+    @classmethod
+    def select_lane(cls, items, lane, quarantined):
+        """Split items into (selected, deselected) for the lane"""
+        if lane == "all":
+            return list(items), []
+        want_quarantined = lane == "quarantine"
+        selected, deselected = [], []
+        for item in items:
+            (selected if cls.is_quarantined(item, quarantined) == want_quarantined else deselected).append(item)
+        return selected, deselected
+
+    @staticmethod
+    def chronic(scores, threshold=None, min_runs=None):
+        """nodeids whose flakiness score reaches threshold over at least min_runs runs"""
+        threshold = config.QUARANTINE_THRESHOLD if threshold is None else threshold
+        min_runs = config.FLAKY_MIN_RUNS if min_runs is None else min_runs
+        return sorted(
+            nodeid for nodeid, score in scores.items()
+            if score["runs"] >= min_runs and score["score"] >= threshold
+        )
+
+    @staticmethod
+    def write_quarantine(nodeids, path=None):
+        with open(path or config.QUARANTINE_PATH, "w", encoding="utf-8") as file:
+            json.dump(sorted(nodeids), file, indent=2)
+            file.write("\n")
@@ -0,0 +1,272 @@
+import ast
+import fnmatch
+import json
+import os
+import re
+import subprocess
+import sys
+from config.config import config
+from utils.locator_registry import LocatorRegistry
+from utils.scheduling import TestScheduler
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _relative(path):
+    return os.path.relpath(os.path.abspath(path), ROOT).replace(os.sep, "/")
+
+
+class ImpactRecorder:
+    """
+    Records what each test touched (POS_IMPACT_MAP, on by default).
+
+    BasePage calls (through timed_step) add the page-object classes and
+    named class-level locators they used; DataReader and DataProvider add
+    the data files read while the test runs. Symbols are
+    "pages/<module>.py::<Class>" and "pages/<module>.py::<Class>.<LOCATOR>".
+    """
+
+    enabled = config.IMPACT_MAP
+    _current = None
+    # Per page class: {locator: symbol} for its named class-level locators
+    _locator_symbols = {}
+
+    @classmethod
+    def start_test(cls):
+        cls._current = {"classes": set(), "locators": set(), "data": set()}
+
+    @classmethod
+    def record_page(cls, page, args, kwargs):
+        if cls._current is None:
+            return
+        page_type = type(page)
+        symbols = cls._locator_symbols.get(page_type)
+        if symbols is None:
+            symbols = cls._locator_symbols[page_type] = cls._class_symbols(page_type)
+        cls._current["classes"].update(symbols["classes"])
+        for value in (*args[:1], *kwargs.values()):
+            symbol = symbols["locators"].get(value) if isinstance(value, tuple) else None
+            if symbol:
+                cls._current["locators"].add(symbol)
+
+    @classmethod
+    def record_data(cls, path):
+        if cls._current is not None:
+            cls._current["data"].add(_relative(path))
+
+    @classmethod
+    def take(cls):
+        """What the running test touched, as sorted lists (None outside a test)"""
+        current, cls._current = cls._current, None
+        if current is None:
+            return None
+        return {kind: sorted(values) for kind, values in current.items()}
+
+    @staticmethod
+    def _class_symbols(page_type):
+        classes, locators = [], {}
+        for klass in reversed(page_type.__mro__[:-1]):  # base classes first, so subclasses win
+            module = _relative(sys.modules[klass.__module__].__file__)
+            classes.append(f"{module}::{klass.__name__}")
+            for name, value in vars(klass).items():
+                if LocatorRegistry.is_locator(value):
+                    locators[value] = f"{module}::{klass.__name__}.{name}"
+        return {"classes": classes, "locators": locators}
+
+
+class ImpactMap:
+    """
+    Test selection from a git diff and the recorded impact map.
+
+    The map (IMPACT_MAP_PATH) holds each test's classes, locators and data
+    files from the last run that recorded it. A change limited to a named
+    locator selects the tests that used that locator; any other change in
+    a page module selects the tests that used the changed class (or any
+    class of the module, for changes outside classes). So does a change to
+    a locator that is also used outside BasePage calls (e.g.
+    ``self.driver.find_element(*self.X)``), as the recorder never sees
+    those uses. Changed data files
+    and test modules select their tests. Changes anywhere else (BasePage,
+    utils, config, conftest) can affect every test, so they select the
+    whole suite, as does a missing map. Smoke tests and tests the map has
+    never seen always run.
+    """
+
+    HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", re.MULTILINE)
+
+    @staticmethod
+    def load(path=None):
+        try:
+            with open(path or config.IMPACT_MAP_PATH, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    @classmethod
+    def update(cls, entries, path=None):
+        """Merge {nodeid: entry} into the map; an incomplete (failed) test keeps what it touched before too"""
+        path = path or config.IMPACT_MAP_PATH
+        impact = cls.load(path)
+        for nodeid, entry in entries.items():
+            if not entry.pop("complete", True) and nodeid in impact:
+                entry = {kind: sorted(set(values) | set(impact[nodeid].get(kind, []))) for kind, values in entry.items()}
+            impact[nodeid] = entry
+        # Write next to the map and swap it in, so an interrupted run never leaves a truncated map
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(impact, file, indent=1, sort_keys=True)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _git(*args):
+        result = subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+        return result.stdout
+
+    @classmethod
+    def changed_files(cls, base):
+        """Files changed since base (committed, uncommitted and untracked), minus IMPACT_IGNORE"""
+        # NUL-separated, so paths with spaces or quoting come through as is
+        changed = cls._git("diff", "-z", "--name-only", "--no-renames", base, "--").split("\0")
+        changed += cls._git("ls-files", "-z", "--others", "--exclude-standard").split("\0")
+        return sorted(
+            path for path in set(changed) if path
+            if not any(fnmatch.fnmatch(path, pattern) for pattern in config.IMPACT_IGNORE)
+        )
+
+    @classmethod
+    def analyze(cls, base, impact=None):
+        """
+        What changed since base: {"files", "tests", "data", "symbols",
+        "full_run"}, where full_run names the reason when every test has to run.
+        """
+        impact = cls.load() if impact is None else impact
+        result = {"files": cls.changed_files(base), "tests": set(), "data": set(), "symbols": set(), "full_run": None}
+        if not impact:
+            result["full_run"] = f"no impact map at {config.IMPACT_MAP_PATH}; run the suite once to record it"
+            return result
+        recorded = set(locator for entry in impact.values() for locator in entry.get("locators", []))
+        direct = None
+        for path in result["files"]:
+            name = os.path.basename(path)
+            if path.startswith("tests/") and name.startswith("test_") and name.endswith(".py"):
+                result["tests"].add(path)
+            elif path.startswith("data/"):
+                result["data"].add(path)
+            elif path.startswith("pages/") and path.endswith(".py") and name not in ("base_page.py", "__init__.py"):
+                direct = cls._direct_locators() if direct is None else direct
+                result["symbols"].update(cls._changed_symbols(base, path, recorded - direct))
+            else:
+                result["full_run"] = f"{path} changed"
+                break
+        return result
+
+    @classmethod
+    def _direct_locators(cls):
+        """
+        Symbols of locators used anywhere other than as the locator argument
+        of a recorded BasePage call; a change to one of these selects by class.
+        """
+        with open(os.path.join(ROOT, "pages", "base_page.py"), encoding="utf-8") as file:
+            recorded_methods = {
+                node.name for node in ast.walk(ast.parse(file.read()))
+                if isinstance(node, ast.FunctionDef)
+                and any(isinstance(decorator, ast.Name) and decorator.id == "timed_step" for decorator in node.decorator_list)
+            }
+        names, locators = set(), {}
+        for path in cls._git("ls-files", "-z", "*.py").split("\0"):
+            if not path or not os.path.exists(os.path.join(ROOT, path)):
+                continue
+            with open(os.path.join(ROOT, path), encoding="utf-8") as file:
+                tree = ast.parse(file.read())
+            through_base_page = set()
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in recorded_methods:
+                    through_base_page.update(id(arg) for arg in (*node.args[:1], *(kw.value for kw in node.keywords)))
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Attribute) and node.attr.isupper() and id(node) not in through_base_page:
+                    names.add(node.attr)
+            if path.startswith("pages/"):
+                for klass in tree.body:
+                    if isinstance(klass, ast.ClassDef):
+                        for statement in klass.body:
+                            if (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+                                    and isinstance(statement.targets[0], ast.Name)):
+                                locators.setdefault(statement.targets[0].id, []).append(f"{path}::{klass.name}.{statement.targets[0].id}")
+        # Matched by name, so a use of another class's locator of the same name counts too
+        return {symbol for name in names & set(locators) for symbol in locators[name]}
+
+    @classmethod
+    def _changed_symbols(cls, base, path, recorded):
+        """Symbols of a page module touched by the diff; "<module>::" stands for the whole module"""
+        try:
+            with open(os.path.join(ROOT, path), encoding="utf-8") as file:
+                tree = ast.parse(file.read())
+        except FileNotFoundError:
+            return {f"{path}::"}
+        ranges = []
+        for start, count in cls.HUNK.findall(cls._git("diff", "-U0", "--no-color", base, "--", path)):
+            start, count = int(start), int(count or 1)
+            # A pure deletion (count 0) sits after line start; it is attributed to the enclosing class
+            ranges.append((start, start + max(count, 1) - 1, count == 0))
+        if not ranges:  # untracked file
+            return {f"{path}::"}
+
+        symbols = set()
+        for first, last, deletion in ranges:
+            symbol = f"{path}::"
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef) and node.lineno <= first and last <= node.end_lineno:
+                    symbol = f"{path}::{node.name}" if deletion else cls._class_member(path, node, first, last, recorded)
+                    break
+            symbols.add(symbol)
+        return symbols
+
+    @staticmethod
+    def _class_member(path, node, first, last, recorded):
+        """The locator symbol when first..last lies in one recorded locator assignment, else the class"""
+        for statement in node.body:
+            if (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+                    and isinstance(statement.targets[0], ast.Name)
+                    and statement.lineno <= first and last <= statement.end_lineno):
+                symbol = f"{path}::{node.name}.{statement.targets[0].id}"
+                if symbol in recorded:
+                    return symbol
+        return f"{path}::{node.name}"
+
+    @staticmethod
+    def is_affected(item, entry, changes):
+        path = item.nodeid.split("::")[0]
+        if path in changes["tests"]:
+            return True
+        marker = item.get_closest_marker("data_stream")
+        if marker is not None and _relative(os.path.join(ROOT, "data", marker.args[0])) in changes["data"]:
+            return True
+        if changes["data"].intersection(entry.get("data", [])):
+            return True
+        for symbol in changes["symbols"]:
+            if symbol.endswith("::"):
+                if any(name.startswith(symbol) for name in entry.get("classes", [])):
+                    return True
+            elif symbol in entry.get("classes", []) or symbol in entry.get("locators", []):
+                return True
+        return False
+
+    @classmethod
+    def select(cls, items, base, impact=None):
+        """Split items into (selected, deselected, changes) for the changes since base"""
+        impact = cls.load() if impact is None else impact
+        changes = cls.analyze(base, impact)
+        if changes["full_run"]:
+            return list(items), [], changes
+        selected, deselected = [], []
+        for item in items:
+            entry = impact.get(TestScheduler.plain_nodeid(item.nodeid))
+            keep = (
+                entry is None
+                or item.get_closest_marker("smoke") is not None
+                or cls.is_affected(item, entry, changes)
+            )
+            (selected if keep else deselected).append(item)
+        return selected, deselected, changes
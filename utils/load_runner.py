@@ -0,0 +1,239 @@
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from selenium.common.exceptions import WebDriverException
+from pages.login_page import LoginPage
+from pages.dashboard_page import DashboardPage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from utils.app_reset import AppReset
+from utils.data_reader import DataReader
+from utils.driver_manager import DriverPool
+from utils.stats import LatencyStats
+from config.config import config
+
+
+class StepFailed(Exception):
+    """A page-object step reported failure (returned False) during a load run"""
+
+
+class LoadRunner:
+    """
+    Replays the checkout flow as concurrent virtual users.
+
+    Every virtual user drives its own browser from a DriverPool and loops
+    over login -> search -> add to cart -> open checkout -> complete the
+    transaction, resetting the app between iterations. Browsers start
+    before the clock does; users then start one by one over ``ramp_up``
+    seconds and begin new iterations until ``duration`` seconds after the
+    ramp-up. Between steps each user pauses for 0.5-1.5x ``think_time``,
+    which is not counted in step latency. Errors outside a step are counted
+    under "iteration"; a user whose browser dies and cannot be replaced
+    stops early. results() has per-step latency
+    percentiles, errors and completed checkouts per second.
+    """
+
+    STEPS = ("login", "search_product", "add_to_cart", "open_checkout", "complete_checkout")
+
+    def __init__(self, users=None, ramp_up=None, duration=None, think_time=None, product=None, pool=None):
+        self.users = users or config.LOAD_USERS
+        self.ramp_up = config.LOAD_RAMP_UP if ramp_up is None else ramp_up
+        self.duration = config.LOAD_DURATION if duration is None else duration
+        self.think_time = config.LOAD_THINK_TIME if think_time is None else think_time
+        self.product = product or config.LOAD_PRODUCT
+        self.pool = pool or DriverPool(size=self.users, max_uses=float("inf"))
+        self.checkout_data = DataReader.get_checkout_test_case("complete_checkout_card")
+        self._samples = {step: [] for step in self.STEPS}
+        self._errors = {}
+        self._iterations = {"started": 0, "completed": 0, "users_stopped": 0}
+        self._lock = threading.Lock()
+        self._started_at = None
+        self._finished_at = None
+        self._failure = None
+
+    def run(self):
+        """Run the load test and return results()"""
+        barrier = threading.Barrier(self.users, action=self._start_clock)
+        threads = [
+            threading.Thread(target=self._virtual_user, args=(index, barrier), name=f"virtual-user-{index}", daemon=True)
+            for index in range(self.users)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self._finished_at = time.perf_counter()
+        self.pool.close()
+        if self._failure is not None:
+            raise RuntimeError(f"Could not start {self.users} browser(s): {self._failure}") from self._failure
+        return self.results()
+
+    def _start_clock(self):
+        self._started_at = time.perf_counter()
+
+    def _virtual_user(self, index, barrier):
+        try:
+            driver = self.pool.lease()
+        except Exception as error:
+            self._failure = error
+            barrier.abort()
+            return
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            self.pool.release(driver)
+            return
+
+        think = random.Random(index)
+        time.sleep(self.ramp_up * index / self.users)
+        deadline = self._started_at + self.ramp_up + self.duration
+        finished = False
+        try:
+            while time.perf_counter() < deadline:
+                self._count("started")
+                try:
+                    self.checkout_flow(driver, think)
+                    self._count("completed")
+                except Exception as error:
+                    # Errors inside a step are already counted under it; the rest (the app reset
+                    # between iterations, unexpected bugs) under "iteration". The user carries on
+                    if not hasattr(error, "load_step"):
+                        self._record_error("iteration", error)
+                    if isinstance(error, WebDriverException) and not DriverPool.is_healthy(driver):
+                        # A dead browser is replaced
+                        dead, driver = driver, None
+                        self.pool.release(dead, recycle=True)
+                        try:
+                            driver = self.pool.lease()
+                        except Exception as lease_error:
+                            # No replacement browser: this user stops, the others carry on
+                            self._record_error("replace_browser", lease_error)
+                            return
+            finished = True
+        finally:
+            if driver is not None:
+                self.pool.release(driver)
+            if not finished:
+                self._count("users_stopped")
+
+    def checkout_flow(self, driver, think):
+        """One iteration: a fresh start screen, then the steps of a checkout"""
+        AppReset.reset(driver)
+        login_page, dashboard_page = LoginPage(driver), DashboardPage(driver)
+        cart_page, checkout_page = CartPage(driver), CheckoutPage(driver)
+
+        with self.step("login"):
+            login_page.login(config.ADMIN_EMAIL, config.ADMIN_PASSWORD)
+            self._check(dashboard_page.is_dashboard_loaded(), "dashboard did not load after login")
+        self._think(think)
+        with self.step("search_product"):
+            dashboard_page.search_product(self.product)
+        self._think(think)
+        with self.step("add_to_cart"):
+            self._check(dashboard_page.add_first_product_to_cart(), f"could not add {self.product!r} to the cart")
+        self._think(think)
+        with self.step("open_checkout"):
+            self._check(cart_page.proceed_to_checkout(), "checkout modal did not open")
+        self._think(think)
+        with self.step("complete_checkout"):
+            success, message = checkout_page.complete_checkout_transaction(
+                self.checkout_data["customer_name"], self.checkout_data["customer_email"], self.checkout_data["notes"]
+            )
+            self._check(success, message)
+
+    @contextmanager
+    def step(self, name):
+        """Time one step; failed steps count as errors and are left out of the latency samples"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as error:
+            self._record_error(name, error)
+            error.load_step = name
+            raise
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._samples[name].append(elapsed)
+
+    @staticmethod
+    def _check(result, message):
+        if not result:
+            raise StepFailed(message)
+
+    def _think(self, think):
+        if self.think_time:
+            time.sleep(think.uniform(0.5, 1.5) * self.think_time)
+
+    def _record_error(self, name, error):
+        kind = str(error) if isinstance(error, StepFailed) else type(error).__name__
+        with self._lock:
+            errors = self._errors.setdefault(name, {})
+            errors[kind] = errors.get(kind, 0) + 1
+
+    def _count(self, key):
+        with self._lock:
+            self._iterations[key] += 1
+
+    def results(self):
+        elapsed = (self._finished_at or time.perf_counter()) - (self._started_at or time.perf_counter())
+        with self._lock:
+            steps = {
+                step: dict(
+                    LatencyStats.summarize(samples),
+                    errors=sum(self._errors.get(step, {}).values()),
+                    per_second=round(len(samples) / elapsed, 3) if elapsed > 0 else 0.0,
+                )
+                for step, samples in self._samples.items()
+            }
+            return {
+                "finished_at": datetime.now().isoformat(timespec="seconds"),
+                "base_url": config.BASE_URL,
+                "users": self.users,
+                "ramp_up_s": self.ramp_up,
+                "duration_s": self.duration,
+                "think_time_s": self.think_time,
+                "elapsed_s": round(elapsed, 3),
+                "iterations": dict(self._iterations),
+                "checkouts_per_second": round(self._iterations["completed"] / elapsed, 3) if elapsed > 0 else 0.0,
+                "steps": steps,
+                "errors": {step: dict(kinds) for step, kinds in self._errors.items()},
+            }
+
+    @staticmethod
+    def write_report(results, directory=None):
+        """Write load_report.json into directory (default REPORTS_PATH) and return its path"""
+        directory = directory or config.REPORTS_PATH
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, "load_report.json")
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        return path
+
+    @staticmethod
+    def format_results(results):
+        """Plain-text table of the results for the console"""
+        lines = [
+            f"{results['users']} virtual user(s), {results['elapsed_s']:.1f}s against {results['base_url']}",
+            f"Iterations: {results['iterations']['completed']} completed of {results['iterations']['started']} started "
+            f"({results['checkouts_per_second']:.2f} checkouts/s)"
+            + (f", {results['iterations']['users_stopped']} user(s) stopped early" if results['iterations']['users_stopped'] else ""),
+            "",
+            f"{'step':<20}{'count':>7}{'errors':>8}{'mean':>10}{'p50':>10}{'p90':>10}{'p95':>10}{'p99':>10}{'max':>10}{'/s':>8}",
+        ]
+        for step, summary in results["steps"].items():
+            if not summary["count"]:
+                lines.append(f"{step:<20}{0:>7}{summary['errors']:>8}")
+                continue
+            lines.append(
+                f"{step:<20}{summary['count']:>7}{summary['errors']:>8}"
+                + "".join(f"{summary[key]:>8.0f}ms" for key in ("mean_ms", "p50_ms", "p90_ms", "p95_ms", "p99_ms", "max_ms"))
+                + f"{summary['per_second']:>8.2f}"
+            )
+        for step, kinds in results["errors"].items():
+            for kind, count in kinds.items():
+                lines.append(f"  {step}: {count} x {kind}")
+        return "\n".join(lines)
@@ -0,0 +1,394 @@
+/*
+ * Local stand-in for the Simple POS web app.
+ *
+ * The markup mirrors the production DOM closely enough for the absolute
+ * XPaths and CSS selectors in pages/ to resolve. Only the parts of the UI
+ * that page objects and their positional locators depend on are reproduced;
+ * keep element nesting unchanged when editing.
+ *
+ * State lives in localStorage under the keys below so that cached sessions
+ * and seeded state survive a reload.
+ */
+(function () {
+  "use strict";
+
+  var STORAGE = {
+    auth: "pos_auth",
+    cart: "pos_cart",
+    transactions: "pos_transactions"
+  };
+  var ADMIN = { email: "admin@pos.com", password: "admin" };
+  var TAX_RATE = 0.08;
+
+  var PRODUCTS = [
+    { id: 1, name: "Wireless Headphones", category: "Electronics", price: 99.99 },
+    { id: 2, name: "Smartphone Case", category: "Electronics", price: 19.99 },
+    { id: 3, name: "USB-C Cable", category: "Electronics", price: 12.99 },
+    { id: 4, name: "Bluetooth Speaker", category: "Electronics", price: 49.99 },
+    { id: 5, name: "Programming Book", category: "Books", price: 39.99 },
+    { id: 6, name: "Science Fiction Novel", category: "Books", price: 14.99 },
+    { id: 7, name: "Cotton T-Shirt", category: "Clothing", price: 24.99 },
+    { id: 8, name: "Denim Jeans", category: "Clothing", price: 59.99 },
+    { id: 9, name: "Coffee Mug", category: "Home & Garden", price: 9.99 },
+    { id: 10, name: "Plant Pot", category: "Home & Garden", price: 15.99 },
+    { id: 11, name: "Yoga Mat", category: "Sports", price: 29.99 },
+    { id: 12, name: "Water Bottle", category: "Sports", price: 17.99 }
+  ];
+  var CATEGORIES = ["All Categories", "Electronics", "Books", "Clothing", "Home & Garden", "Sports"];
+
+  // Read by utils/state_seeder.py to build carts and transactions the way the app would
+  window.__pos = { products: PRODUCTS, taxRate: TAX_RATE, storage: STORAGE };
+
+  var root = document.getElementById("root");
+  var ui = { view: "pos", search: "", category: "All Categories", checkoutOpen: false, payment: "Cash", loginError: "" };
+
+  function load(key, fallback) {
+    try {
+      var value = window.localStorage.getItem(key);
+      return value ? JSON.parse(value) : fallback;
+    } catch (e) {
+      return fallback;
+    }
+  }
+
+  function save(key, value) {
+    window.localStorage.setItem(key, JSON.stringify(value));
+  }
+
+  function money(value) {
+    return "$" + (Math.round(value * 100) / 100).toFixed(2);
+  }
+
+  function escapeHtml(text) {
+    return String(text).replace(/[&<>"']/g, function (c) {
+      return { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" }[c];
+    });
+  }
+
+  function cartTotals(cart) {
+    var subtotal = cart.reduce(function (sum, item) { return sum + item.price * item.quantity; }, 0);
+    var tax = Math.round(subtotal * TAX_RATE * 100) / 100;
+    return { subtotal: subtotal, tax: tax, total: Math.round((subtotal + tax) * 100) / 100 };
+  }
+
+  function navigate(path) {
+    if (window.location.pathname !== path) {
+      window.history.pushState(null, "", path);
+    }
+  }
+
+  // Views
+  function render() {
+    if (!load(STORAGE.auth, null)) {
+      navigate("/");
+      renderLogin();
+      return;
+    }
+    navigate(ui.view === "reports" ? "/reports" : "/dashboard");
+    root.innerHTML =
+      '<div class="flex h-screen">' +
+        '<div class="w-64 bg-white shadow-lg">' +
+          '<div class="p-6"><span class="text-lg font-semibold">Simple POS</span></div>' +
+          '<div class="p-6 text-sm text-gray-500">' + escapeHtml(load(STORAGE.auth, {}).email || "") + '</div>' +
+          '<nav><ul>' +
+            '<li><button data-action="view" data-view="pos">POS</button></li>' +
+            '<li><button data-action="view" data-view="products">Products</button></li>' +
+            '<li><button data-action="view" data-view="transactions">Transactions</button></li>' +
+            '<li><button data-action="view" data-view="reports">Reports</button></li>' +
+          '</ul></nav>' +
+          '<div class="p-6"><button data-action="logout">Logout</button></div>' +
+        '</div>' +
+        '<main class="flex-1" id="main"></main>' +
+      '</div>';
+    if (ui.view === "reports") {
+      renderReports();
+    } else {
+      renderPos();
+    }
+  }
+
+  function renderLogin() {
+    root.innerHTML =
+      '<div class="min-h-screen flex items-center justify-center">' +
+        '<div class="bg-white rounded-lg shadow p-6">' +
+          '<h2 class="text-2xl">Simple POS</h2>' +
+          '<form data-form="login">' +
+            (ui.loginError ? '<div class="bg-red-50 border border-red-200 text-red-600">' + escapeHtml(ui.loginError) + '</div>' : '') +
+            '<div class="field"><label>Email</label><input type="email" name="email"></div>' +
+            '<div class="field"><label>Password</label><input type="password" name="password"></div>' +
+            '<button type="submit">Sign In</button>' +
+          '</form>' +
+        '</div>' +
+      '</div>';
+  }
+
+  function renderPos() {
+    var options = CATEGORIES.map(function (c) {
+      return '<option' + (c === ui.category ? ' selected' : '') + '>' + escapeHtml(c) + '</option>';
+    }).join("");
+    // This wrapper is the main/div element that page-object XPaths start from
+    document.getElementById("main").innerHTML =
+      '<div class="flex gap-6 p-6">' +
+        '<div class="flex-1">' +
+          '<div class="mb-6"><div class="flex gap-4">' +
+            '<div class="flex-1"><div class="relative"><input type="text" data-input="search" placeholder="Search products..." value="' + escapeHtml(ui.search) + '"></div></div>' +
+            '<select data-input="category">' + options + '</select>' +
+          '</div></div>' +
+          '<div id="catalog"></div>' +
+        '</div>' +
+        '<div class="w-96"><div class="bg-white rounded-lg shadow p-4" id="cart"></div></div>' +
+        (ui.checkoutOpen ? checkoutModal() : '') +
+      '</div>';
+    renderCatalog();
+    renderCart();
+  }
+
+  function renderCatalog() {
+    var term = ui.search.trim().toLowerCase();
+    var products = PRODUCTS.filter(function (p) {
+      return (ui.category === "All Categories" || p.category === ui.category) &&
+        p.name.toLowerCase().indexOf(term) !== -1;
+    });
+    var cards = products.map(function (p) {
+      return '<div class="bg-white rounded-lg shadow-md border p-4" data-product-id="' + p.id + '">' +
+        '<div>' +
+          '<h3 class="font-medium">' + escapeHtml(p.name) + '</h3>' +
+          '<p class="text-sm text-gray-500">' + escapeHtml(p.category) + '</p>' +
+          '<p class="text-lg font-semibold">' + money(p.price) + '</p>' +
+          '<button data-action="add" data-id="' + p.id + '">Add to Cart</button>' +
+        '</div>' +
+      '</div>';
+    }).join("");
+    document.getElementById("catalog").innerHTML =
+      '<div class="grid grid-cols-2 md:grid-cols-3 lg:grid-cols-4 gap-4">' + cards + '</div>' +
+      (products.length ? '' : '<p class="text-gray-500">No products found</p>');
+  }
+
+  function renderCart() {
+    var cart = load(STORAGE.cart, []);
+    var totals = cartTotals(cart);
+    var items = cart.length ? cart.map(function (item) {
+      return '<div class="border-b">' +
+        '<div class="flex justify-between items-center">' +
+          '<div><p class="font-medium">' + escapeHtml(item.name) + '</p><p class="text-sm text-gray-500">' + money(item.price) + '</p></div>' +
+          '<div class="flex items-center gap-2">' +
+            '<div class="flex items-center gap-2">' +
+              '<button data-action="decrease" data-id="' + item.id + '">-</button>' +
+              '<span>' + item.quantity + '</span>' +
+              '<button data-action="increase" data-id="' + item.id + '">+</button>' +
+            '</div>' +
+            '<button data-action="remove" data-id="' + item.id + '">Remove</button>' +
+          '</div>' +
+        '</div>' +
+      '</div>';
+    }).join("") : '<p class="text-gray-500">Cart is empty</p>';
+    document.getElementById("cart").innerHTML =
+      '<div class="mb-4"><h2 class="text-lg font-semibold">Cart</h2></div>' +
+      '<div class="space-y-3">' + items + '</div>' +
+      '<div>' +
+        '<p class="text-sm">Subtotal: ' + money(totals.subtotal) + '</p>' +
+        '<p class="text-sm">Tax: ' + money(totals.tax) + '</p>' +
+        '<p class="font-semibold">Total: ' + money(totals.total) + '</p>' +
+        '<button data-action="checkout"' + (cart.length ? '' : ' disabled') + '>Checkout</button>' +
+      '</div>';
+  }
+
+  function checkoutModal() {
+    var total = cartTotals(load(STORAGE.cart, [])).total;
+    return '<div class="fixed">' +
+      '<div class="bg-white rounded-lg shadow p-6 modal">' +
+        '<form data-form="checkout">' +
+          '<div class="mb-4"><h2 class="text-lg font-semibold">Checkout</h2><p>Total: ' + money(total) + '</p></div>' +
+          '<div>' +
+            '<div class="field"><label>Customer Name</label><input type="text" name="customer_name"></div>' +
+            '<div class="field"><label>Customer Email</label><input type="email" name="customer_email"></div>' +
+          '</div>' +
+          '<div class="field"><label>Payment Method</label><div class="flex gap-2">' +
+            ['Cash', 'Card'].map(function (m) {
+              return '<button type="button" data-action="payment" data-method="' + m + '"' +
+                (ui.payment === m ? ' class="selected"' : '') + '>' + m + '</button>';
+            }).join("") +
+          '</div></div>' +
+          '<div class="field"><label>Notes</label><textarea name="notes"></textarea></div>' +
+          '<div class="flex gap-2">' +
+            '<button type="button" data-action="cancel">Cancel</button>' +
+            '<button type="submit">Complete Transaction</button>' +
+          '</div>' +
+        '</form>' +
+      '</div>' +
+    '</div>';
+  }
+
+  function renderReports() {
+    var transactions = load(STORAGE.transactions, []);
+    var totalSales = transactions.reduce(function (sum, t) { return sum + t.total; }, 0);
+    var sold = {};
+    transactions.forEach(function (t) {
+      t.items.forEach(function (item) {
+        var entry = sold[item.name] || (sold[item.name] = { name: item.name, quantity: 0, revenue: 0 });
+        entry.quantity += item.quantity;
+        entry.revenue += item.price * item.quantity;
+      });
+    });
+    var top = Object.keys(sold).map(function (k) { return sold[k]; })
+      .sort(function (a, b) { return b.quantity - a.quantity || b.revenue - a.revenue; });
+
+    function metric(label, value) {
+      return '<div class="bg-white rounded-lg shadow p-6"><div class="flex items-center gap-4">' +
+        '<div class="text-2xl">&#9679;</div>' +
+        '<div><p class="text-sm text-gray-600">' + label + '</p><p class="text-2xl font-semibold">' + value + '</p></div>' +
+      '</div></div>';
+    }
+
+    document.getElementById("main").innerHTML =
+      '<div class="p-6">' +
+        '<div class="mb-6"><h1 class="text-2xl font-semibold text-gray-900">Sales Reports</h1>' +
+          '<p class="text-gray-500">Overview of completed transactions</p></div>' +
+        '<div class="metrics">' +
+          metric("Total Sales", money(totalSales)) +
+          metric("Transactions", String(transactions.length)) +
+          metric("Average Order", money(transactions.length ? totalSales / transactions.length : 0)) +
+          metric("Top Products", String(top.length)) +
+        '</div>' +
+        '<div class="bg-white rounded-lg shadow p-6">' +
+          '<h3 class="text-lg font-semibold">Top Products</h3>' +
+          '<div class="space-y-3">' +
+            (top.length ? top.map(function (p) {
+              return '<div class="flex justify-between">' +
+                '<div><p class="font-medium text-gray-900">' + escapeHtml(p.name) + '</p>' +
+                '<p class="text-sm text-gray-500">' + p.quantity + ' sold</p></div>' +
+                '<p class="font-semibold">' + money(p.revenue) + '</p>' +
+              '</div>';
+            }).join("") : '<p class="text-gray-500">No sales yet</p>') +
+          '</div>' +
+        '</div>' +
+      '</div>';
+  }
+
+  // Actions
+  function updateCart(id, change) {
+    var cart = load(STORAGE.cart, []);
+    var item = cart.filter(function (i) { return i.id === id; })[0];
+    if (change === "add") {
+      if (item) {
+        item.quantity += 1;
+      } else {
+        var product = PRODUCTS.filter(function (p) { return p.id === id; })[0];
+        cart.push({ id: product.id, name: product.name, price: product.price, quantity: 1 });
+      }
+    } else if (item) {
+      item.quantity += change === "increase" ? 1 : -1;
+      if (change === "remove" || item.quantity <= 0) {
+        cart = cart.filter(function (i) { return i.id !== id; });
+      }
+    }
+    save(STORAGE.cart, cart);
+    renderCart();
+  }
+
+  function completeTransaction(form) {
+    var cart = load(STORAGE.cart, []);
+    var totals = cartTotals(cart);
+    var transactions = load(STORAGE.transactions, []);
+    transactions.push({
+      id: transactions.length + 1,
+      items: cart,
+      subtotal: totals.subtotal,
+      tax: totals.tax,
+      total: totals.total,
+      payment_method: ui.payment,
+      customer_name: form.customer_name.value,
+      customer_email: form.customer_email.value,
+      notes: form.notes.value,
+      created_at: new Date().toISOString()
+    });
+    save(STORAGE.transactions, transactions);
+    save(STORAGE.cart, []);
+    window.alert("Transaction completed successfully! Total: " + money(totals.total));
+    ui.checkoutOpen = false;
+    ui.payment = "Cash";
+    render();
+  }
+
+  root.addEventListener("click", function (event) {
+    var target = event.target.closest("[data-action]");
+    if (!target) {
+      return;
+    }
+    var id = Number(target.getAttribute("data-id"));
+    switch (target.getAttribute("data-action")) {
+      case "add": updateCart(id, "add"); break;
+      case "increase": updateCart(id, "increase"); break;
+      case "decrease": updateCart(id, "decrease"); break;
+      case "remove": updateCart(id, "remove"); break;
+      case "checkout": ui.checkoutOpen = true; renderPos(); break;
+      case "cancel": ui.checkoutOpen = false; renderPos(); break;
+      case "payment":
+        ui.payment = target.getAttribute("data-method");
+        Array.prototype.forEach.call(target.parentNode.children, function (b) {
+          b.className = b === target ? "selected" : "";
+        });
+        break;
+      case "view": ui.view = target.getAttribute("data-view"); ui.checkoutOpen = false; render(); break;
+      case "logout":
+        window.localStorage.removeItem(STORAGE.auth);
+        ui.view = "pos";
+        render();
+        break;
+    }
+  });
+
+  root.addEventListener("submit", function (event) {
+    event.preventDefault();
+    var form = event.target;
+    if (form.getAttribute("data-form") === "login") {
+      if (form.email.value === ADMIN.email && form.password.value === ADMIN.password) {
+        save(STORAGE.auth, { email: ADMIN.email, token: "local-" + Date.now() });
+        ui.loginError = "";
+        ui.view = "pos";
+        render();
+      } else {
+        ui.loginError = "Invalid credentials. Please try again.";
+        var email = form.email.value;
+        renderLogin();
+        root.querySelector("input[type='email']").value = email;
+      }
+    } else if (form.getAttribute("data-form") === "checkout") {
+      completeTransaction(form);
+    }
+  });
+
+  function onFilter(event) {
+    var input = event.target.getAttribute("data-input");
+    if (input === "search") {
+      ui.search = event.target.value;
+    } else if (input === "category") {
+      ui.category = event.target.value;
+    } else {
+      return;
+    }
+    renderCatalog();
+  }
+  root.addEventListener("input", onFilter);
+  root.addEventListener("change", onFilter);
+
+  window.addEventListener("popstate", function () {
+    ui.view = window.location.pathname === "/reports" ? "reports" : "pos";
+    render();
+  });
+
+  // Used by utils/app_reset.py: replace all client state and render the start screen without a reload
+  window.__posReset = function (storage) {
+    window.localStorage.clear();
+    window.sessionStorage.clear();
+    Object.keys(storage || {}).forEach(function (key) {
+      window.localStorage.setItem(key, storage[key]);
+    });
+    ui = { view: "pos", search: "", category: "All Categories", checkoutOpen: false, payment: "Cash", loginError: "" };
+    window.history.replaceState(null, "", "/");
+    render();
+  };
+
+  ui.view = window.location.pathname === "/reports" ? "reports" : "pos";
+  render();
+})();
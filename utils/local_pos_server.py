@@ -0,0 +1,56 @@
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from config.config import config
+
+
+class _LocalPOSHandler(SimpleHTTPRequestHandler):
+    """Serve the static stand-in, falling back to index.html for client-side routes"""
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.path = "/index.html"
+        return super().send_head()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalPOSServer:
+    """
+    Local stand-in for the POS web app, served from utils/local_pos.
+
+    Reproduces the login, product grid, cart, checkout modal and Sales
+    Reports DOM that the page objects target, so the suite can run without
+    network access.
+    """
+
+    STATIC_DIR = os.path.join(os.path.dirname(__file__), "local_pos")
+
+    def __init__(self, host=None, port=None):
+        self.host = host or config.LOCAL_APP_HOST
+        self.port = config.LOCAL_APP_PORT if port is None else port
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self):
+        """Start serving on a background thread; port 0 picks a free port"""
+        handler = partial(_LocalPOSHandler, directory=self.STATIC_DIR)
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-pos", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,164 @@
+import functools
+import re
+import threading
+import time
+from contextlib import contextmanager
+from selenium.webdriver.common.by import By
+from config.config import config
+
+_BY_VALUES = {value for name, value in vars(By).items() if name.isupper()}
+_STEP = re.compile(r"^(\*|[A-Za-z][\w-]*)((?:\[[^\[\]]+\])*)$")
+_PREDICATE = re.compile(r"\[([^\[\]]+)\]")
+_ATTRIBUTE = re.compile(r"""^@([A-Za-z][\w-]*)\s*=\s*(["'])([^"']*)\2$""")
+_IDENT = re.compile(r"^[A-Za-z_][\w-]*$")
+
+
+@functools.lru_cache(maxsize=None)
+def xpath_to_css(xpath):
+    """
+    Convert a plain path XPath to an equivalent CSS selector, or return None.
+
+    Handles child (/) and descendant (//) steps, tag or * names, one
+    positional predicate ([n] -> :nth-of-type(n)) and attribute equality
+    ([@id="x"] -> #x, [@type='submit'] -> [type="submit"]). Functions,
+    axes, text() and combined position/attribute predicates stay XPath.
+    """
+    if not xpath.startswith("//"):
+        return None
+    parts = re.split(r"(//|/)", xpath)[1:]
+    selectors = []
+    for separator, step in zip(parts[0::2], parts[1::2]):
+        match = _STEP.match(step)
+        if not match:
+            return None
+        tag, predicates = match.group(1), _PREDICATE.findall(match.group(2))
+        selector = "" if tag == "*" else tag
+        for predicate in predicates:
+            predicate = predicate.strip()
+            if predicate.isdigit():
+                # [n] counts among siblings with the same name only when it is the sole predicate
+                if len(predicates) > 1:
+                    return None
+                selector += f":nth-child({predicate})" if tag == "*" else f":nth-of-type({predicate})"
+                continue
+            attribute = _ATTRIBUTE.match(predicate)
+            if not attribute:
+                return None
+            name, value = attribute.group(1), attribute.group(3)
+            if name == "id" and _IDENT.match(value):
+                selector += f"#{value}"
+            else:
+                selector += f'[{name}="{value}"]'
+        if separator == "/" and selectors:
+            selectors.append(">")
+        selectors.append(selector or "*")
+    return " ".join(selectors)
+
+
+class LocatorRegistry:
+    """
+    Compiled page-object locators, an optional element cache and per-locator cost.
+
+    compile() turns eligible XPaths into CSS selectors once (POS_LOCATOR_CSS);
+    BasePage compiles every class-level locator at import and template()
+    formats and compiles dynamic ones once per argument set. With
+    POS_ELEMENT_CACHE, find_element reuses the WebElement resolved earlier in
+    the test and re-resolves it when it has gone stale. With
+    POS_LOCATOR_STATS, time spent resolving each locator is recorded.
+    """
+
+    _sources = {}
+    _stats = {}
+    _elements = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def is_locator(value):
+        """A (By, selector) pair that is not a template"""
+        return (
+            isinstance(value, tuple) and len(value) == 2 and value[0] in _BY_VALUES
+            and isinstance(value[1], str) and "{" not in value[1]
+        )
+
+    @classmethod
+    def compile(cls, locator):
+        by, value = locator
+        if by != By.XPATH or not config.LOCATOR_CSS:
+            return locator
+        css = xpath_to_css(value)
+        if css is None:
+            return locator
+        compiled = (By.CSS_SELECTOR, css)
+        cls._sources[compiled] = locator
+        return compiled
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def template(cls, locator, *args):
+        """Format a (By, pattern) template with args and compile the result, once per args"""
+        by, pattern = locator
+        return cls.compile((by, pattern.format(*args)))
+
+    @classmethod
+    def source(cls, locator):
+        """The locator as written in the page object"""
+        return cls._sources.get(locator, locator)
+
+    # Element cache
+    @classmethod
+    def cached_element(cls, driver, locator):
+        if not config.ELEMENT_CACHE:
+            return None
+        return cls._elements.get((id(driver), locator))
+
+    @classmethod
+    def remember(cls, driver, locator, element):
+        if config.ELEMENT_CACHE:
+            cls._elements[(id(driver), locator)] = element
+
+    @classmethod
+    def forget(cls, driver, locator=None):
+        """Drop one cached element, or every element of driver (e.g. after a reset)"""
+        if locator is not None:
+            cls._elements.pop((id(driver), locator), None)
+            return
+        for key in [key for key in cls._elements if key[0] == id(driver)]:
+            cls._elements.pop(key, None)
+
+    # Resolution cost
+    @classmethod
+    @contextmanager
+    def measure(cls, locator, cached=False):
+        if not config.LOCATOR_STATS:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            with cls._lock:
+                entry = cls._stats.setdefault(locator, {"calls": 0, "cache_hits": 0, "total_ms": 0.0, "max_ms": 0.0})
+                entry["calls"] += 1
+                entry["cache_hits"] += int(cached)
+                entry["total_ms"] += elapsed
+                entry["max_ms"] = max(entry["max_ms"], elapsed)
+
+    @classmethod
+    def stats(cls, limit=None):
+        """Per-locator resolution cost, most expensive first"""
+        with cls._lock:
+            rows = [
+                {
+                    "locator": f"{by}={value}",
+                    "source": "{}={}".format(*cls.source((by, value))),
+                    "calls": entry["calls"],
+                    "cache_hits": entry["cache_hits"],
+                    "total_ms": round(entry["total_ms"], 3),
+                    "mean_ms": round(entry["total_ms"] / entry["calls"], 3),
+                    "max_ms": round(entry["max_ms"], 3),
+                }
+                for (by, value), entry in cls._stats.items()
+            ]
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows[:limit or config.SLOWEST_LOCATORS]
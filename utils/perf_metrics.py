@@ -0,0 +1,133 @@
+import weakref
+from selenium.common.exceptions import WebDriverException
+from config.config import config
+
+
+class PerfMetrics:
+    """
+    Front-end performance of the page under test, measured per test.
+
+    install() adds PerformanceObservers for largest-contentful-paint and
+    longtask entries (buffered, so paints that happened before are seen)
+    to the current document and, through CDP, to every document the
+    session loads later. mark() remembers where the test started;
+    collect() returns Navigation Timing of the current document, the
+    resources fetched, LCP, long tasks since the mark, and the JS heap.
+    Metrics are flat numbers in ms, KB or MB so budgets can name them.
+    """
+
+    # perf_budget(...) keywords; every metric is "lower is better"
+    METRICS = (
+        "ttfb_ms", "dom_content_loaded_ms", "load_ms", "lcp_ms",
+        "long_tasks", "long_task_ms", "resources", "transfer_kb", "slowest_resource_ms", "heap_mb",
+    )
+
+    OBSERVER_SCRIPT = """
+        if (!window.__posPerf && typeof PerformanceObserver === "function") {
+            var perf = window.__posPerf = {lcp: null, longTasks: []};
+            var observe = function (type, callback) {
+                try {
+                    new PerformanceObserver(function (list) { list.getEntries().forEach(callback); })
+                        .observe({type: type, buffered: true});
+                } catch (e) {}
+            };
+            observe("largest-contentful-paint", function (entry) { perf.lcp = entry.startTime; });
+            observe("longtask", function (entry) {
+                perf.longTasks.push({start: entry.startTime, duration: entry.duration});
+            });
+        }
+    """
+
+    MARK_SCRIPT = "return {origin: performance.timeOrigin, now: performance.now()};"
+
+    COLLECT_SCRIPT = """
+        var mark = arguments[0];
+        // A navigation during the test starts a new timeline; count all of it
+        var from = mark && mark.origin === performance.timeOrigin ? mark.now : 0;
+        var round = function (value) { return value == null ? null : Math.round(value * 10) / 10; };
+        var nav = performance.getEntriesByType("navigation")[0];
+        var resources = performance.getEntriesByType("resource").filter(function (r) { return r.startTime >= from; });
+        var perf = window.__posPerf || {lcp: null, longTasks: []};
+        var longTasks = perf.longTasks.filter(function (t) { return t.start >= from; });
+        return {
+            ttfb_ms: nav ? round(nav.responseStart - nav.startTime) : null,
+            dom_content_loaded_ms: nav ? round(nav.domContentLoadedEventEnd - nav.startTime) : null,
+            load_ms: nav && nav.loadEventEnd ? round(nav.loadEventEnd - nav.startTime) : null,
+            lcp_ms: round(perf.lcp),
+            long_tasks: longTasks.length,
+            long_task_ms: round(longTasks.reduce(function (sum, t) { return sum + t.duration; }, 0)),
+            resources: resources.length,
+            transfer_kb: round(resources.reduce(function (sum, r) { return sum + (r.transferSize || 0); }, 0) / 1024),
+            slowest_resource_ms: round(resources.reduce(function (max, r) { return Math.max(max, r.duration); }, 0)),
+            heap_mb: performance.memory ? round(performance.memory.usedJSHeapSize / 1048576) : null
+        };
+    """
+
+    # Sessions that already run OBSERVER_SCRIPT on every new document
+    _installed = weakref.WeakSet()
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._mark = None
+
+    @classmethod
+    def enabled_for(cls, node):
+        """POS_PERF_METRICS turns capture on for every test; a perf_budget marker turns it on for one"""
+        return config.PERF_METRICS or node.get_closest_marker("perf_budget") is not None
+
+    @classmethod
+    def install(cls, driver):
+        if driver not in cls._installed:
+            try:
+                driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": cls.OBSERVER_SCRIPT})
+                driver.execute_cdp_cmd("Performance.enable", {})
+            except (AttributeError, WebDriverException):
+                pass  # not a Chromium session: observers cover the current document only
+            cls._installed.add(driver)
+        driver.execute_script(cls.OBSERVER_SCRIPT)
+
+    def mark(self):
+        """Start measuring from now"""
+        try:
+            self.install(self.driver)
+            self._mark = self.driver.execute_script(self.MARK_SCRIPT)
+        except WebDriverException:
+            # e.g. a leftover alert; collect() then counts the whole document
+            self._mark = None
+
+    def collect(self):
+        """Metrics since mark(), or None when the page can't be measured (e.g. an alert is open)"""
+        try:
+            metrics = self.driver.execute_script(self.COLLECT_SCRIPT, self._mark)
+        except WebDriverException:
+            return None
+        heap = self._cdp_heap_mb()
+        if heap is not None:
+            metrics["heap_mb"] = heap
+        return metrics
+
+    def _cdp_heap_mb(self):
+        # More precise than performance.memory, which Chrome rounds and updates lazily
+        try:
+            result = self.driver.execute_cdp_cmd("Performance.getMetrics", {})
+        except (AttributeError, WebDriverException):
+            return None
+        for metric in result.get("metrics", []):
+            if metric["name"] == "JSHeapUsedSize":
+                return round(metric["value"] / 1048576, 1)
+        return None
+
+    @classmethod
+    def check_budget(cls, metrics, budget):
+        """Messages for every budgeted metric that is over budget or was not measured"""
+        unknown = set(budget) - set(cls.METRICS)
+        if unknown:
+            raise ValueError(f"Unknown perf_budget metric(s) {sorted(unknown)}, expected some of {cls.METRICS}")
+        violations = []
+        for name, limit in budget.items():
+            value = (metrics or {}).get(name)
+            if value is None:
+                violations.append(f"{name} was not measured (budget {limit})")
+            elif value > limit:
+                violations.append(f"{name} = {value} exceeds budget {limit}")
+        return violations
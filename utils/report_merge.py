@@ -0,0 +1,102 @@
+import glob
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+from html import escape
+
+
+class ReportMerger:
+    """
+    Combines the result files written by each shard of a sharded run.
+
+    Every shard writes junit-<index>.xml and durations-<index>.json into one
+    folder (run_tests.py --shard-index/--shard-count). merge() turns them
+    into a single JUnit file, a single HTML summary and a durations file for
+    weighing the shards of the next run.
+    """
+
+    SHARD_FILE = re.compile(r"-(\d+)\.\w+$")
+
+    @classmethod
+    def merge(cls, directory, output_directory):
+        """Merge the shard files in directory; returns the paths written and the totals"""
+        os.makedirs(output_directory, exist_ok=True)
+        cases = cls.read_junit(sorted(glob.glob(os.path.join(directory, "junit-*.xml"))))
+        totals = cls.totals(cases)
+
+        junit_path = os.path.join(output_directory, "junit.xml")
+        cls.write_junit(cases, totals, junit_path)
+        html_path = os.path.join(output_directory, "sharded_report.html")
+        cls.write_html(cases, totals, html_path)
+        durations_path = os.path.join(output_directory, "test_durations.json")
+        cls.write_durations(sorted(glob.glob(os.path.join(directory, "durations-*.json"))), durations_path)
+        return {"junit": junit_path, "html": html_path, "durations": durations_path, "totals": totals}
+
+    @classmethod
+    def read_junit(cls, paths):
+        """[(shard, testcase element, outcome)] from every shard's JUnit file"""
+        cases = []
+        for path in paths:
+            shard = cls.SHARD_FILE.search(os.path.basename(path)).group(1)
+            for case in ET.parse(path).getroot().iter("testcase"):
+                cases.append((shard, case, cls.outcome(case)))
+        return cases
+
+    @staticmethod
+    def outcome(case):
+        for tag, outcome in (("failure", "failed"), ("error", "error"), ("skipped", "skipped")):
+            if case.find(tag) is not None:
+                return outcome
+        return "passed"
+
+    @staticmethod
+    def totals(cases):
+        totals = {"tests": len(cases), "passed": 0, "failed": 0, "error": 0, "skipped": 0, "time": 0.0}
+        for _, case, outcome in cases:
+            totals[outcome] += 1
+            totals["time"] += float(case.get("time") or 0)
+        totals["time"] = round(totals["time"], 3)
+        return totals
+
+    @staticmethod
+    def write_junit(cases, totals, path):
+        root = ET.Element("testsuites")
+        suite = ET.SubElement(root, "testsuite", {
+            "name": "pytest",
+            "tests": str(totals["tests"]),
+            "failures": str(totals["failed"]),
+            "errors": str(totals["error"]),
+            "skipped": str(totals["skipped"]),
+            "time": str(totals["time"]),
+        })
+        for _, case, _ in cases:
+            suite.append(case)
+        ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+    @staticmethod
+    def write_html(cases, totals, path):
+        rows = "".join(
+            f"<tr class=\"{outcome}\"><td>{escape(case.get('classname', ''))}::{escape(case.get('name', ''))}</td>"
+            f"<td>{shard}</td><td>{outcome}</td><td>{float(case.get('time') or 0):.2f}</td></tr>"
+            for shard, case, outcome in cases
+        )
+        summary = ", ".join(f"{totals[key]} {key}" for key in ("passed", "failed", "error", "skipped"))
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(
+                "<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>Sharded test report</title>"
+                "<style>body{font-family:sans-serif}td,th{padding:2px 8px;text-align:left}"
+                ".failed,.error{color:#b00}.skipped{color:#888}</style></head><body>"
+                f"<h1>Sharded test report</h1><p>{totals['tests']} tests: {summary} in {totals['time']:.1f}s</p>"
+                "<table><tr><th>Test</th><th>Shard</th><th>Outcome</th><th>Duration (s)</th></tr>"
+                f"{rows}</table></body></html>"
+            )
+
+    @staticmethod
+    def write_durations(paths, path):
+        durations = {}
+        for shard_path in paths:
+            with open(shard_path, encoding="utf-8") as file:
+                durations.update(json.load(file))
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(dict(sorted(durations.items())), file, indent=2)
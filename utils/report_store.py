@@ -0,0 +1,192 @@
+import json
+import os
+from datetime import datetime
+from config.config import config
+
+
+class ReportStore:
+    """
+    Test results streamed to a JSONL file, one line per finished test.
+
+    record() collects a test's phases and appends its line as soon as the
+    teardown report arrives, so memory stays flat however many tests run.
+    Failure artifacts are referenced by path (screenshots are stored once
+    per content hash by ArtifactWriter), never inlined. build_viewer()
+    turns the store into a small HTML viewer that loads the results a page
+    at a time.
+    """
+
+    # Longest failure text kept per test; the rest is in the JUnit XML and terminal output
+    MAX_MESSAGE = 4000
+
+    def __init__(self, path=None):
+        self.path = path or config.RESULTS_STORE_PATH
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._pending = {}
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+
+    def record(self, report):
+        entry = self._pending.setdefault(report.nodeid, {
+            "nodeid": report.nodeid, "outcome": "passed", "duration_s": 0.0, "message": None, "reruns": 0,
+        })
+        if report.outcome == "rerun":
+            entry["reruns"] += 1
+            return
+        entry["duration_s"] = round(entry["duration_s"] + report.duration, 4)
+        if report.failed:
+            entry["outcome"] = "failed" if report.when == "call" else "error"
+            entry["message"] = (entry["message"] or "") + report.longreprtext[: self.MAX_MESSAGE]
+        elif report.skipped and entry["outcome"] == "passed":
+            entry["outcome"] = "xfailed" if hasattr(report, "wasxfail") else "skipped"
+            entry["message"] = report.longreprtext[: self.MAX_MESSAGE]
+        properties = dict(report.user_properties)
+        if properties.get("artifacts"):
+            entry["artifacts"] = properties["artifacts"]
+        if properties.get("perf_metrics"):
+            entry["perf"] = properties["perf_metrics"]
+
+        if report.when == "teardown":
+            self._file.write(json.dumps(self._pending.pop(report.nodeid)) + "\n")
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    @classmethod
+    def build_viewer(cls, store_path=None, directory=None, page_size=None, started_at=None):
+        """
+        Write index.html plus one script per page of results into directory.
+
+        Pages are plain scripts (not JSON) so the viewer can load them
+        lazily from file:// as well. Failures get their own pages so they
+        can be browsed without loading the passing tests. Returns the
+        path of index.html and the totals.
+        """
+        store_path = store_path or config.RESULTS_STORE_PATH
+        directory = directory or config.REPORT_VIEWER_PATH
+        page_size = page_size or config.REPORT_PAGE_SIZE
+        pages_dir = os.path.join(directory, "pages")
+        os.makedirs(pages_dir, exist_ok=True)
+        for name in os.listdir(pages_dir):
+            os.remove(os.path.join(pages_dir, name))
+
+        totals = {"tests": 0, "passed": 0, "failed": 0, "error": 0, "skipped": 0, "xfailed": 0, "duration_s": 0.0}
+        pages = {"all": _PageWriter(pages_dir, "all", page_size), "failures": _PageWriter(pages_dir, "failures", page_size)}
+        with open(store_path, encoding="utf-8") as file:
+            for line in file:
+                result = json.loads(line)
+                totals["tests"] += 1
+                totals[result["outcome"]] = totals.get(result["outcome"], 0) + 1
+                totals["duration_s"] += result["duration_s"]
+                pages["all"].add(result)
+                if result["outcome"] in ("failed", "error"):
+                    pages["failures"].add(result)
+        for writer in pages.values():
+            writer.flush()
+        totals["duration_s"] = round(totals["duration_s"], 3)
+
+        manifest = {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "started_at": started_at,
+            "totals": totals,
+            "pages": {name: writer.count for name, writer in pages.items()},
+            # Artifact paths in the store are relative to REPORTS_PATH
+            "artifact_prefix": os.path.relpath(config.REPORTS_PATH, directory).replace(os.sep, "/") + "/",
+        }
+        index_path = os.path.join(directory, "index.html")
+        with open(index_path, "w", encoding="utf-8") as file:
+            file.write(_VIEWER_HTML.replace("__MANIFEST__", json.dumps(manifest)))
+        return index_path, totals
+
+
+class _PageWriter:
+    """Buffers one page of results at a time and writes it as pages/<view>-<n>.js"""
+
+    def __init__(self, directory, view, size):
+        self.directory, self.view, self.size = directory, view, size
+        self.count = 0
+        self._rows = []
+
+    def add(self, result):
+        self._rows.append(result)
+        if len(self._rows) >= self.size:
+            self.flush()
+
+    def flush(self):
+        if not self._rows:
+            return
+        path = os.path.join(self.directory, f"{self.view}-{self.count}.js")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(f"window.reportPage({json.dumps(self.view)}, {self.count}, {json.dumps(self._rows)});\n")
+        self.count += 1
+        self._rows = []
+
+
+_VIEWER_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Test results</title>
+<style>
+body{font-family:sans-serif;margin:16px}table{border-collapse:collapse;width:100%}
+td,th{padding:3px 8px;text-align:left;border-bottom:1px solid #eee;vertical-align:top}
+tr.row{cursor:pointer}.passed{color:#080}.failed,.error{color:#b00}.skipped,.xfailed{color:#888}
+pre{white-space:pre-wrap;font-size:12px;background:#f7f7f7;padding:6px;max-height:400px;overflow:auto}
+nav button{margin-right:4px}nav button.active{font-weight:bold}img{max-width:320px;border:1px solid #ccc}
+</style></head><body>
+<h1>Test results</h1><p id="summary"></p>
+<nav><button data-view="all">All</button><button data-view="failures">Failures</button>
+<input id="filter" placeholder="Filter this page"> <span id="pager"></span></nav>
+<table><thead><tr><th>Result</th><th>Test</th><th>Duration (s)</th></tr></thead><tbody id="rows"></tbody></table>
+<script>
+var manifest = __MANIFEST__;
+var cache = {}, state = {view: "all", page: 0};
+function esc(value) {
+  return String(value == null ? "" : value).replace(/[&<>"]/g, function (c) {
+    return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}[c];
+  });
+}
+window.reportPage = function (view, page, rows) { cache[view + "-" + page] = rows; if (view === state.view && page === state.page) render(); };
+function show(view, page) {
+  state = {view: view, page: page};
+  document.querySelectorAll("nav button").forEach(function (b) { b.className = b.dataset.view === view ? "active" : ""; });
+  var key = view + "-" + page;
+  if (cache[key]) return render();
+  if (!manifest.pages[view]) return render();
+  document.getElementById("rows").innerHTML = "<tr><td colspan=3>Loading…</td></tr>";
+  var script = document.createElement("script");
+  script.src = "pages/" + key + ".js";
+  document.body.appendChild(script);
+}
+function details(row) {
+  var parts = [];
+  if (row.message) parts.push("<pre>" + esc(row.message) + "</pre>");
+  var a = row.artifacts || {}, prefix = manifest.artifact_prefix;
+  if (a.screenshot) parts.push('<a href="' + esc(prefix + a.screenshot) + '"><img loading="lazy" src="' + esc(prefix + (a.thumbnail || a.screenshot)) + '"></a>');
+  if (a.dom) parts.push('<a href="' + esc(prefix + a.dom) + '">DOM snapshot</a>');
+  if (a.console) parts.push(' <a href="' + esc(prefix + a.console) + '">Console log</a>');
+  if (row.perf) parts.push("<pre>" + esc(JSON.stringify(row.perf)) + "</pre>");
+  return parts.join("");
+}
+function render() {
+  var rows = cache[state.view + "-" + state.page] || [], term = document.getElementById("filter").value.toLowerCase();
+  var pages = manifest.pages[state.view];
+  document.getElementById("pager").innerHTML = pages
+    ? '<button onclick="show(state.view, state.page - 1)"' + (state.page ? "" : " disabled") + ">&lsaquo;</button> page " +
+      (state.page + 1) + " of " + pages + ' <button onclick="show(state.view, state.page + 1)"' + (state.page + 1 < pages ? "" : " disabled") + ">&rsaquo;</button>"
+    : "nothing to show";
+  document.getElementById("rows").innerHTML = rows.filter(function (row) { return row.nodeid.toLowerCase().indexOf(term) !== -1; }).map(function (row, i) {
+    return '<tr class="row" data-index="' + i + '"><td class="' + row.outcome + '">' + row.outcome + "</td><td>" + esc(row.nodeid) +
+      (row.reruns ? " <small>(" + row.reruns + " rerun(s))</small>" : "") + "</td><td>" + row.duration_s.toFixed(2) + '</td></tr><tr hidden><td colspan=3>' + details(row) + "</td></tr>";
+  }).join("");
+}
+document.getElementById("rows").addEventListener("click", function (event) {
+  var row = event.target.closest("tr.row");
+  if (row) row.nextElementSibling.hidden = !row.nextElementSibling.hidden;
+});
+document.querySelectorAll("nav button").forEach(function (b) { b.addEventListener("click", function () { show(b.dataset.view, 0); }); });
+document.getElementById("filter").addEventListener("input", render);
+var t = manifest.totals;
+document.getElementById("summary").textContent = t.tests + " tests: " + t.passed + " passed, " + t.failed + " failed, " +
+  t.error + " errors, " + t.skipped + " skipped in " + t.duration_s.toFixed(1) + "s (generated " + manifest.generated_at + ")";
+show(t.failed + t.error ? "failures" : "all", 0);
+</script></body></html>
+"""
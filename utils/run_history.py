@@ -0,0 +1,163 @@
+import os
+import sqlite3
+import statistics
+from config.config import config
+
+
+class RunHistory:
+    """
+    Local SQLite store of per-test timings across runs.
+
+    One row per test and run: outcome, setup/call/teardown durations, the
+    wait/sleep/command breakdown and how often the test was rerun, used
+    to spot runtime regressions and flaky tests.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TEXT NOT NULL,
+            finished_at TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS results (
+            run_id INTEGER NOT NULL REFERENCES runs(id),
+            nodeid TEXT NOT NULL,
+            outcome TEXT NOT NULL,
+            setup_s REAL,
+            call_s REAL,
+            teardown_s REAL,
+            total_s REAL,
+            wait_s REAL,
+            sleep_s REAL,
+            command_s REAL,
+            reruns INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (run_id, nodeid)
+        );
+        CREATE INDEX IF NOT EXISTS results_nodeid ON results (nodeid);
+    """
+
+    RESULT_COLUMNS = ("outcome", "setup_s", "call_s", "teardown_s", "total_s", "wait_s", "sleep_s", "command_s", "reruns")
+
+    def __init__(self, path=None):
+        self.path = path or config.HISTORY_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.executescript(self.SCHEMA)
+        # Histories created before reruns were recorded
+        columns = [row[1] for row in self._connection.execute("PRAGMA table_info(results)")]
+        if "reruns" not in columns:
+            with self._connection:
+                self._connection.execute("ALTER TABLE results ADD COLUMN reruns INTEGER NOT NULL DEFAULT 0")
+
+    def close(self):
+        self._connection.close()
+
+    def record_run(self, started_at, finished_at, results):
+        """Store one run; results maps nodeid to a dict with RESULT_COLUMNS. Returns the run id"""
+        with self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO runs (started_at, finished_at) VALUES (?, ?)", (started_at, finished_at)
+            )
+            run_id = cursor.lastrowid
+            columns = ", ".join(self.RESULT_COLUMNS)
+            placeholders = ", ".join("?" for _ in self.RESULT_COLUMNS)
+            self._connection.executemany(
+                f"INSERT INTO results (run_id, nodeid, {columns}) VALUES (?, ?, {placeholders})",
+                [
+                    (run_id, nodeid) + tuple(result.get(column) for column in self.RESULT_COLUMNS)
+                    for nodeid, result in results.items()
+                ],
+            )
+        return run_id
+
+    def _recent_run_ids(self, runs, before_run=None):
+        query = "SELECT id FROM runs"
+        params = []
+        if before_run is not None:
+            query += " WHERE id < ?"
+            params.append(before_run)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(runs)
+        return [row[0] for row in self._connection.execute(query, params)]
+
+    def recent_totals(self, runs=None, before_run=None):
+        """Total durations of passed results over the last N runs, keyed by nodeid"""
+        run_ids = self._recent_run_ids(runs or config.HISTORY_RUNS, before_run)
+        if not run_ids:
+            return {}
+
+        totals = {}
+        rows = self._connection.execute(
+            f"SELECT nodeid, total_s FROM results WHERE outcome = 'passed' "
+            f"AND run_id IN ({', '.join('?' for _ in run_ids)}) ORDER BY run_id",
+            run_ids,
+        )
+        for nodeid, total in rows:
+            totals.setdefault(nodeid, []).append(total)
+        return totals
+
+    def flakiness(self, runs=None):
+        """
+        Flakiness per test over the last N runs (FLAKY_WINDOW).
+
+        A run counts as flaky for a test when it passed only after a
+        rerun, or when it passed/failed unlike the test's previous run.
+        score is the fraction of the test's runs that were flaky.
+        """
+        run_ids = self._recent_run_ids(runs or config.FLAKY_WINDOW)
+        if not run_ids:
+            return {}
+        rows = self._connection.execute(
+            f"SELECT nodeid, outcome, reruns FROM results "
+            f"WHERE run_id IN ({', '.join('?' for _ in run_ids)}) ORDER BY run_id",
+            run_ids,
+        )
+        scores = {}
+        previous = {}
+        for nodeid, outcome, reruns in rows:
+            if outcome == "skipped":
+                continue
+            passed = outcome == "passed"
+            entry = scores.setdefault(nodeid, {"runs": 0, "flaky_runs": 0, "failures": 0, "reruns": 0})
+            entry["runs"] += 1
+            entry["failures"] += int(not passed)
+            entry["reruns"] += reruns or 0
+            if (passed and reruns) or (nodeid in previous and previous[nodeid] != passed):
+                entry["flaky_runs"] += 1
+            previous[nodeid] = passed
+        for entry in scores.values():
+            entry["score"] = round(entry["flaky_runs"] / entry["runs"], 3)
+        return scores
+
+    def regressions(self, current, runs=None):
+        """Compare current {nodeid: total_s} against the previous runs, see compare()"""
+        history = self.recent_totals(runs)
+        flagged = [
+            regression for regression in (
+                self.compare(nodeid, total, history.get(nodeid)) for nodeid, total in current.items()
+            ) if regression
+        ]
+        return sorted(flagged, key=lambda r: r["total_s"] - r["baseline_s"], reverse=True)
+
+    @staticmethod
+    def compare(nodeid, total, previous, threshold=None, min_seconds=None):
+        """
+        Flag a test slower than the median of its previous totals.
+
+        It regresses when slower than the baseline by more than threshold
+        (a fraction) and by at least min_seconds. Returns None otherwise.
+        """
+        threshold = config.REGRESSION_THRESHOLD if threshold is None else threshold
+        min_seconds = config.REGRESSION_MIN_SECONDS if min_seconds is None else min_seconds
+        if not previous or total is None:
+            return None
+        baseline = statistics.median(previous)
+        if total > baseline * (1 + threshold) and total - baseline >= min_seconds:
+            return {
+                "nodeid": nodeid,
+                "total_s": round(total, 3),
+                "baseline_s": round(baseline, 3),
+                "ratio": round(total / baseline, 2) if baseline else None,
+                "runs": len(previous),
+            }
+        return None
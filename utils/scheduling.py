@@ -0,0 +1,120 @@
+import json
+import re
+import statistics
+
+
+class TestScheduler:
+    """
+    Orders collected tests by their expected duration from RunHistory.
+
+    Expected duration is the median total of a test's recent passing runs.
+    Tests sharing an xdist_group are scheduled as one unit (pytest-xdist
+    --dist loadgroup keeps them on one worker), weighted by the group's
+    summed duration. Tests with no history count as the longest, so new
+    tests are not left for the end of the run.
+
+    partition() splits the tests into shards for several CI hosts. Every
+    host must pick the same split, so it weighs tests with a shared
+    durations file (see load_durations) rather than the host's own history.
+
+    Durations are keyed by plain nodeids: under --dist loadgroup
+    pytest-xdist appends "@<group>" to grouped tests' nodeids, which
+    plain_nodeid() strips.
+    """
+
+    __test__ = False  # not a pytest test class despite the name
+
+    # "@<group>" at the end of a nodeid, outside any parametrize id
+    GROUP_SUFFIX = re.compile(r"@[^\[\]/:]*$")
+
+    @classmethod
+    def plain_nodeid(cls, nodeid):
+        """nodeid without the "@<group>" suffix pytest-xdist adds under --dist loadgroup"""
+        return cls.GROUP_SUFFIX.sub("", nodeid)
+
+    @classmethod
+    def expected_durations(cls, history):
+        """{nodeid: median total seconds} over the recent runs in history"""
+        # Runs recorded before nodeids were stored plain may still carry the group suffix
+        totals = {}
+        for nodeid, seconds in history.recent_totals().items():
+            totals.setdefault(cls.plain_nodeid(nodeid), []).extend(seconds)
+        return {nodeid: statistics.median(seconds) for nodeid, seconds in totals.items()}
+
+    @staticmethod
+    def group_of(item):
+        marker = item.get_closest_marker("xdist_group")
+        if marker is None:
+            return None
+        return marker.args[0] if marker.args else marker.kwargs.get("name")
+
+    @classmethod
+    def unit_durations(cls, items, durations):
+        """Expected seconds per scheduling unit: (group name or nodeid) -> seconds, None when unknown"""
+        units = {}
+        for item in items:
+            unit = cls.group_of(item) or item.nodeid
+            duration = durations.get(cls.plain_nodeid(item.nodeid))
+            if unit in units and units[unit] is None:
+                continue
+            units[unit] = None if duration is None else (units.get(unit) or 0.0) + duration
+        return units
+
+    @classmethod
+    def order_longest_first(cls, items, durations):
+        """Sort items in place, longest unit first; ties keep collection order"""
+        if not durations:
+            return items
+        units = cls.unit_durations(items, durations)
+        unknown = float("inf")
+
+        def key(item):
+            unit = cls.group_of(item) or item.nodeid
+            seconds = units[unit]
+            return -(unknown if seconds is None else seconds)
+
+        items.sort(key=key)
+        return items
+
+    @staticmethod
+    def load_durations(path):
+        """{nodeid: seconds} from a durations JSON file, {} when it does not exist"""
+        try:
+            with open(path, encoding="utf-8") as file:
+                return {nodeid: float(seconds) for nodeid, seconds in json.load(file).items()}
+        except FileNotFoundError:
+            return {}
+
+    @classmethod
+    def partition(cls, items, count, durations):
+        """
+        Split items into count shards that should take about as long as each other.
+
+        Scheduling units (xdist groups or single tests) are placed longest
+        first on the least loaded shard (LPT). Units without a recorded
+        duration weigh the median of the known ones. Ties are broken by
+        name and shard number, so every host computes the same split.
+        Returns one list of items per shard, in collection order.
+        """
+        weights = {}
+        for item in items:
+            unit = cls.group_of(item) or item.nodeid
+            weights.setdefault(unit, []).append(durations.get(cls.plain_nodeid(item.nodeid)))
+        known = list(durations.values())
+        default = statistics.median(known) if known else 1.0
+        unit_weights = {
+            unit: sum(default if seconds is None else seconds for seconds in values)
+            for unit, values in weights.items()
+        }
+
+        loads = [0.0] * count
+        shard_of = {}
+        for unit in sorted(unit_weights, key=lambda unit: (-unit_weights[unit], unit)):
+            shard = min(range(count), key=lambda index: (loads[index], index))
+            shard_of[unit] = shard
+            loads[shard] += unit_weights[unit]
+
+        shards = [[] for _ in range(count)]
+        for item in items:
+            shards[shard_of[cls.group_of(item) or item.nodeid]].append(item)
+        return shards
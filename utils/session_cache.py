@@ -0,0 +1,83 @@
+from selenium.common.exceptions import WebDriverException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from pages.login_page import LoginPage
+from pages.dashboard_page import DashboardPage
+from utils.app_reset import AppReset
+from config.config import config
+
+
+class SessionCache:
+    """
+    Authenticated session snapshots, one per account and worker process.
+
+    The first login goes through the form; the resulting cookies and
+    localStorage are captured and injected into later sessions instead.
+    When the app rejects a snapshot it falls back to a form login and
+    captures a fresh one.
+    """
+
+    _snapshots = {}
+    _rejections = {}
+
+    @classmethod
+    def login(cls, driver, email, password):
+        """Log in from the cached snapshot, or through the form as a fallback"""
+        snapshot = cls._snapshots.get(email)
+        if snapshot is not None:
+            if cls.restore(driver, snapshot):
+                return True
+            cls._snapshots.pop(email, None)
+            cls._rejections[email] = cls._rejections.get(email, 0) + 1
+
+        LoginPage(driver).login(email, password)
+        if not cls._wait_for_dashboard(driver):
+            return False
+        # Stop snapshotting accounts the app keeps rejecting
+        if cls._rejections.get(email, 0) < config.SESSION_CACHE_MAX_REJECTIONS:
+            cls._snapshots[email] = cls.capture(driver)
+        return True
+
+    @staticmethod
+    def capture(driver):
+        """Capture cookies and localStorage of the current page"""
+        return {
+            "cookies": driver.get_cookies(),
+            "local_storage": driver.execute_script("return Object.assign({}, window.localStorage);"),
+        }
+
+    @classmethod
+    def restore(cls, driver, snapshot):
+        """Inject a snapshot into a session sitting on BASE_URL and reload"""
+        # Without cookies to set, an app with a reset hook can pick the snapshot up without a reload
+        if not snapshot["cookies"] and AppReset.soft_reset(driver, snapshot["local_storage"]):
+            return cls._wait_for_dashboard(driver, allow_login_page=True)
+        try:
+            for cookie in snapshot["cookies"]:
+                driver.add_cookie(cookie)
+            driver.execute_script(
+                "var items = arguments[0];"
+                "Object.keys(items).forEach(function (key) { window.localStorage.setItem(key, items[key]); });",
+                snapshot["local_storage"],
+            )
+            driver.get(config.BASE_URL)
+        except WebDriverException:
+            return False
+        return cls._wait_for_dashboard(driver, allow_login_page=True)
+
+    @classmethod
+    def clear(cls):
+        cls._snapshots.clear()
+        cls._rejections.clear()
+
+    @staticmethod
+    def _wait_for_dashboard(driver, allow_login_page=False):
+        """Wait for the dashboard; with allow_login_page, give up as soon as the login form renders"""
+        dashboard = EC.visibility_of_element_located(DashboardPage.PRODUCT_SEARCH)
+        condition = EC.any_of(dashboard, EC.visibility_of_element_located(LoginPage.EMAIL_INPUT)) \
+            if allow_login_page else dashboard
+        try:
+            WebDriverWait(driver, config.EXPLICIT_WAIT, poll_frequency=config.POLL_INTERVAL).until(condition)
+        except TimeoutException:
+            return False
+        return bool(driver.find_elements(*DashboardPage.PRODUCT_SEARCH))
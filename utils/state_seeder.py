@@ -0,0 +1,137 @@
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from pages.dashboard_page import DashboardPage
+from config.config import config
+
+
+class StateSeeder:
+    """
+    Write a cart or completed transactions straight into the app's localStorage.
+
+    Lets checkout and reports tests start from a known state instead of
+    searching, adding to cart and checking out through the UI. Items are
+    given as (product name, quantity) pairs and priced from the app's own
+    catalog and tax rate (window.__pos), so seeded state renders exactly
+    like state built through the UI. Apps that don't expose window.__pos
+    are left untouched and the seed_* methods return False. The app then
+    re-renders from the new state through its reset hook (window.__posReset),
+    or after a reload when it has none. If the dashboard does not come back,
+    the seeded keys are removed again and the page reloaded before returning
+    False, so a UI fallback starts from the app's own state.
+    """
+
+    SEED_SCRIPT = """
+        var pos = window.__pos, state = arguments[0];
+        if (!pos) return false;
+
+        function line(entry) {
+            var product = pos.products.filter(function (p) { return p.name === entry[0]; })[0];
+            if (!product) throw new Error("Unknown product: " + entry[0]);
+            return { id: product.id, name: product.name, price: product.price, quantity: entry[1] };
+        }
+        function totals(items) {
+            var subtotal = items.reduce(function (sum, item) { return sum + item.price * item.quantity; }, 0);
+            var tax = Math.round(subtotal * pos.taxRate * 100) / 100;
+            return { subtotal: subtotal, tax: tax, total: Math.round((subtotal + tax) * 100) / 100 };
+        }
+
+        if (state.cart) {
+            window.localStorage.setItem(pos.storage.cart, JSON.stringify(state.cart.map(line)));
+        }
+        if (state.transactions) {
+            var transactions = state.transactions.map(function (transaction, index) {
+                var items = transaction.items.map(line);
+                var sums = totals(items);
+                return {
+                    id: index + 1,
+                    items: items,
+                    subtotal: sums.subtotal,
+                    tax: sums.tax,
+                    total: sums.total,
+                    payment_method: transaction.payment_method || "Card",
+                    customer_name: transaction.customer_name || "",
+                    customer_email: transaction.customer_email || "",
+                    notes: transaction.notes || "",
+                    created_at: new Date().toISOString()
+                };
+            });
+            window.localStorage.setItem(pos.storage.transactions, JSON.stringify(transactions));
+        }
+        if (typeof window.__posReset === "function") {
+            window.__posReset(Object.assign({}, window.localStorage));
+            return "rendered";
+        }
+        return "reload";
+    """
+
+    UNSEED_SCRIPT = """
+        var pos = window.__pos;
+        if (!pos) return false;
+        arguments[0].forEach(function (kind) { window.localStorage.removeItem(pos.storage[kind]); });
+        return true;
+    """
+
+    @staticmethod
+    def enabled():
+        return config.SEED_STATE
+
+    @classmethod
+    def seed_cart(cls, driver, items):
+        """Replace the cart with items, e.g. [("Wireless Headphones", 1)]"""
+        return cls.seed(driver, cart=items)
+
+    @classmethod
+    def seed_transactions(cls, driver, transactions):
+        """
+        Replace the completed transactions.
+
+        Each transaction is a dict with "items" ((product name, quantity)
+        pairs) and optional customer_name, customer_email, payment_method
+        and notes.
+        """
+        return cls.seed(driver, transactions=transactions)
+
+    @classmethod
+    def seed(cls, driver, cart=None, transactions=None):
+        """Write the given state in one script call and let the app render it"""
+        if not cls.enabled():
+            return False
+        state = {}
+        if cart is not None:
+            state["cart"] = [list(item) for item in cart]
+        if transactions is not None:
+            state["transactions"] = [
+                dict(transaction, items=[list(item) for item in transaction["items"]])
+                for transaction in transactions
+            ]
+        result = driver.execute_script(cls.SEED_SCRIPT, state)
+        if not result:
+            return False
+        if result == "reload":
+            driver.refresh()
+        if cls._wait_for_dashboard(driver):
+            return True
+        cls._unseed(driver, list(state))
+        return False
+
+    @classmethod
+    def _unseed(cls, driver, kinds):
+        # Only drop what seed() wrote; the login and the rest of storage stay
+        try:
+            driver.execute_script(cls.UNSEED_SCRIPT, kinds)
+        except WebDriverException:
+            # e.g. the page is stuck mid-render; remove the keys from a fresh load of the app
+            driver.get(config.BASE_URL)
+            driver.execute_script(cls.UNSEED_SCRIPT, kinds)
+        driver.refresh()
+
+    @staticmethod
+    def _wait_for_dashboard(driver):
+        try:
+            WebDriverWait(driver, config.EXPLICIT_WAIT, poll_frequency=config.POLL_INTERVAL).until(
+                EC.visibility_of_element_located(DashboardPage.PRODUCT_SEARCH)
+            )
+            return True
+        except TimeoutException:
+            return False
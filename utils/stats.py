@@ -0,0 +1,28 @@
+import math
+
+
+class LatencyStats:
+    """Percentile summaries of latency samples (seconds in, milliseconds out)"""
+
+    PERCENTILES = (50, 90, 95, 99)
+
+    @staticmethod
+    def percentile(values, percent):
+        """Linearly interpolated percentile of values (0-100), None when there are none"""
+        if not values:
+            return None
+        ordered = sorted(values)
+        rank = (len(ordered) - 1) * percent / 100
+        low, high = math.floor(rank), math.ceil(rank)
+        return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+    @classmethod
+    def summarize(cls, seconds):
+        """count, mean, p50/p90/p95/p99 and max of a list of durations, in milliseconds"""
+        if not seconds:
+            return {"count": 0}
+        summary = {"count": len(seconds), "mean_ms": round(sum(seconds) / len(seconds) * 1000, 3)}
+        for percent in cls.PERCENTILES:
+            summary[f"p{percent}_ms"] = round(cls.percentile(seconds, percent) * 1000, 3)
+        summary["max_ms"] = round(max(seconds) * 1000, 3)
+        return summary
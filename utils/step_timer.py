@@ -0,0 +1,146 @@
+import csv
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from config.config import config
+from utils.impact_map import ImpactRecorder
+
+
+class StepTimer:
+    """
+    Opt-in recorder for BasePage calls (POS_STEP_TIMING=true).
+
+    Every decorated call records its duration, locator, outcome and the
+    page-object method that issued it, grouped by the running test. Calls
+    made from inside another recorded call (e.g. find_element inside
+    send_keys_to_element) are kept with depth > 0 so totals are not
+    double counted.
+    """
+
+    enabled = config.STEP_TIMING
+    _current_test = None
+    _tests = {}
+    _local = threading.local()
+
+    @classmethod
+    def start_test(cls, nodeid):
+        cls._current_test = nodeid
+        cls._tests.setdefault(nodeid, [])
+
+    @classmethod
+    def record(cls, method, locator, duration, outcome, caller, depth):
+        cls._tests.setdefault(cls._current_test or "<no test>", []).append({
+            "method": method,
+            "locator": cls.format_locator(locator),
+            "duration_ms": round(duration * 1000, 3),
+            "outcome": outcome,
+            "caller": caller,
+            "depth": depth,
+        })
+
+    @classmethod
+    def steps(cls, nodeid):
+        return cls._tests.get(nodeid, [])
+
+    @classmethod
+    def reset(cls):
+        cls._tests = {}
+        cls._current_test = None
+
+    @staticmethod
+    def format_locator(locator):
+        if isinstance(locator, tuple) and len(locator) == 2:
+            return f"{locator[0]}={locator[1]}"
+        return None
+
+    @staticmethod
+    def caller_name(base_file):
+        """Name the page-object method (or test) that triggered the current BasePage call"""
+        frame = sys._getframe(1)
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename not in (base_file, __file__):
+                owner = frame.f_locals.get("self")
+                if owner is not None:
+                    return f"{type(owner).__name__}.{code.co_name}"
+                return code.co_name
+            frame = frame.f_back
+        return None
+
+    @classmethod
+    def slowest_locators(cls, limit=None):
+        """Aggregate top-level calls per locator, slowest total first"""
+        totals = {}
+        for steps in cls._tests.values():
+            for step in steps:
+                if step["depth"] or not step["locator"]:
+                    continue
+                entry = totals.setdefault(step["locator"], {"locator": step["locator"], "calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+                entry["calls"] += 1
+                entry["total_ms"] += step["duration_ms"]
+                entry["max_ms"] = max(entry["max_ms"], step["duration_ms"])
+        ranked = sorted(totals.values(), key=lambda e: e["total_ms"], reverse=True)
+        for entry in ranked:
+            entry["total_ms"] = round(entry["total_ms"], 3)
+            entry["mean_ms"] = round(entry["total_ms"] / entry["calls"], 3)
+        return ranked[:limit or config.SLOWEST_LOCATORS]
+
+    @classmethod
+    def write_profile(cls, directory, suffix=""):
+        """Write timing_profile{suffix}.json and .csv; return the JSON path, or None if nothing was recorded"""
+        if not any(cls._tests.values()):
+            return None
+        os.makedirs(directory, exist_ok=True)
+        json_path = os.path.join(directory, f"timing_profile{suffix}.json")
+        csv_path = os.path.join(directory, f"timing_profile{suffix}.csv")
+
+        tests = {
+            nodeid: {
+                "total_ms": round(sum(s["duration_ms"] for s in steps if not s["depth"]), 3),
+                "steps": steps,
+            }
+            for nodeid, steps in cls._tests.items()
+        }
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump({"tests": tests, "slowest_locators": cls.slowest_locators()}, file, indent=2)
+
+        with open(csv_path, "w", encoding="utf-8", newline="") as file:
+            fields = ["test", "caller", "method", "locator", "depth", "duration_ms", "outcome"]
+            writer = csv.DictWriter(file, fieldnames=fields)
+            writer.writeheader()
+            for nodeid, steps in cls._tests.items():
+                for step in steps:
+                    writer.writerow(dict(step, test=nodeid))
+        return json_path
+
+
+def timed_step(method):
+    """Record a BasePage method call in StepTimer when timing is enabled (and in ImpactRecorder)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if ImpactRecorder.enabled:
+            ImpactRecorder.record_page(self, args, kwargs)
+        if not StepTimer.enabled:
+            return method(self, *args, **kwargs)
+
+        locator = args[0] if args and isinstance(args[0], tuple) else None
+        caller = StepTimer.caller_name(method.__code__.co_filename)
+        depth = getattr(StepTimer._local, "depth", 0)
+        StepTimer._local.depth = depth + 1
+        outcome = "ok"
+        start = time.perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+            if result is False:
+                outcome = "false"
+            return result
+        except Exception as error:
+            outcome = type(error).__name__
+            raise
+        finally:
+            StepTimer._local.depth = depth
+            StepTimer.record(method.__name__, locator, time.perf_counter() - start, outcome, caller, depth)
+    return wrapper
@@ -0,0 +1,84 @@
+import threading
+import time
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class TimeBreakdown:
+    """
+    Splits test time into explicit waits, sleeps and browser commands.
+
+    install() wraps WebDriverWait.until/until_not, time.sleep and
+    WebDriver.execute. Sleeps and commands issued while polling inside a
+    wait are counted as wait time, so the three buckets never overlap.
+    Totals are kept per thread, so background threads (artifact writers,
+    load-test users) never add to the running test's figures.
+    """
+
+    KINDS = ("wait", "sleep", "command")
+
+    _installed = False
+    _originals = {}
+    _local = threading.local()
+
+    @classmethod
+    def install(cls):
+        if cls._installed:
+            return
+        cls._originals = {
+            "until": WebDriverWait.until,
+            "until_not": WebDriverWait.until_not,
+            "sleep": time.sleep,
+            "execute": WebDriver.execute,
+        }
+        WebDriverWait.until = cls._wrap("wait", cls._originals["until"])
+        WebDriverWait.until_not = cls._wrap("wait", cls._originals["until_not"])
+        time.sleep = cls._wrap("sleep", cls._originals["sleep"])
+        WebDriver.execute = cls._wrap("command", cls._originals["execute"])
+        cls._installed = True
+
+    @classmethod
+    def uninstall(cls):
+        if not cls._installed:
+            return
+        WebDriverWait.until = cls._originals["until"]
+        WebDriverWait.until_not = cls._originals["until_not"]
+        time.sleep = cls._originals["sleep"]
+        WebDriver.execute = cls._originals["execute"]
+        cls._installed = False
+
+    @classmethod
+    def reset(cls):
+        cls._local.totals = dict.fromkeys(cls.KINDS, 0.0)
+
+    @classmethod
+    def _totals(cls):
+        totals = getattr(cls._local, "totals", None)
+        if totals is None:
+            totals = cls._local.totals = dict.fromkeys(cls.KINDS, 0.0)
+        return totals
+
+    @classmethod
+    def take(cls):
+        """Return seconds this thread spent per kind since the last take/reset, then reset"""
+        totals = {kind: round(seconds, 4) for kind, seconds in cls._totals().items()}
+        cls.reset()
+        return totals
+
+    @classmethod
+    def _wrap(cls, kind, func):
+        def wrapper(*args, **kwargs):
+            # Anything that happens inside an explicit wait is wait time
+            if getattr(cls._local, "in_wait", False):
+                return func(*args, **kwargs)
+            if kind == "wait":
+                cls._local.in_wait = True
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                cls._totals()[kind] += time.perf_counter() - start
+                if kind == "wait":
+                    cls._local.in_wait = False
+        wrapper.__wrapped__ = func
+        return wrapper
@@ -0,0 +1,139 @@
+from datetime import datetime
+from html import escape
+from utils.time_breakdown import TimeBreakdown
+from utils.run_history import RunHistory
+from utils.scheduling import TestScheduler
+
+
+class TimingReport:
+    """
+    Per-test timing collected from pytest reports on the controller process.
+
+    Holds setup/call/teardown durations plus, with breakdown on, the
+    wait/sleep/command split attached to each report, flags tests that are slower than
+    their baseline from previous runs, stores the run in RunHistory at
+    session end and renders the timing columns and summary of the HTML
+    report.
+    """
+
+    PHASES = ("setup", "call", "teardown")
+    COLUMNS = (
+        ("setup_s", "Setup"),
+        ("call_s", "Call"),
+        ("teardown_s", "Teardown"),
+        ("wait_s", "Waits"),
+        ("sleep_s", "Sleeps"),
+        ("command_s", "Commands"),
+    )
+
+    def __init__(self, baselines=None, breakdown=False):
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        # nodeid -> total durations of the test in previous runs
+        self.baselines = baselines or {}
+        # Without the breakdown only the phase columns are shown
+        self.columns = self.COLUMNS if breakdown else self.COLUMNS[:len(self.PHASES)]
+        self.tests = {}
+        self.regressions = []
+        # Seconds taken by each browser session start (a test that leased a fresh session)
+        self.startups = []
+        # nodeid -> front-end metrics captured by the perf_metrics fixture
+        self.perf = {}
+
+    def add_report(self, report):
+        # Keyed by plain nodeid, so history lines up with and without --dist loadgroup
+        nodeid = TestScheduler.plain_nodeid(report.nodeid)
+        entry = self.tests.setdefault(nodeid, self._empty_entry())
+        if report.outcome == "rerun":
+            # A transient failure that is retried; the test's timings come from its last attempt
+            entry["reruns"] += 1
+            return
+        entry[f"{report.when}_s"] = round(report.duration, 4)
+        breakdown = dict(report.user_properties).get("time_breakdown") or {}
+        for kind in TimeBreakdown.KINDS:
+            entry[f"{kind}_s"] = round(entry[f"{kind}_s"] + breakdown.get(kind, 0.0), 4)
+        entry["total_s"] = round(sum(entry[f"{phase}_s"] for phase in self.PHASES), 4)
+        if report.when == "setup":
+            startup = dict(report.user_properties).get("browser_startup")
+            if startup is not None:
+                self.startups.append(startup)
+
+        if report.when == "teardown":
+            metrics = dict(report.user_properties).get("perf_metrics")
+            if metrics:
+                self.perf[nodeid] = metrics
+
+        if report.failed:
+            entry["outcome"] = "failed" if report.when == "call" else "error"
+        elif report.skipped and entry["outcome"] == "passed":
+            entry["outcome"] = "xfailed" if hasattr(report, "wasxfail") else "skipped"
+
+        # Teardown is the last phase, so the test's total is final here
+        if report.when == "teardown" and entry["outcome"] == "passed":
+            regression = RunHistory.compare(nodeid, entry["total_s"], self.baselines.get(nodeid))
+            if regression:
+                self.regressions.append(regression)
+
+    def finish(self, history):
+        """Store this run in the history"""
+        finished_at = datetime.now().isoformat(timespec="seconds")
+        history.record_run(self.started_at, finished_at, self.tests)
+
+    def totals(self):
+        return {
+            key: round(sum(t[key] for t in self.tests.values()), 3)
+            for key, _ in self.columns
+        }
+
+    def regression_for(self, nodeid):
+        nodeid = TestScheduler.plain_nodeid(nodeid)
+        for regression in self.regressions:
+            if regression["nodeid"] == nodeid:
+                return regression
+        return None
+
+    # pytest-html rendering
+    def header_cells(self):
+        cells = [
+            f'<th class="sortable" data-column-type="{key}">{label} (s)</th>'
+            for key, label in self.columns
+        ]
+        cells.append('<th class="sortable" data-column-type="trend">Trend</th>')
+        return cells
+
+    def row_cells(self, nodeid):
+        entry = self.tests.get(TestScheduler.plain_nodeid(nodeid)) or self._empty_entry()
+        cells = [f'<td class="col-{key}">{entry[key]:.2f}</td>' for key, _ in self.columns]
+        regression = self.regression_for(nodeid)
+        trend = f"slower: {regression['total_s']:.2f}s vs {regression['baseline_s']:.2f}s" if regression else ""
+        cells.append(f'<td class="col-trend">{trend}</td>')
+        return cells
+
+    def summary_html(self):
+        totals = self.totals()
+        if "wait_s" in totals:
+            line = ("Explicit waits: {wait_s:.1f}s, sleeps: {sleep_s:.1f}s, browser commands: {command_s:.1f}s "
+                    "(setup {setup_s:.1f}s, call {call_s:.1f}s, teardown {teardown_s:.1f}s)")
+        else:
+            line = "Setup {setup_s:.1f}s, call {call_s:.1f}s, teardown {teardown_s:.1f}s"
+        parts = ["<h3>Timing</h3>", f"<p>{line.format(**totals)}</p>"]
+        if self.startups:
+            parts.append(
+                f"<p>Browser startup: {len(self.startups)} session(s), "
+                f"mean {sum(self.startups) / len(self.startups):.2f}s, max {max(self.startups):.2f}s</p>"
+            )
+        if self.regressions:
+            parts.append(f"<p><strong>{len(self.regressions)} test(s) slower than their recent median:</strong></p><ul>")
+            for regression in self.regressions:
+                parts.append(
+                    f"<li>{escape(regression['nodeid'])}: {regression['total_s']:.2f}s "
+                    f"vs {regression['baseline_s']:.2f}s over {regression['runs']} run(s)</li>"
+                )
+            parts.append("</ul>")
+        return "".join(parts)
+
+    @staticmethod
+    def _empty_entry():
+        entry = {"outcome": "passed", "total_s": 0.0, "reruns": 0}
+        for key, _ in TimingReport.COLUMNS:
+            entry[key] = 0.0
+        return entry